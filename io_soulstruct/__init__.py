@@ -23,6 +23,12 @@ addon_modules_path_scipy = str((Path(__file__).parent / "../io_soulstruct_lib_31
 if addon_modules_path_scipy not in sys.path:
     sys.path.append(addon_modules_path_scipy)
 
+# Add `bpy`-free worker module directory to Python path. Spawned `multiprocessing` workers inherit this path and can
+# import these modules by name, whereas they cannot import this package (no `bpy` outside Blender's main process).
+addon_workers_path = str((Path(__file__).parent / "workers").resolve())
+if addon_workers_path not in sys.path:
+    sys.path.append(addon_workers_path)
+
 
 def try_reload(_module_name: str):
     try:
@@ -42,6 +48,7 @@ for module_name in list(sys.modules.keys()):
         try_reload(module_name)
 
 from io_soulstruct.general import *
+from io_soulstruct.general.cached import clear_session_texture_cache
 from io_soulstruct.misc_operators import *
 
 from io_soulstruct.animation import *
@@ -49,6 +56,7 @@ from io_soulstruct.collision import *
 from io_soulstruct.cutscene import *
 from io_soulstruct.flver import *
 from io_soulstruct.msb import *
+from io_soulstruct.msb.export_cache import clear_msb_export_caches, msb_export_depsgraph_handler
 from io_soulstruct.nav_graph import *
 from io_soulstruct.navmesh import *
 from io_soulstruct.types import SoulstructType
@@ -106,6 +114,7 @@ CLASSES = (
     SelectCustomMTDBNDFile,
     SelectCustomMATBINBNDFile,
     LoadCollectionsFromBlend,
+    ClearTextureCaches,
     # endregion
 
     # region Misc. Operators
@@ -165,6 +174,7 @@ CLASSES = (
 
     DDSTextureProps,
     ImportTextures,
+    IndexGameTextures,
     BakeLightmapSettings,
     BakeLightmapTextures,
     TextureExportSettings,
@@ -309,6 +319,7 @@ CLASSES = (
     # region MSB
     GlobalSettingsPanel_MSBView,
     ImportMapMSB,
+    UpdateMapMSB,
     ImportAnyMSB,
     ExportMapMSB,
 
@@ -488,12 +499,21 @@ IMAGE_ATTRIBUTES = []
 EDIT_BONE_ATTRIBUTES = []
 
 LOAD_POST_HANDLERS = []
+UNDO_POST_HANDLERS = []
+DEPSGRAPH_UPDATE_POST_HANDLERS = []
 SPACE_VIEW_3D_HANDLERS = []
 
 
 @bpy.app.handlers.persistent
 def load_handler(_):
     SoulstructSettings.from_context().load_settings()
+    clear_session_texture_cache()  # sources are not shared across Blend files
+    clear_msb_export_caches()  # objects are not shared across Blend files
+
+
+@bpy.app.handlers.persistent
+def undo_handler(*_):
+    clear_msb_export_caches()  # undo/redo can restore any object state
 
 
 def register():
@@ -558,6 +578,13 @@ def register():
     bpy.app.handlers.load_post.append(load_handler)
     LOAD_POST_HANDLERS.append(load_handler)
 
+    bpy.app.handlers.undo_post.append(undo_handler)
+    bpy.app.handlers.redo_post.append(undo_handler)
+    UNDO_POST_HANDLERS.append(undo_handler)
+
+    bpy.app.handlers.depsgraph_update_post.append(msb_export_depsgraph_handler)
+    DEPSGRAPH_UPDATE_POST_HANDLERS.append(msb_export_depsgraph_handler)
+
     SPACE_VIEW_3D_HANDLERS.append(
         bpy.types.SpaceView3D.draw_handler_add(draw_dummy_ids, (), "WINDOW", "POST_PIXEL")
     )
@@ -616,6 +643,15 @@ def unregister():
         bpy.app.handlers.load_post.remove(handler)
     LOAD_POST_HANDLERS.clear()
 
+    for handler in UNDO_POST_HANDLERS:
+        bpy.app.handlers.undo_post.remove(handler)
+        bpy.app.handlers.redo_post.remove(handler)
+    UNDO_POST_HANDLERS.clear()
+
+    for handler in DEPSGRAPH_UPDATE_POST_HANDLERS:
+        bpy.app.handlers.depsgraph_update_post.remove(handler)
+    DEPSGRAPH_UPDATE_POST_HANDLERS.clear()
+
     for handler in SPACE_VIEW_3D_HANDLERS:
         bpy.types.SpaceView3D.draw_handler_remove(handler, "WINDOW")
     SPACE_VIEW_3D_HANDLERS.clear()
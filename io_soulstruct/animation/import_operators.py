@@ -13,6 +13,7 @@ import re
 import time
 import traceback
 import typing as tp
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
 from pathlib import Path
 
 import bpy
@@ -23,6 +24,7 @@ from io_soulstruct.utilities import *
 from soulstruct.containers import Binder, BinderEntry, EntryNotFoundError
 from soulstruct.eldenring.containers import DivBinder
 from soulstruct_havok.core import HKX
+from io_soulstruct_workers import init_animation_worker, read_transform_frames
 from .types import SoulstructAnimation
 from .utilities import *
 
@@ -34,6 +36,19 @@ GEOMBND_RE = re.compile(r"^.*?\.geombnd(\.dcx)?$")
 SKELETON_ENTRY_RE = re.compile(r"skeleton\.hkx(\.dcx)?", flags=re.IGNORECASE)
 
 
+class QueuedAnimationEntry(tp.NamedTuple):
+    """Animation HKX Binder entry queued for bulk reading and conversion by `import_all_entries()`."""
+    entry: BinderEntry
+    compendium: HKX | None
+
+    @property
+    def animation_name(self) -> str:
+        return self.entry.name.split(".")[0]
+
+
+QUEUE_ITEM_TYPING = tuple[Path, SKELETON_TYPING, tp.Union[ANIMATION_TYPING, list[BinderEntry], QueuedAnimationEntry]]
+
+
 class BaseImportHKXAnimation(LoggingOperator):
 
     import_all_animations: bool
@@ -66,24 +81,19 @@ class BaseImportHKXAnimation(LoggingOperator):
         file_path: Path,
         skeleton_hkx: SKELETON_TYPING,
         compendium: HKX = None,
-    ) -> list[tuple[Path, SKELETON_TYPING, ANIMATION_TYPING | list[BinderEntry]]]:
+    ) -> list[QUEUE_ITEM_TYPING]:
         """Scan all given `anim_hkx_entries` and parse them as Binders or individual animation HKX files.
 
+        If importing all animations, entries are queued unread, to be read and converted in bulk by
+        `import_all_entries()`.
+
         Note that `file_path` is attached to each queue element for source information only.
         """
         if len(anim_hkx_entries) > 1:
             if self.import_all_animations:
-                # Read and queue up HKX animations for separate import.
-                hkxs_with_paths = []
-                for entry in anim_hkx_entries:
-                    try:
-                        animation_hkx = read_animation_hkx_entry(entry, compendium)
-                    except Exception as ex:
-                        self.warning(f"Error occurred while reading HKX Binder entry '{entry.name}': {ex}")
-                    else:
-                        hkxs_with_paths.append((file_path, skeleton_hkx, animation_hkx))
-                        print(animation_hkx, animation_hkx.path)
-                return hkxs_with_paths
+                return [
+                    (file_path, skeleton_hkx, QueuedAnimationEntry(entry, compendium)) for entry in anim_hkx_entries
+                ]
 
             # Queue up all Binder entries; user will be prompted to choose entry later.
             return [(file_path, skeleton_hkx, anim_hkx_entries)]
@@ -110,12 +120,16 @@ class BaseImportHKXAnimation(LoggingOperator):
     def import_all_entries(
         self,
         context: bpy.types.Context,
-        hkxs_with_paths: list[tuple[Path, SKELETON_TYPING, ANIMATION_TYPING | list[BinderEntry]]],
+        hkxs_with_paths: list[QUEUE_ITEM_TYPING],
         compendium: HKX | None,
         bl_flver: BlenderFLVER,
     ) -> list[SoulstructAnimation]:
         animations = []
+        queued_entries = []  # type: list[tuple[SKELETON_TYPING, QueuedAnimationEntry]]
         for file_path, skeleton_hkx, hkx_or_entries in hkxs_with_paths:
+            if isinstance(hkx_or_entries, QueuedAnimationEntry):
+                queued_entries.append((skeleton_hkx, hkx_or_entries))
+                continue
             if isinstance(hkx_or_entries, list):
                 # Defer through entry selection operator.
                 ImportHKXAnimationWithBinderChoice.run(
@@ -143,6 +157,89 @@ class BaseImportHKXAnimation(LoggingOperator):
                     f"Error occurred while importing HKX animation '{anim_name}' for FLVER {bl_flver.name}: {ex}"
                 )
 
+        if queued_entries:
+            animations += self.import_queued_entries(context, queued_entries, bl_flver)
+
+        return animations
+
+    def import_queued_entries(
+        self,
+        context: bpy.types.Context,
+        queued_entries: list[tuple[SKELETON_TYPING, QueuedAnimationEntry]],
+        bl_flver: BlenderFLVER,
+    ) -> list[SoulstructAnimation]:
+        """Read, decompress, and convert all queued animation entries (spline -> interleaved -> armature-space frames)
+        in worker processes, and create each Blender Action on the main thread as soon as its frames are ready.
+
+        Most of this conversion is pure Python, so it is done by `io_soulstruct_workers.read_transform_frames()` in a
+        process pool rather than threads. Each worker process receives the skeleton and compendium HKX once, so entries
+        are converted in one pool per skeleton/compendium pair (usually just one).
+
+        At most `bulk_import_chunk_size` converted animations are pending at once, to cap memory use.
+        """
+        armature = bl_flver.armature
+        bl_bone_names = {b.name for b in armature.data.bones}
+        chunk_size = context.scene.animation_import_settings.bulk_import_chunk_size
+        window_manager = context.window_manager
+
+        entry_groups = {}  # type: dict[tuple[int, int], tuple[SKELETON_TYPING, HKX | None, list[QueuedAnimationEntry]]]
+        for skeleton_hkx, queued in queued_entries:
+            key = (id(skeleton_hkx), id(queued.compendium))
+            entry_groups.setdefault(key, (skeleton_hkx, queued.compendium, []))[2].append(queued)
+
+        animations = []
+        total_count = len(queued_entries)
+        done_count = 0
+
+        p = time.perf_counter()
+        window_manager.progress_begin(0, total_count)
+        try:
+            for skeleton_hkx, compendium, group_entries in entry_groups.values():
+                queue_iter = iter(group_entries)
+                pending = {}  # type: dict[Future, QueuedAnimationEntry]
+                with ProcessPoolExecutor(
+                    initializer=init_animation_worker, initargs=(skeleton_hkx, compendium)
+                ) as executor:
+
+                    def submit_next():
+                        for _queued in queue_iter:
+                            pending[executor.submit(read_transform_frames, _queued.entry, bl_bone_names)] = _queued
+                            if len(pending) >= chunk_size:
+                                break
+
+                    submit_next()
+                    while pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            queued = pending.pop(future)
+                            anim_name = queued.animation_name
+                            try:
+                                arma_frames, root_motion = future.result()
+                                bl_animation = SoulstructAnimation.new_from_transform_frames(
+                                    context,
+                                    action_name=f"{bl_flver.export_name}|{anim_name}",
+                                    armature=armature,
+                                    arma_frames=arma_frames,
+                                    root_motion=root_motion,
+                                )
+                            except Exception as ex:
+                                # We don't error out here, because we want to continue importing other files.
+                                self.error(
+                                    f"Error occurred while importing HKX animation '{anim_name}' for FLVER "
+                                    f"{bl_flver.name}: {ex}"
+                                )
+                            else:
+                                animations.append(bl_animation)
+                            done_count += 1
+                            window_manager.progress_update(done_count)
+                        submit_next()
+        finally:
+            window_manager.progress_end()
+
+        self.info(
+            f"Imported {len(animations)} of {total_count} HKX animations for FLVER {bl_flver.name} in "
+            f"{time.perf_counter() - p:.3f} seconds."
+        )
         return animations
 
     @staticmethod
@@ -194,7 +291,7 @@ class ImportHKXAnimation(BaseImportHKXAnimation, ImportHelper):
         bl_flver = BlenderFLVER.from_armature_or_mesh(context.active_object)
 
         file_paths = [Path(self.directory, file.name) for file in self.files]
-        hkxs_with_paths = []  # type: list[tuple[Path, SKELETON_TYPING, ANIMATION_TYPING | list[BinderEntry]]]
+        hkxs_with_paths = []  # type: list[QUEUE_ITEM_TYPING]
         compendium = None
 
         for file_path in file_paths:
@@ -16,6 +16,14 @@ class AnimationImportSettings(bpy.types.PropertyGroup):
         default=True,
     )
 
+    bulk_import_chunk_size: bpy.props.IntProperty(
+        name="Bulk Import Chunk Size",
+        description="Maximum number of animations read and converted ahead of Blender Action creation when importing "
+                    "all animations. Lower values use less memory",
+        default=8,
+        min=1,
+    )
+
 
 class AnimationExportSettings(bpy.types.PropertyGroup):
 
@@ -31,3 +39,11 @@ class AnimationExportSettings(bpy.types.PropertyGroup):
                     "first to last keyframe times will be exported",
         default=False,
     )
+
+    evaluate_fcurves_directly: bpy.props.BoolProperty(
+        name="Evaluate FCurves Directly",
+        description="Sample the Action's FCurves and compose bone matrices without changing the scene frame, which "
+                    "is much faster for long animations. Falls back to evaluating the scene on every frame if the "
+                    "Armature has constraints, drivers, NLA tracks, or non-default bone inheritance",
+        default=True,
+    )
@@ -1,21 +1,26 @@
 from __future__ import annotations
 
+import logging
 import time
 import traceback
 
 import numpy as np
 
 import bpy
-from mathutils import Matrix, Quaternion as BlenderQuaternion
+from mathutils import Matrix
 
+from soulstruct.utilities.maths import Vector3
 from soulstruct_havok.fromsoft.base import BaseSkeletonHKX, BaseAnimationHKX
-from soulstruct_havok.utilities.maths import TRSTransform
+from soulstruct_havok.utilities.maths import TRSTransform, Quaternion as GameQuaternion
+from io_soulstruct_workers import get_transform_frames
 
 from io_soulstruct.exceptions import *
 from io_soulstruct.flver.models import BlenderFLVER
 from io_soulstruct.utilities import *
 from .utilities import *
 
+_LOGGER = logging.getLogger(__name__)
+
 
 class SoulstructAnimation:
 
@@ -91,29 +96,13 @@ class SoulstructAnimation:
 
         operator.info(f"Importing HKX animation for {armature.name}: '{name}'")
 
-        # We cannot rely on track annotations for bone names in later games (e.g. Elden Ring).
-        # Here, we just check that all animated bones are present in Blender Armature.
-        hk_bone_names = [b.name for b in skeleton_hkx.skeleton.bones]
-        track_bone_indices = animation_hkx.animation_container.animation_binding.transformTrackToBoneIndices
-        track_bone_names = [hk_bone_names[i] for i in track_bone_indices]
-
-        bl_bone_names = [b.name for b in armature.data.bones]
-        for bone_name in track_bone_names:
-            if bone_name not in bl_bone_names:
-                if bone_name == "TwistRoot":
-                    raise AnimationImportError(
-                        f"Animated bone name '{bone_name}' is missing from Armature. This problem is known for this "
-                        f"specific bone, which is absent from the FLVER, but has not yet been resolved in Soulstruct."
-                    )
-                raise AnimationImportError(f"Animated bone name '{bone_name}' is missing from Armature.")
-
         p = time.perf_counter()
-        animation_hkx.animation_container.spline_to_interleaved()
-        operator.info(f"Converted spline animation to interleaved in {time.perf_counter() - p:.4f} seconds.")
-
-        p = time.perf_counter()
-        arma_frames = get_armature_frames(animation_hkx, skeleton_hkx)
-        root_motion = get_root_motion(animation_hkx)
+        try:
+            arma_frames, root_motion = get_transform_frames(
+                animation_hkx, skeleton_hkx, {b.name for b in armature.data.bones}
+            )
+        except ValueError as ex:
+            raise AnimationImportError(str(ex))
         operator.info(f"Constructed armature animation frames in {time.perf_counter() - p:.4f} seconds.")
 
         # Import single animation HKX.
@@ -213,7 +202,8 @@ class SoulstructAnimation:
         frame_count = 0
         for arma_frames in arma_cuts:
             frame_count += len(arma_frames)
-            cut_end_frame_indices.append(float(frame_count - 1))  # e.g. if first cut is 10 frames, frame index 9 added
+            # e.g. if first cut is 10 frames, frame index 9 added (scaled to match keyframes)
+            cut_end_frame_indices.append(float(frame_count - 1) * bone_frame_scaling)
 
         try:
             armature.animation_data_create()
@@ -221,9 +211,9 @@ class SoulstructAnimation:
             arma_local_inv_matrices = cls.get_armature_local_inv_matrices(armature)  # used by every frame
 
             # We concatenate all bone basis samples for each cut.
-            bone_basis_samples = {
+            cut_bone_basis_sample_lists = {
                 bone.name: [] for bone in armature.data.bones if bone.name != ignore_master_bone_name
-            }
+            }  # type: dict[str, list[np.ndarray]]
             for arma_cut_frames in arma_cuts:
                 cut_bone_basis_samples = cls.get_bone_basis_samples(
                     armature, arma_cut_frames, arma_local_inv_matrices
@@ -231,9 +221,12 @@ class SoulstructAnimation:
                 for bone_name, basis_samples in cut_bone_basis_samples.items():
                     if bone_name == ignore_master_bone_name:
                         continue  # not animated by cutscenes
-                    bone_basis_samples[bone_name].extend(basis_samples)
-                # Record final frame index, so we can set constant interpolation there across camera cuts. Note that
-                # this is necessary for ALL parts, not just the camera -- many cuts disguise time jumps!
+                    cut_bone_basis_sample_lists[bone_name].append(basis_samples)
+            bone_basis_samples = {
+                bone_name: np.concatenate(sample_list, axis=1)
+                for bone_name, sample_list in cut_bone_basis_sample_lists.items()
+                if sample_list
+            }
 
             cls.add_keyframes_batch(
                 action,
@@ -248,11 +241,9 @@ class SoulstructAnimation:
             armature.location = original_location  # reset location (i.e. erase last root motion)
             raise
 
-        # Set constant interpolation at the ends of cuts.
-        for fcurve in action.fcurves:
-            for keyframe in fcurve.keyframe_points:
-                if keyframe.co.x in cut_end_frame_indices:
-                    keyframe.interpolation = "CONSTANT"
+        # Set constant interpolation at the ends of cuts, so we don't interpolate across camera cuts. Note that this
+        # is necessary for ALL parts, not just the camera -- many cuts disguise time jumps!
+        set_constant_interpolation_at_frames(action.fcurves, cut_end_frame_indices)
 
         # Ensure action is not deleted when not in use.
         action.use_fake_user = True
@@ -277,70 +268,61 @@ class SoulstructAnimation:
         armature: bpy.types.ArmatureObject,
         arma_frames: list[dict[str, TRSTransform]],
         arma_local_inv_matrices: dict[str, Matrix],
-    ) -> dict[str, list[list[float]]]:
+    ) -> dict[str, np.ndarray]:
         """Convert a list of armature-space frames (mapping bone names to transforms in that frame) to an outer
-        dictionary that maps bone names to a list of frames that are each defined by ten floats (location XYZ, rotation
-        quaternion WXYZ, scale XYZ) in basis space.
-        """
-        # Convert armature-space frame data to Blender `(location, rotation_quaternion, scale)` tuples.
-        # Note that we decompose the basis matrices so that quaternion discontinuities are handled properly.
-        last_frame_rotations = {}  # type: dict[str, BlenderQuaternion]
+        dictionary that maps bone names to `(10, frame_count)` arrays of basis-space samples (location XYZ, rotation
+        quaternion WXYZ, scale XYZ).
 
+        All frames and bones are processed at once as `(F, B, 4, 4)` NumPy arrays. For each bone, this inverts
+        Blender's pose process (see `get_basis_matrix()`):
+            basis = local.inv @ parent_local @ parent_armature.inv @ armature
+        where the parent terms are omitted for root bones and `parent_armature` is identity for unanimated parents.
+        """
+        bone_names = list(arma_frames[0].keys())
+        bone_indices = {bone_name: i for i, bone_name in enumerate(bone_names)}
+
+        # Get Blender armature space 4x4 transform matrices for each bone in each frame.
+        bl_arma_matrices = get_bl_arma_matrix_arrays(arma_frames, bone_names)  # (F, B, 4, 4)
+
+        # Constant (per bone) left-hand factor `local.inv [@ parent_local]` and animated parent index (-1 if none).
+        # Note that as FLVER and HKX skeleton hierarchies may be different, the FLVER (Blender Armature) parent bone may
+        # not even be animated, in which case its armature matrix is just identity.
+        local_factors = np.empty((len(bone_names), 4, 4), dtype=np.float64)
+        parent_indices = np.full(len(bone_names), -1, dtype=np.int64)
+        for i, bone_name in enumerate(bone_names):
+            bl_bone = armature.data.bones[bone_name]
+            local_inv = np.array(arma_local_inv_matrices[bone_name], dtype=np.float64)
+            if bl_bone.parent is None:
+                local_factors[i] = local_inv
+            else:
+                local_factors[i] = local_inv @ np.array(bl_bone.parent.matrix_local, dtype=np.float64)
+                parent_indices[i] = bone_indices.get(bl_bone.parent.name, -1)
+
+        # Remove animated parent armature transforms.
+        parent_removed = bl_arma_matrices.copy()
+        animated_parent = parent_indices >= 0
+        if np.any(animated_parent):
+            parent_inv_matrices = np.linalg.inv(bl_arma_matrices[:, parent_indices[animated_parent]])
+            parent_removed[:, animated_parent] = parent_inv_matrices @ bl_arma_matrices[:, animated_parent]
+        bl_basis_matrices = local_factors[np.newaxis] @ parent_removed  # (F, B, 4, 4)
+
+        # Decompose the basis matrices (rather than converting the game quaternions directly) and make each bone's
+        # quaternions continuous across frames (reversing direction of rotation where needed).
+        locations, rotations, scales = decompose_matrix_arrays(bl_basis_matrices)
+        make_quaternions_continuous(rotations)
+
+        # (F, B, 10) -> (B, 10, F)
+        samples = np.concatenate([locations, rotations, scales], axis=-1).transpose(1, 2, 0)
         bone_basis_samples = {
-            bone_name: [[] for _ in range(10)] for bone_name in arma_frames[0].keys()
-        }  # type: dict[str, list[list[float]]]
-
-        for frame in arma_frames:
-
-            # Get Blender armature space 4x4 transform `Matrix` for each bone.
-            bl_arma_matrices = {
-                bone_name: GAME_TRS_TO_BL_MATRIX(transform) for bone_name, transform in frame.items()
-            }
-            cached_arma_inv_matrices = {}  # cached for frame as needed
-
-            for bone_name, bl_arma_matrix in bl_arma_matrices.items():
-                basis_samples = bone_basis_samples[bone_name]
-
-                bl_edit_bone = armature.data.bones[bone_name]
-
-                if (
-                    bl_edit_bone.parent is not None
-                    and bl_edit_bone.parent.name not in cached_arma_inv_matrices
-                ):
-                    # Cache parent's inverted armature matrix (may be needed by other sibling bones this frame).
-                    # Note that as FLVER and HKX skeleton hierarchies may be different, the FLVER (Blender Armature)
-                    # parent bone may not even be animated, in which case we just use an identity matrix.
-                    parent_name = bl_edit_bone.parent.name
-                    if parent_name in bl_arma_matrices:
-                        cached_arma_inv_matrices[parent_name] = bl_arma_matrices[parent_name].inverted()
-                    else:
-                        cached_arma_inv_matrices[parent_name] = Matrix.Identity(4)
-
-                bl_basis_matrix = get_basis_matrix(
-                    armature,
-                    bone_name,
-                    bl_arma_matrix,
-                    cached_arma_inv_matrices,
-                    arma_local_inv_matrices,
-                )
-
-                t, r, s = bl_basis_matrix.decompose()
-
-                if bone_name in last_frame_rotations:
-                    if last_frame_rotations[bone_name].dot(r) < 0:
-                        r.negate()  # negate quaternion to avoid discontinuity (reverse direction of rotation)
-
-                for samples, sample_float in zip(basis_samples, [t.x, t.y, t.z, r.w, r.x, r.y, r.z, s.x, s.y, s.z]):
-                    samples.append(sample_float)
-
-                last_frame_rotations[bone_name] = r
+            bone_name: bone_samples for bone_name, bone_samples in zip(bone_names, samples)
+        }  # type: dict[str, np.ndarray]
 
         return bone_basis_samples
 
     @staticmethod
     def add_keyframes_batch(
         action: bpy.types.Action,
-        bone_basis_samples: dict[str, list[list[float]]],
+        bone_basis_samples: dict[str, np.ndarray],
         root_motion: np.ndarray | None,
         bone_frame_scaling: float,
         root_motion_frame_scaling: float,
@@ -350,7 +332,8 @@ class SoulstructAnimation:
         Constructs `FCurves` with known length and uses `foreach_set` to batch-set all the `.co` attributes of the
         curve keyframe points at once.
 
-        `bone_basis_samples` should map bone names to ten lists of floats (location XYZ, quaternion WXYZ, scale XYZ).
+        `bone_basis_samples` should map bone names to `(10, frame_count)` arrays (location XYZ, quaternion WXYZ, scale
+        XYZ).
         """
 
         # Initialize FCurves for root motion and bones.
@@ -376,34 +359,23 @@ class SoulstructAnimation:
                 for i in range(3)
             ]
 
-        # Build lists of FCurve keyframe points by initializing their size and using `foreach_set`.
-        # Each keyframe point has a `.co` attribute to which we set `(bl_frame_index, value)` (per dimension).
-        # `foreach_set` requires that we flatten the list of tuples to be assigned, a la:
-        #    `[bl_frame_index_0, value_0, bl_frame_index_1, value_1, ...]`
-        # which we do with a list comprehension.
+        # Build FCurve keyframe points by initializing their size and using `foreach_set` (see `set_fcurve_keyframes`).
+        # Frame columns are computed once and shared by all FCurves with the same sample count.
         if root_fcurves:
             # NOTE: There may be less root motion samples than bone animation samples. We spread the root motion samples
             # out to match the bone animation frames using `root_motion_frame_scaling` (done by caller).
+            root_frames = np.arange(len(root_motion), dtype=np.float32) * root_motion_frame_scaling
             for col, fcurve in enumerate(root_fcurves):  # x, y, z, -rz (from game ry)
-                dim_samples = root_motion[:, col]  # one dimension of root motion
-                fcurve.keyframe_points.add(count=len(dim_samples))
-                root_dim_flat = [
-                    x
-                    for frame_index, sample_float in enumerate(dim_samples)
-                    for x in [frame_index * root_motion_frame_scaling, sample_float]
-                ]
-                fcurve.keyframe_points.foreach_set("co", root_dim_flat)
+                set_fcurve_keyframes(fcurve, root_frames, root_motion[:, col])
 
+        bone_frames = {}  # type: dict[int, np.ndarray]
         for bone_name, bone_transform_fcurves in bone_fcurves.items():
             basis_samples = bone_basis_samples[bone_name]
+            sample_count = basis_samples.shape[1]
+            if sample_count not in bone_frames:
+                bone_frames[sample_count] = np.arange(sample_count, dtype=np.float32) * bone_frame_scaling
             for bone_fcurve, samples in zip(bone_transform_fcurves, basis_samples, strict=True):
-                bone_fcurve.keyframe_points.add(count=len(samples))
-                bone_dim_flat = [
-                    x
-                    for frame_index, sample_float in enumerate(samples)
-                    for x in [frame_index * bone_frame_scaling, sample_float]
-                ]
-                bone_fcurve.keyframe_points.foreach_set("co", bone_dim_flat)
+                set_fcurve_keyframes(bone_fcurve, bone_frames[sample_count], samples)
 
     # endregion
     
@@ -440,61 +412,55 @@ class SoulstructAnimation:
             start_frame = int(min(fcurve.range()[0] for fcurve in self.action.fcurves))
             end_frame = int(max(fcurve.range()[1] for fcurve in self.action.fcurves))
 
-        # All frame interleaved transforms, in armature space.
-        root_motion_samples = []  # type: list[tuple[float, float, float, float]]
-        armature_space_frames = []  # type: list[list[TRSTransform]]
-
-        has_root_motion = False
+        # Evaluate all curves at every frame, inclusive of `end_frame`.
+        frames = [
+            frame for i, frame in enumerate(range(start_frame, end_frame + 1))
+            # Skip every second frame to convert 60 FPS to 30 FPS (frame 0 should generally be keyframed).
+            if not (export_settings.from_60_fps and i % 2 == 1)
+        ]
 
         # Animation track order will match Blender bone order (which should come from FLVER).
         track_bone_mapping = list(range(len(skeleton_hkx.skeleton.bones)))
+        track_bone_names = [bone.name for bone in skeleton_hkx.skeleton.bones]
+        for bone_name in track_bone_names:
+            if bone_name not in armature.pose.bones:
+                raise AnimationExportError(f"Bone '{bone_name}' in HKX skeleton not found in Blender armature.")
+
+        # Armature-space Blender bone matrices `(F, B, 4, 4)` and root motion samples `(F, 4)`.
+        use_direct_evaluation = export_settings.evaluate_fcurves_directly
+        if use_direct_evaluation:
+            blocker = self.get_direct_evaluation_blocker(armature)
+            if blocker:
+                _LOGGER.info(f"Cannot evaluate animation FCurves directly ({blocker}). Evaluating scene per frame.")
+                use_direct_evaluation = False
+        if use_direct_evaluation:
+            arma_matrices, root_motion_samples = self.evaluate_armature_frames(armature, frames, track_bone_names)
+        else:
+            arma_matrices, root_motion_samples = self.sample_armature_frames(
+                context, armature, frames, track_bone_names
+            )
 
-        # Store last bone TRS for rotation negation.
-        last_bone_trs = {bone.name: TRSTransform.identity() for bone in skeleton_hkx.skeleton.bones}
-
-        # Slight efficiency boost.
-        bl_bones_by_name = {
-            bone.name: bone for bone in armature.pose.bones
-        }
-
-        # Evaluate all curves at every frame, inclusive of `end_frame`.
-        for i, frame in enumerate(range(start_frame, end_frame + 1)):
-
-            if export_settings.from_60_fps and i % 2 == 1:
-                # Skip every second frame to convert 60 FPS to 30 FPS (frame 0 should generally be keyframed).
-                continue
-
-            bpy.context.scene.frame_set(frame)
-            armature_space_frame = []  # type: list[TRSTransform]
+        # Convert to game transforms. Negate rotation quaternions whose dot product with last frame's (possibly negated)
+        # rotation is negative. (Conversion to game space below preserves these dot products.)
+        bl_translations, bl_rotations, bl_scales = decompose_matrix_arrays(arma_matrices)
+        make_quaternions_continuous(bl_rotations)
+        armature_space_frames = [
+            [
+                TRSTransform(
+                    Vector3((t[0], t[2], t[1])),
+                    GameQuaternion((-r[1], -r[3], -r[2], r[0])),
+                    Vector3((s[0], s[2], s[1])),
+                )
+                for t, r, s in zip(frame_translations, frame_rotations, frame_scales)
+            ]
+            for frame_translations, frame_rotations, frame_scales in zip(
+                bl_translations.tolist(), bl_rotations.tolist(), bl_scales.tolist()
+            )
+        ]  # type: list[list[TRSTransform]]
 
-            # We collect root motion vectors, as we're not sure if any root motion exists yet.
-            loc = armature.location
-            rot = armature.rotation_euler
-            root_motion_sample = (loc[0], loc[1], loc[2], rot[2])  # XYZ and Z rotation (soon to be game Y)
-            root_motion_samples.append(root_motion_sample)
-            if not has_root_motion:
-                if len(root_motion_samples) >= 2 and root_motion_samples[-1] != root_motion_samples[-2]:
-                    # Some actual root motion has appeared.
-                    has_root_motion = True
-
-            for bone in skeleton_hkx.skeleton.bones:
-                try:
-                    bl_bone = bl_bones_by_name[bone.name]
-                except KeyError:
-                    raise AnimationExportError(f"Bone '{bone.name}' in HKX skeleton not found in Blender armature.")
-                armature_space_transform = BL_MATRIX_TO_GAME_TRS(bl_bone.matrix)
-                if i > 0:
-                    # Negate rotation quaternion if dot product with last rotation is negative (first frame ignored).
-                    dot = np.dot(armature_space_transform.rotation.data, last_bone_trs[bone.name].rotation.data)
-                    if dot < 0:
-                        armature_space_transform.rotation = -armature_space_transform.rotation
-                last_bone_trs[bone.name] = armature_space_transform
-                armature_space_frame.append(armature_space_transform)
-
-            armature_space_frames.append(armature_space_frame)
-
-        if has_root_motion:
-            root_motion = np.array(root_motion_samples, dtype=np.float32)
+        # Check if any actual root motion exists.
+        if len(root_motion_samples) >= 2 and np.any(root_motion_samples != root_motion_samples[0]):
+            root_motion = root_motion_samples.astype(np.float32)
             # Swap translate Y/Z and negate rotation Z (now Y).
             root_motion = np.c_[root_motion[:, 0], root_motion[:, 2], root_motion[:, 1], -root_motion[:, 3]]
         else:
@@ -502,7 +468,7 @@ class SoulstructAnimation:
 
         interleaved_animation_hkx = animation_hkx_class.from_minimal_data_interleaved(
             frame_transforms=armature_space_frames,
-            track_names=[bone.name for bone in skeleton_hkx.skeleton.bones],
+            track_names=track_bone_names,
             transform_track_bone_indices=track_bone_mapping,
             root_motion_array=root_motion,
             original_skeleton_name=skeleton_hkx.skeleton.skeleton.name,
@@ -519,4 +485,122 @@ class SoulstructAnimation:
 
         return spline_animation_hkx
 
+    def get_direct_evaluation_blocker(self, armature: bpy.types.ArmatureObject) -> str:
+        """Return a description of the first feature of `armature` that `evaluate_armature_frames()` can't reproduce
+        from this action's FCurves alone, or an empty string if there is none."""
+        animation_data = armature.animation_data
+        if animation_data is None or animation_data.action != self.action:
+            return "action is not active on Armature"
+        if animation_data.drivers:
+            return "Armature has drivers"
+        if armature.data.animation_data and armature.data.animation_data.drivers:
+            return "Armature data has drivers"
+        if any(not track.mute for track in animation_data.nla_tracks):
+            return "Armature has NLA tracks"
+        if armature.constraints:
+            return "Armature has constraints"
+        for pose_bone in armature.pose.bones:
+            if pose_bone.constraints:
+                return f"bone '{pose_bone.name}' has constraints"
+            if pose_bone.rotation_mode == "AXIS_ANGLE":
+                return f"bone '{pose_bone.name}' uses axis-angle rotation"
+            bone = pose_bone.bone
+            if (
+                bone.use_connect
+                or not bone.use_inherit_rotation
+                or bone.inherit_scale != "FULL"
+                or not bone.use_local_location
+            ):
+                return f"bone '{pose_bone.name}' uses non-default parent relationship"
+        return ""
+
+    def evaluate_armature_frames(
+        self,
+        armature: bpy.types.ArmatureObject,
+        frames: list[int],
+        bone_names: list[str],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Evaluate this action's FCurves at each frame and compose armature-space matrices for `bone_names` from bone
+        rest matrices and the bone hierarchy, as Blender does (see `get_armature_matrix()`), without any scene updates:
+            armature = parent_armature @ (parent_local.inv @ local) @ basis
+
+        Only valid if `get_direct_evaluation_blocker()` returns nothing. Channels without an FCurve keep their current
+        pose values, as they would when changing frames.
+
+        Returns armature-space matrices `(F, B, 4, 4)` and root motion samples `(F, 4)`: object location XYZ and
+        rotation Z.
+        """
+        fcurves = {
+            (fcurve.data_path, fcurve.array_index): fcurve for fcurve in self.action.fcurves if not fcurve.mute
+        }
+        frame_count = len(frames)
+
+        def evaluate(data_path: str, index: int, default: float) -> np.ndarray:
+            fcurve = fcurves.get((data_path, index))
+            if fcurve is None:
+                return np.full(frame_count, default, dtype=np.float64)
+            return np.array([fcurve.evaluate(frame) for frame in frames], dtype=np.float64)
+
+        def evaluate_vector(data_path: str, defaults) -> np.ndarray:
+            return np.stack([evaluate(data_path, i, default) for i, default in enumerate(defaults)], axis=-1)
+
+        root_motion_samples = np.stack(
+            [evaluate("location", i, armature.location[i]) for i in range(3)]
+            + [evaluate("rotation_euler", 2, armature.rotation_euler[2])],
+            axis=-1,
+        )
+
+        # Pose bones sorted so parents always come before their children.
+        pose_bones = sorted(armature.pose.bones, key=lambda b: len(b.parent_recursive))
+        pose_bone_indices = {pose_bone.name: i for i, pose_bone in enumerate(pose_bones)}
+        arma_matrices = np.empty((frame_count, len(pose_bones), 4, 4), dtype=np.float64)
+
+        for i, pose_bone in enumerate(pose_bones):
+            data_path = f"pose.bones[\"{pose_bone.name}\"]"
+            locations = evaluate_vector(f"{data_path}.location", pose_bone.location)
+            scales = evaluate_vector(f"{data_path}.scale", pose_bone.scale)
+            if pose_bone.rotation_mode == "QUATERNION":
+                quats = evaluate_vector(f"{data_path}.rotation_quaternion", pose_bone.rotation_quaternion)
+                quats /= np.linalg.norm(quats, axis=-1, keepdims=True)  # Blender normalizes pose quaternions
+                rotations = quaternion_to_matrix_arrays(quats)
+            else:
+                eulers = evaluate_vector(f"{data_path}.rotation_euler", pose_bone.rotation_euler)
+                rotations = euler_to_matrix_arrays(eulers, pose_bone.rotation_mode)
+            basis_matrices = compose_matrix_arrays(locations, rotations, scales)
+
+            local = np.array(pose_bone.bone.matrix_local, dtype=np.float64)
+            if pose_bone.parent is None:
+                arma_matrices[:, i] = local @ basis_matrices
+            else:
+                parent_local = np.array(pose_bone.parent.bone.matrix_local, dtype=np.float64)
+                parent_arma_matrices = arma_matrices[:, pose_bone_indices[pose_bone.parent.name]]
+                arma_matrices[:, i] = parent_arma_matrices @ (np.linalg.inv(parent_local) @ local) @ basis_matrices
+
+        bone_indices = [pose_bone_indices[bone_name] for bone_name in bone_names]
+        return arma_matrices[:, bone_indices], root_motion_samples
+
+    @staticmethod
+    def sample_armature_frames(
+        context: Context,
+        armature: bpy.types.ArmatureObject,
+        frames: list[int],
+        bone_names: list[str],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Slower fallback for `evaluate_armature_frames()` that sets the scene frame and reads the evaluated bone
+        matrices on every frame. Supports constraints, drivers, etc.
+
+        Returns the same arrays as `evaluate_armature_frames()`.
+        """
+        pose_bones = [armature.pose.bones[bone_name] for bone_name in bone_names]
+        arma_matrices = np.empty((len(frames), len(bone_names), 4, 4), dtype=np.float64)
+        root_motion_samples = np.empty((len(frames), 4), dtype=np.float64)
+        for f, frame in enumerate(frames):
+            context.scene.frame_set(frame)
+            loc = armature.location
+            rot = armature.rotation_euler
+            root_motion_samples[f] = (loc[0], loc[1], loc[2], rot[2])  # XYZ and Z rotation (soon to be game Y)
+            for b, pose_bone in enumerate(pose_bones):
+                arma_matrices[f, b] = pose_bone.matrix
+        return arma_matrices, root_motion_samples
+
     # endregion
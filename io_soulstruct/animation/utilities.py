@@ -8,18 +8,24 @@ __all__ = [
     "get_armature_frames",
     "get_root_motion",
     "get_animation_name",
+    "get_bl_arma_matrix_arrays",
+    "set_fcurve_keyframes",
+    "set_constant_interpolation_at_frames",
 ]
 
 import typing as tp
 
+import bpy
 import numpy as np
 from pathlib import Path
 from soulstruct_havok.core import HKX
 from soulstruct_havok.utilities.maths import TRSTransform
-from soulstruct_havok.fromsoft.base import BaseAnimationHKX, BaseSkeletonHKX
 from soulstruct_havok.fromsoft import darksouls1ptde, darksouls1r, bloodborne, eldenring
 from soulstruct.containers import BinderEntry
 from io_soulstruct.exceptions import UnsupportedGameError
+from io_soulstruct.utilities.maths import quaternion_to_matrix_arrays, compose_matrix_arrays
+# `bpy`-free animation conversion, shared with bulk import worker processes.
+from io_soulstruct_workers import get_hkx_game_module, get_root_motion, get_armature_frames
 
 ANIMATION_TYPING = tp.Union[
     darksouls1ptde.AnimationHKX, darksouls1r.AnimationHKX, bloodborne.AnimationHKX, eldenring.AnimationHKX
@@ -32,22 +38,11 @@ SKELETON_TYPING = tp.Union[
 def read_animation_hkx_entry(hkx_entry: BinderEntry, compendium: HKX = None) -> ANIMATION_TYPING:
     """Read animation HKX file from a Binder entry and return the appropriate `AnimationHKX` subclass instance."""
     data = hkx_entry.get_uncompressed_data()
-    packfile_version = data[0x28:0x38]
-    tagfile_version = data[0x10:0x18]
-    if packfile_version.startswith(b"hk_2010.2.0-r1"):  # PTDE
-        hkx = darksouls1ptde.AnimationHKX.from_bytes(data, compendium=compendium)
-    elif tagfile_version == b"20150100":  # DSR
-        hkx = darksouls1r.AnimationHKX.from_bytes(data, compendium=compendium)
-    elif packfile_version.startswith(b"hk_2014.1.0-r1"):  # BB
-        hkx = bloodborne.AnimationHKX.from_bytes(data, compendium=compendium)
-    elif tagfile_version == b"20180100":  # ER
-        hkx = eldenring.AnimationHKX.from_bytes(data, compendium=compendium)
-    else:
-        raise UnsupportedGameError(
-            f"Cannot support this HKX skeleton file version in Soulstruct and/or Blender.\n"
-            f"   Possible packfile version: {packfile_version}\n"
-            f"   Possible tagfile version: {tagfile_version}"
-        )
+    try:
+        game_module = get_hkx_game_module(data)
+    except ValueError as ex:
+        raise UnsupportedGameError(str(ex))
+    hkx = game_module.AnimationHKX.from_bytes(data, compendium=compendium)
     hkx.path = Path(hkx_entry.name)
     return hkx
 
@@ -55,58 +50,15 @@ def read_animation_hkx_entry(hkx_entry: BinderEntry, compendium: HKX = None) ->
 def read_skeleton_hkx_entry(hkx_entry: BinderEntry, compendium: HKX = None) -> SKELETON_TYPING:
     """Read skeleton HKX file from a Binder entry and return the appropriate `SkeletonHKX` subclass instance."""
     data = hkx_entry.get_uncompressed_data()
-    packfile_version = data[0x28:0x38]
-    tagfile_version = data[0x10:0x18]
-    if packfile_version.startswith(b"hk_2010.2.0-r1"):  # PTDE
-        hkx = darksouls1ptde.SkeletonHKX.from_bytes(data, compendium=compendium)
-    elif tagfile_version == b"20150100":  # DSR
-        hkx = darksouls1r.SkeletonHKX.from_bytes(data, compendium=compendium)
-    elif packfile_version.startswith(b"hk_2014.1.0-r1"):  # BB
-        hkx = bloodborne.SkeletonHKX.from_bytes(data, compendium=compendium)
-    elif tagfile_version == b"20180100":  # ER
-        hkx = eldenring.SkeletonHKX.from_bytes(data, compendium=compendium)
-    else:
-        raise UnsupportedGameError(
-            f"Cannot support this HKX skeleton file version in Soulstruct and/or Blender.\n"
-            f"   Possible packfile version: {packfile_version}\n"
-            f"   Possible tagfile version: {tagfile_version}"
-        )
+    try:
+        game_module = get_hkx_game_module(data)
+    except ValueError as ex:
+        raise UnsupportedGameError(str(ex))
+    hkx = game_module.SkeletonHKX.from_bytes(data, compendium=compendium)
     hkx.path = Path(hkx_entry.name)
     return hkx
 
 
-def get_root_motion(animation_hkx: BaseAnimationHKX, swap_yz=True) -> np.ndarray | None:
-    try:
-        root_motion = animation_hkx.animation_container.get_reference_frame_samples()
-    except (ValueError, TypeError):
-        return None
-
-    if swap_yz:
-        # Swap Y and Z axes and negate rotation (now around Z axis). Array is read-only, so we construct a new one.
-        root_motion = np.c_[root_motion[:, 0], root_motion[:, 2], root_motion[:, 1], -root_motion[:, 3]]
-    return root_motion
-
-
-def get_armature_frames(
-    animation_hkx: BaseAnimationHKX, skeleton_hkx: BaseSkeletonHKX
-) -> list[dict[str, TRSTransform]]:
-    """Get a list of animation frame dictionaries, which each map bone names to armature-space transforms that frame."""
-
-    # Get track bone names.
-    track_bone_indices = animation_hkx.animation_container.animation_binding.transformTrackToBoneIndices
-    track_bone_names = [skeleton_hkx.skeleton.bones[i].name for i in track_bone_indices]
-
-    # Get frames as standard nested lists of transforms.
-    interleaved_frames = animation_hkx.animation_container.get_interleaved_data_in_armature_space(skeleton_hkx.skeleton)
-
-    # Convert to dictionary using given `track_bone_names` list.
-    arma_frame_dicts = [
-        {bone_name: transform for bone_name, transform in zip(track_bone_names, frame)}
-        for frame in interleaved_frames
-    ]
-    return arma_frame_dicts
-
-
 def get_animation_name(animation_id: int, template: str, prefix="a"):
     """Takes a template like '##_####' and converts `animation_id` int (e.g. 13000) to a string (e.g. 'a01_3000')."""
     parts = template.split('_')
@@ -124,3 +76,66 @@ def get_animation_name(animation_id: int, template: str, prefix="a"):
         animation_id = animation_id[:-length]
 
     return prefix + '_'.join(reversed(string_parts))
+
+
+def get_bl_arma_matrix_arrays(arma_frames: list[dict[str, TRSTransform]], bone_names: list[str]) -> np.ndarray:
+    """Stack all armature-space game transforms of `bone_names` in `arma_frames` into an `(F, B, 4, 4)` array of
+    Blender armature-space matrices.
+
+    Array equivalent of calling `GAME_TRS_TO_BL_MATRIX()` on every transform.
+    """
+    # Game translation/scale XYZ and rotation XYZW, with Y and Z swapped (and rotation XYZ negated) for Blender.
+    trs = np.array(
+        [
+            [
+                (
+                    t.translation[0], t.translation[2], t.translation[1],
+                    t.rotation.w, -t.rotation.x, -t.rotation.z, -t.rotation.y,
+                    t.scale[0], t.scale[2], t.scale[1],
+                )
+                for t in (frame[bone_name] for bone_name in bone_names)
+            ]
+            for frame in arma_frames
+        ],
+        dtype=np.float64,
+    )  # type: np.ndarray  # (F, B, 10)
+
+    # Unit quaternions assumed, as in `Matrix.LocRotScale`.
+    return compose_matrix_arrays(trs[..., :3], quaternion_to_matrix_arrays(trs[..., 3:7]), trs[..., 7:10])
+
+
+# `Keyframe.interpolation` enum value for 'CONSTANT', for use with `foreach_get/set`.
+KEYFRAME_INTERPOLATION_CONSTANT = 0
+
+
+def set_fcurve_keyframes(fcurve: bpy.types.FCurve, frames: np.ndarray, values: np.ndarray):
+    """Add a keyframe point to `fcurve` for every `(frame, value)` pair and set them all with one `foreach_set` call.
+
+    `foreach_set("co", ...)` needs the flat `[frame_0, value_0, frame_1, value_1, ...]` layout, which is written into a
+    preallocated float32 buffer (Blender's native keyframe `co` type), so no Python floats are created.
+    """
+    co = np.empty((len(values), 2), dtype=np.float32)
+    co[:, 0] = frames
+    co[:, 1] = values
+    fcurve.keyframe_points.add(count=len(co))
+    fcurve.keyframe_points.foreach_set("co", co.ravel())
+
+
+def set_constant_interpolation_at_frames(fcurves: tp.Iterable[bpy.types.FCurve], frames: tp.Iterable[float]):
+    """Set 'CONSTANT' interpolation for all keyframes in `fcurves` that lie exactly on one of `frames` (e.g. cutscene
+    cut ends), reading and writing each FCurve's keyframes in bulk."""
+    frames = np.array(list(frames), dtype=np.float32)
+    for fcurve in fcurves:
+        keyframe_points = fcurve.keyframe_points
+        count = len(keyframe_points)
+        if count == 0:
+            continue
+        co = np.empty(count * 2, dtype=np.float32)
+        keyframe_points.foreach_get("co", co)
+        is_cut_end = np.isin(co[::2], frames)
+        if not np.any(is_cut_end):
+            continue
+        interpolation = np.empty(count, dtype=np.int32)
+        keyframe_points.foreach_get("interpolation", interpolation)
+        interpolation[is_cut_end] = KEYFRAME_INTERPOLATION_CONSTANT
+        keyframe_points.foreach_set("interpolation", interpolation)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 __all__ = [
     "BlenderMapCollision",
+    "MapCollisionExportData",
 ]
 
 import typing as tp
@@ -21,6 +22,18 @@ from .properties import MapCollisionProps
 from .utilities import HKX_MATERIAL_NAME_RE
 
 
+class MapCollisionExportData(tp.NamedTuple):
+    """Arrays extracted from a triangulated Blender Map Collision mesh, which can be split into 'hi' and 'lo'
+    `MapCollisionModel`s off the main thread."""
+    name: str
+    hi_name: str
+    lo_name: str
+    vertices: np.ndarray
+    faces: np.ndarray
+    face_materials: np.ndarray
+    hkx_materials: dict[int, tuple[int, bool]]  # maps Blender material index to `(hkx_material_index, is_hi_res)`
+
+
 class BlenderMapCollision(SoulstructObject[MapCollisionModel, MapCollisionProps]):
 
     TYPE = SoulstructType.COLLISION
@@ -135,6 +148,19 @@ class BlenderMapCollision(SoulstructObject[MapCollisionModel, MapCollisionProps]
         `hi_name` and `lo_name` are required to set internally to the HKX file (though it probably doesn't impact
         gameplay). If passed explicitly as `None`, those submeshes will be ignored -- but they cannot BOTH be `None`.
         """
+        export_data = self.get_hkx_export_data(hi_name, lo_name)
+        hi_collision, lo_collision, warnings = self.hkx_pair_from_export_data(
+            export_data, py_havok_module, require_hi, use_hi_if_missing_lo
+        )
+        for warning in warnings:
+            operator.warning(warning)
+        return hi_collision, lo_collision
+
+    def get_hkx_export_data(self, hi_name="", lo_name="") -> MapCollisionExportData:
+        """Triangulate this mesh and extract all Blender data needed to create its 'hi' and 'lo' HKX files as arrays,
+        which can then be converted on any thread with `hkx_pair_from_export_data()`. Must be called on the main
+        thread, as it accesses Blender data.
+        """
         if not self.obj.material_slots:
             raise ValueError(f"HKX model mesh '{self.name}' has no materials for submesh detection.")
 
@@ -154,37 +180,38 @@ class BlenderMapCollision(SoulstructObject[MapCollisionModel, MapCollisionProps]
         bm.from_mesh(self.obj.data)
         bmesh.ops.triangulate(bm, faces=bm.faces, quad_method="BEAUTY", ngon_method="BEAUTY")
         tri_mesh_data = bpy.data.meshes.new("__TEMP_HKX__")
-        # No need to copy materials over (no UV, etc.)
-        bm.to_mesh(tri_mesh_data)
-        bm.free()
-        del bm
-
-        hi_hkx_meshes = []  # type: list[MapCollisionModelMesh]
-        lo_hkx_meshes = []  # type: list[MapCollisionModelMesh]
-
-        # Note that it is possible that the user may have faces with different materials share vertices; this is fine,
-        # and that vertex will be copied into each HKX submesh with a face loop that uses it.
-
-        # Rather than iterating over all faces once for every material, we iterate over all of them once to split them
-        # up by material index, then iterate once over each of those sublists (so the full face list is iterated twice).
-        faces_by_material = {i: [] for i in range(len(self.obj.material_slots))}
-        for face in tri_mesh_data.polygons:
-            try:
-                faces_by_material[face.material_index].append(face)
-            except KeyError:
-                raise MapCollisionExportError(
-                    f"Face {face.index} of mesh '{self.name}' has material index {face.material_index}, "
-                    f"which is not in the material slots of the mesh."
-                )
-
-        # Now iterate over each sublist of faces and create lists of HKX vertices and faces for each one. We maintain
-        # a vertex map that maps the original full-mesh Blender vertex index to the submesh index.
-        for bl_material_index, faces in faces_by_material.items():
-            if not faces:
-                continue  # no faces use this material
+        try:
+            # No need to copy materials over (no UV, etc.)
+            bm.to_mesh(tri_mesh_data)
+            bm.free()
+            del bm
+
+            # Read all vertex, face, and material data in single `foreach_get()` calls.
+            vertex_count = len(tri_mesh_data.vertices)
+            face_count = len(tri_mesh_data.polygons)
+            vertices = np.empty((vertex_count, 3), dtype=np.float32)
+            tri_mesh_data.vertices.foreach_get("co", vertices.ravel())
+            loop_starts = np.empty(face_count, dtype=np.int32)
+            tri_mesh_data.polygons.foreach_get("loop_start", loop_starts)
+            face_materials = np.empty(face_count, dtype=np.int32)
+            tri_mesh_data.polygons.foreach_get("material_index", face_materials)
+            loop_vertex_indices = np.empty(len(tri_mesh_data.loops), dtype=np.int32)
+            tri_mesh_data.loops.foreach_get("vertex_index", loop_vertex_indices)
+            faces = loop_vertex_indices[loop_starts[:, np.newaxis] + np.arange(3)]  # all triangles
+        finally:
+            self._clear_temp_hkx()  # all data copied (or failed)
+
+        if np.any(invalid_faces := face_materials >= len(self.obj.material_slots)):
+            face_index = np.argmax(invalid_faces)
+            raise MapCollisionExportError(
+                f"Face {face_index} of mesh '{self.name}' has material index {face_materials[face_index]}, "
+                f"which is not in the material slots of the mesh."
+            )
 
-            # Extract HKX material index from name of Blender material.
-            # We can use the original non-triangulated mesh's material slots.
+        # Extract HKX material index and resolution from names of Blender materials used by any faces.
+        # We can use the original non-triangulated mesh's material slots.
+        hkx_materials = {}  # type: dict[int, tuple[int, bool]]
+        for bl_material_index in np.unique(face_materials).tolist():
             bl_material = self.obj.material_slots[bl_material_index].material
             mat_match = HKX_MATERIAL_NAME_RE.match(bl_material.name)
             if not mat_match:
@@ -196,76 +223,139 @@ class BlenderMapCollision(SoulstructObject[MapCollisionModel, MapCollisionProps]
             res = mat_match.group("res")[0].lower()  # 'h' or 'l'
             if (res == "h" and not hi_name) or (res == "l" and not lo_name):
                 continue  # ignoring resolution
+            hkx_materials[bl_material_index] = (hkx_material_index, res == "h")
+
+        return MapCollisionExportData(
+            name=self.name,
+            hi_name=hi_name,
+            lo_name=lo_name,
+            vertices=vertices,
+            faces=faces,
+            face_materials=face_materials,
+            hkx_materials=hkx_materials,
+        )
 
-            # We can't assume that all faces with the same material index - and the vertices they use - are contiguous
-            # in `polygons`, so a simple global vertex index subtraction won't work. We need to maintain a vertex map.
-            vertex_map = {}
-            hkx_verts_list = []
-            hkx_faces_list = []
-            for face in faces:
-                hkx_face = []
-                for vert_index in face.vertices:
-                    if vert_index not in vertex_map:
-                        # First time this vertex has been used by this submesh.
-                        hkx_vert_index = vertex_map[vert_index] = len(hkx_verts_list)
-                        vert = tri_mesh_data.vertices[vert_index]
-                        hkx_verts_list.append(
-                            [vert.co.x, vert.co.z, vert.co.y, 0.0]  # may as well swap Y and Z coordinates here
-                        )
-                    else:
-                        # Vertex has already been used by this submesh.
-                        hkx_vert_index = vertex_map[vert_index]
-                    hkx_face.append(hkx_vert_index)
-                hkx_faces_list.append(hkx_face)
-
-            meshes = hi_hkx_meshes if res == "h" else lo_hkx_meshes
-            mesh = MapCollisionModelMesh(
-                vertices=np.array(hkx_verts_list, dtype=np.float32),
-                faces=np.array(hkx_faces_list, dtype=np.uint16),
-                material_index=hkx_material_index,
-            )
-            meshes.append(mesh)
+    @classmethod
+    def hkx_pair_from_export_data(
+        cls,
+        export_data: MapCollisionExportData,
+        py_havok_module: PyHavokModule,
+        require_hi=True,
+        use_hi_if_missing_lo=False,
+    ) -> tuple[MapCollisionModel | None, MapCollisionModel | None, list[str]]:
+        """Split extracted `export_data` into HKX submeshes by material and create 'hi' and/or 'lo' HKX files.
+
+        Does not access any Blender data, so can be run in a worker thread. Also returns a list of warning messages for
+        the caller to log.
+        """
+        warnings = []
+        hi_hkx_meshes, lo_hkx_meshes = cls.split_hkx_meshes(
+            export_data.name,
+            export_data.vertices,
+            export_data.faces,
+            export_data.face_materials,
+            export_data.hkx_materials,
+        )
 
         if hi_hkx_meshes:
-            hi_collision = self.SOULSTRUCT_CLASS(
-                name=hi_name,
+            hi_collision = cls.SOULSTRUCT_CLASS(
+                name=export_data.hi_name,
                 meshes=hi_hkx_meshes,
                 py_havok_module=py_havok_module,
             )
-            hi_collision.path = Path(f"{hi_name}.hkx")
+            hi_collision.path = Path(f"{export_data.hi_name}.hkx")
         else:
             if require_hi:
-                raise MapCollisionExportError(f"No 'hi' HKX meshes found in mesh '{self.name}'.")
-            operator.warning(f"No 'hi' HKX meshes found in mesh '{self.name}'. Continuing as `require_hi=False`.")
+                raise MapCollisionExportError(f"No 'hi' HKX meshes found in mesh '{export_data.name}'.")
+            warnings.append(
+                f"No 'hi' HKX meshes found in mesh '{export_data.name}'. Continuing as `require_hi=False`."
+            )
             hi_collision = None
 
         if lo_hkx_meshes:
-            lo_collision = self.SOULSTRUCT_CLASS(
-                name=lo_name,
+            lo_collision = cls.SOULSTRUCT_CLASS(
+                name=export_data.lo_name,
                 meshes=lo_hkx_meshes,
                 py_havok_module=py_havok_module,
             )
-            lo_collision.path = Path(f"{lo_name}.hkx")
+            lo_collision.path = Path(f"{export_data.lo_name}.hkx")
         elif use_hi_if_missing_lo:
             # Duplicate hi-res meshes and materials for lo-res (but use lo-res name).
-            lo_collision = self.SOULSTRUCT_CLASS(
-                name=lo_name,
+            lo_collision = cls.SOULSTRUCT_CLASS(
+                name=export_data.lo_name,
                 meshes=hi_hkx_meshes,
                 py_havok_module=py_havok_module,
             )
         else:
-            operator.warning(
-                f"No 'lo' HKX meshes found for '{lo_name}' and `use_hi_if_missing_lo=False`. No lo-res exported."
+            warnings.append(
+                f"No 'lo' HKX meshes found for '{export_data.lo_name}' and `use_hi_if_missing_lo=False`. "
+                f"No lo-res exported."
             )
             lo_collision = None
 
         if not hi_collision and not lo_collision:
             raise MapCollisionExportError(
-                f"No material-based HKX submeshes could be created for HKX mesh '{self.name}'. Are all faces "
+                f"No material-based HKX submeshes could be created for HKX mesh '{export_data.name}'. Are all faces "
                 f"assigned to a material with name template 'HKX # (Hi|Lo)'?"
             )
 
-        return hi_collision, lo_collision
+        return hi_collision, lo_collision, warnings
+
+    @staticmethod
+    def split_hkx_meshes(
+        name: str,
+        vertices: np.ndarray,
+        faces: np.ndarray,
+        face_materials: np.ndarray,
+        hkx_materials: dict[int, tuple[int, bool]],
+    ) -> tuple[list[MapCollisionModelMesh], list[MapCollisionModelMesh]]:
+        """Split full Blender mesh arrays into hi-res and lo-res HKX submeshes, one per Blender material index.
+
+        `hkx_materials` maps Blender material index to `(hkx_material_index, is_hi_res)`. Faces using any other Blender
+        material index are ignored.
+
+        Note that it is possible that the user may have faces with different materials share vertices; this is fine,
+        and that vertex will be copied into each HKX submesh with a face that uses it. Submesh vertices keep the order
+        in which they are first used by the submesh's faces.
+        """
+        hi_hkx_meshes = []  # type: list[MapCollisionModelMesh]
+        lo_hkx_meshes = []  # type: list[MapCollisionModelMesh]
+
+        for bl_material_index, (hkx_material_index, is_hi_res) in sorted(hkx_materials.items()):
+            material_faces = faces[face_materials == bl_material_index]
+            if material_faces.size == 0:
+                continue  # no faces use this material
+
+            # We can't assume that all faces with the same material index - and the vertices they use - are contiguous
+            # in the mesh, so we compactly remap the global vertex indices used by these faces.
+            used_vertices, first_uses, face_vertex_indices = np.unique(
+                material_faces.ravel(), return_index=True, return_inverse=True
+            )
+            if used_vertices.size > 65535:
+                raise MapCollisionExportError(
+                    f"HKX submesh for material index {hkx_material_index} ({'Hi' if is_hi_res else 'Lo'}) of mesh "
+                    f"'{name}' has {used_vertices.size} vertices, which exceeds the HKX maximum of 65535 (16-bit "
+                    f"vertex indices). Split this mesh or reduce its vertex count."
+                )
+            # Reorder from sorted global index order to first-use order.
+            first_use_order = np.argsort(first_uses)
+            submesh_indices = np.empty_like(first_use_order)
+            submesh_indices[first_use_order] = np.arange(first_use_order.size)
+            hkx_faces = submesh_indices[face_vertex_indices.ravel()].reshape(-1, 3)
+
+            hkx_vertices = np.zeros((used_vertices.size, 4), dtype=np.float32)
+            # May as well swap Y and Z coordinates here.
+            hkx_vertices[:, :3] = vertices[used_vertices[first_use_order]][:, [0, 2, 1]]
+
+            meshes = hi_hkx_meshes if is_hi_res else lo_hkx_meshes
+            mesh = MapCollisionModelMesh(
+                vertices=hkx_vertices,
+                faces=hkx_faces.astype(np.uint16),
+                material_index=hkx_material_index,
+            )
+            meshes.append(mesh)
+
+        return hi_hkx_meshes, lo_hkx_meshes
 
     @staticmethod
     def join_collision_meshes(
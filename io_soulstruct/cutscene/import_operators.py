@@ -10,6 +10,7 @@ from pathlib import Path
 import bpy
 from bpy_extras.io_utils import ImportHelper
 from io_soulstruct.animation.types import SoulstructAnimation
+from io_soulstruct.animation.utilities import set_constant_interpolation_at_frames
 from io_soulstruct.exceptions import SoulstructTypeError, CutsceneImportError
 from io_soulstruct.msb.darksouls1r import *
 from io_soulstruct.utilities import *
@@ -332,7 +333,4 @@ class ImportHKXCutscene(LoggingOperator, ImportHelper):
         # Make all keyframes in `cut_final_frame_indices` 'CONSTANT' interpolation.
 
         for action in (camera.animation_data.action, camera_data.animation_data.action):
-            for fcurve in action.fcurves:
-                for keyframe in fcurve.keyframe_points:
-                    if keyframe.co.x in final_frame_indices:
-                        keyframe.interpolation = "CONSTANT"
+            set_constant_interpolation_at_frames(action.fcurves, final_frame_indices)
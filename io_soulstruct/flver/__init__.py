@@ -51,6 +51,7 @@ __all__ = [
     "FindMissingTexturesInImageCache",
     "SelectMeshChildren",
     "ImportTextures",
+    "IndexGameTextures",
     "BakeLightmapSettings",
     "BakeLightmapTextures",
     "DDSTexture",
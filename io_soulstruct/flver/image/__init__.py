@@ -4,6 +4,7 @@ __all__ = [
     "DDSTextureProps",
     "TextureExportSettings",
     "ImportTextures",
+    "IndexGameTextures",
     # "ExportTexturesIntoBinder",
     "DDSTexturePanel",
 ]
@@ -34,4 +34,6 @@ class DDSTexturePanel(bpy.types.Panel):
         # Draw DDS Texture properties.
         dds_texture = DDSTexture(image)
         for prop in dds_texture.texture_properties.__annotations__:
+            if prop.startswith("export_"):
+                continue  # internal export tracking
             layout.prop(dds_texture.texture_properties, prop)
@@ -2,17 +2,28 @@ from __future__ import annotations
 
 __all__ = [
     "ImageImportManager",
+    "TextureSourceCatalog",
 ]
 
+import functools
 import logging
 import re
+import typing as tp
 from pathlib import Path
 
 import bpy
 from io_soulstruct.utilities import *
 from soulstruct.containers import Binder, BinderEntry, EntryNotFoundError
+from soulstruct.containers.entry import BinderEntryHeader
 from soulstruct.containers.tpf import TPF, TPFTexture, TPFPlatform
 from soulstruct.games import *
+from soulstruct.utilities.binary import BinaryReader
+from soulstruct.utilities.files import read_json, write_json
+
+from io_soulstruct.general.cached import get_session_texture_cache_key, get_session_cached_texture_source
+
+if tp.TYPE_CHECKING:
+    from io_soulstruct.general.properties import SoulstructSettings
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,6 +40,259 @@ def lower_stem(path_or_entry: Path | BinderEntry) -> str:
     return path_or_entry.name.split(".")[0].lower()
 
 
+def read_bhd_entry_headers(bhd_data: bytes) -> list[BinderEntryHeader] | None:
+    """Read ONLY the entry headers of a split Binder's BHD data. Returns `None` if data is not an uncompressed BHD."""
+    reader = BinaryReader(bhd_data)
+    version_bytes = reader.peek(4)
+    try:
+        if version_bytes == b"BHF3":
+            _, entry_headers = Binder._read_header_v3(reader)
+        elif version_bytes == b"BHF4":
+            _, entry_headers = Binder._read_header_v4(reader)
+        else:
+            return None
+    finally:
+        reader.close()
+    return entry_headers
+
+
+class BDTEntrySource(tp.NamedTuple):
+    """TPF entry in a split TPFBHD/TPFBDT Binder, found by reading only the BHD header.
+
+    The entry's data is only read from the BDT (with a single seek) when the TPF is actually needed.
+    """
+    bdt_path: Path
+    entry_header: BinderEntryHeader
+
+    @property
+    def name(self) -> str:
+        return self.entry_header.path.replace("\\", "/").split("/")[-1]
+
+    def read_entry(self) -> BinderEntry:
+        with self.bdt_path.open("rb") as f:
+            f.seek(self.entry_header.data_offset)
+            data = f.read(self.entry_header.compressed_size)
+        return BinderEntry(
+            data=data,
+            entry_id=self.entry_header.entry_id,
+            path=self.entry_header.path,
+            flags=self.entry_header.flags,
+        )
+
+
+class TextureSourceCatalog:
+    """Persistent index of a game root that maps lower-case texture stems to the exact TPF containing them.
+
+    Built once by the 'Index Game Textures' operator and written next to the image cache. `ImageImportManager` checks
+    it before any directory scanning or Binder opening. Each TPF source records the file its data is read from; if the
+    size or modification time of that file has changed since indexing, the source is ignored and the manager falls back
+    to its normal discovery.
+    """
+
+    VERSION: tp.ClassVar[int] = 2
+    # Game root subdirectories that are searched for textures.
+    SCAN_DIRECTORIES: tp.ClassVar[tuple[str, ...]] = ("map", "chr", "parts", "obj", "asset")
+    # Non-TPF Binders that may contain TPF entries (or a CHRTPFBHD header for an adjacent CHRTPFBDT).
+    BINDER_RE: tp.ClassVar[re.Pattern] = re.compile(r".*\.(chr|obj|parts|tex)bnd(\.dcx)?$")
+    # Low-resolution variants of TEXBNDs and TPFs (e.g. 'c1234_l.texbnd.dcx'), which repeat hi-res texture stems.
+    LO_RES_RE: tp.ClassVar[re.Pattern] = re.compile(r".*_l\.(texbnd|tpf)(\.dcx)?$", flags=re.IGNORECASE)
+
+    game_root: Path
+    # Files with the same relative path in this project root override cataloged game files (making them invalid).
+    project_root: Path | None
+    # Maps relative file paths to `[mtime_ns, size]` at indexing time.
+    files: dict[str, list[int]]
+    # TPF sources as `[relative_file_path, entry_path, data_offset, data_size, entry_flags]` lists. `entry_path` is
+    # empty for loose TPFs. `data_offset`, `data_size`, and `entry_flags` are only used for TPFs in split BDT files.
+    tpf_sources: list[list]
+    # Maps lower-case texture stems to indices in `tpf_sources`. Low-res variants are recorded separately, so that a
+    # lookup can follow the same resolution preference as normal discovery.
+    textures: dict[str, int]
+    lo_res_textures: dict[str, int]
+
+    # Validity of each source file, checked at most once per operation (see `from_settings`).
+    _checked_files: dict[str, bool]
+
+    # Loaded catalogs, keyed by catalog path and invalidated by its modification time.
+    _LOADED: tp.ClassVar[dict[Path, tuple[int, TextureSourceCatalog]]] = {}
+
+    def __init__(self, game_root: Path, project_root: Path = None):
+        self.game_root = game_root
+        self.project_root = project_root
+        self.files = {}
+        self.tpf_sources = []
+        self.textures = {}
+        self.lo_res_textures = {}
+        self._checked_files = {}
+
+    @staticmethod
+    def get_catalog_path(settings: SoulstructSettings) -> Path | None:
+        if not settings.str_image_cache_directory or not settings.game:
+            return None
+        return settings.image_cache_directory / f"texture_catalog_{settings.game.submodule_name}.json"
+
+    @classmethod
+    def from_settings(cls, settings: SoulstructSettings) -> TextureSourceCatalog | None:
+        """Load catalog for the current game root, if enabled and it exists. Returns `None` otherwise."""
+        if not settings.use_texture_source_catalog or not settings.game_root_path:
+            return None
+        catalog_path = cls.get_catalog_path(settings)
+        if not catalog_path or not catalog_path.is_file():
+            return None
+
+        mtime_ns = catalog_path.stat().st_mtime_ns
+        if catalog_path in cls._LOADED and cls._LOADED[catalog_path][0] == mtime_ns:
+            catalog = cls._LOADED[catalog_path][1]
+        else:
+            try:
+                catalog = cls.from_json_dict(read_json(catalog_path))
+            except Exception as ex:
+                _LOGGER.warning(f"Could not read texture source catalog {catalog_path}. Ignoring it. Error: {ex}")
+                return None
+            cls._LOADED[catalog_path] = (mtime_ns, catalog)
+
+        if catalog.game_root != settings.game_root_path:
+            _LOGGER.warning(
+                f"Texture source catalog was built for a different game root ({catalog.game_root}). Ignoring it."
+            )
+            return None
+        # Source files are re-validated once per operation.
+        catalog.project_root = settings.project_root_path
+        catalog._checked_files = {}
+        return catalog
+
+    @classmethod
+    def from_json_dict(cls, json_dict: dict) -> TextureSourceCatalog:
+        if json_dict.get("version") != cls.VERSION:
+            raise ValueError(f"Unsupported catalog version: {json_dict.get('version')}")
+        catalog = cls(Path(json_dict["game_root"]))
+        catalog.files = json_dict["files"]
+        catalog.tpf_sources = json_dict["tpf_sources"]
+        catalog.textures = json_dict["textures"]
+        catalog.lo_res_textures = json_dict["lo_res_textures"]
+        return catalog
+
+    def to_json_dict(self) -> dict:
+        return {
+            "version": self.VERSION,
+            "game_root": str(self.game_root),
+            "files": self.files,
+            "tpf_sources": self.tpf_sources,
+            "textures": self.textures,
+            "lo_res_textures": self.lo_res_textures,
+        }
+
+    def write(self, catalog_path: Path):
+        catalog_path.parent.mkdir(parents=True, exist_ok=True)
+        write_json(catalog_path, self.to_json_dict(), indent=None)  # compact
+
+    @classmethod
+    def build(cls, game_root: Path) -> TextureSourceCatalog:
+        """Scan `game_root` and open every TPF in `SCAN_DIRECTORIES` to record where each texture lives.
+
+        This is slow (every TPF is parsed), but only needs to be done once per game installation.
+        """
+        catalog = cls(game_root)
+        for directory_name in cls.SCAN_DIRECTORIES:
+            directory = game_root / directory_name
+            if not directory.is_dir():
+                continue
+            for path in sorted(directory.rglob("*")):
+                name = path.name
+                try:
+                    if TPF_RE.match(name):
+                        catalog._add_tpf(TPF.from_path(path), path)
+                    elif name.endswith(".tpfbhd"):
+                        bdt_path = path.with_name(name.replace(".tpfbhd", ".tpfbdt"))
+                        catalog._add_bdt_tpfs(read_bhd_entry_headers(path.read_bytes()), bdt_path)
+                    elif cls.BINDER_RE.match(name):
+                        catalog._add_binder_tpfs(Binder.from_path(path), path)
+                except Exception as ex:
+                    _LOGGER.warning(f"Could not index textures in '{path}'. Error: {ex}")
+        return catalog
+
+    def get_tpf_source(
+        self, texture_stem: str, prefer_hi_res=True
+    ) -> tuple[Path, str, BDTEntrySource | None] | None:
+        """Get `(file_path, entry_path, bdt_source)` of TPF containing `texture_stem`, or `None` if not cataloged.
+
+        `entry_path` is empty for loose TPFs, and `bdt_source` is only given for TPFs in split BDT files. If the texture
+        has both hi-res and low-res sources, `prefer_hi_res` chooses between them.
+        """
+        if prefer_hi_res:
+            source_index = self.textures.get(texture_stem, self.lo_res_textures.get(texture_stem))
+        else:
+            source_index = self.lo_res_textures.get(texture_stem, self.textures.get(texture_stem))
+        if source_index is None:
+            return None
+        relative_path, entry_path, data_offset, data_size, entry_flags = self.tpf_sources[source_index]
+        if not self._is_file_current(relative_path):
+            return None
+        file_path = self.game_root / relative_path
+        if data_offset < 0:
+            return file_path, entry_path, None
+        entry_header = BinderEntryHeader(
+            flags=entry_flags, compressed_size=data_size, path=entry_path, data_offset=data_offset
+        )
+        return file_path, entry_path, BDTEntrySource(file_path, entry_header)
+
+    def _is_file_current(self, relative_path: str) -> bool:
+        if relative_path in self._checked_files:
+            return self._checked_files[relative_path]
+        if self.project_root and (self.project_root / relative_path).is_file():
+            # Project file takes precedence. Leave it to normal discovery.
+            is_current = False
+        else:
+            try:
+                stat = (self.game_root / relative_path).stat()
+            except OSError:
+                is_current = False
+            else:
+                is_current = self.files.get(relative_path) == [stat.st_mtime_ns, stat.st_size]
+            if not is_current:
+                _LOGGER.warning(f"Texture source catalog is out of date for file: {relative_path}")
+        self._checked_files[relative_path] = is_current
+        return is_current
+
+    def _add_file(self, path: Path) -> str:
+        relative_path = path.relative_to(self.game_root).as_posix()
+        stat = path.stat()
+        self.files[relative_path] = [stat.st_mtime_ns, stat.st_size]
+        return relative_path
+
+    def _add_tpf(self, tpf: TPF, path: Path, entry_path="", data_offset=-1, data_size=-1, entry_flags=-1):
+        source_index = len(self.tpf_sources)
+        self.tpf_sources.append([self._add_file(path), entry_path, data_offset, data_size, entry_flags])
+        textures = self.lo_res_textures if self.LO_RES_RE.match(path.name) else self.textures
+        for texture in tpf.textures:
+            # TODO: Handle duplicate textures/overwrites. Currently ignoring duplicates.
+            textures.setdefault(texture.stem.lower(), source_index)
+
+    def _add_bdt_tpfs(self, entry_headers: list[BinderEntryHeader] | None, bdt_path: Path):
+        if entry_headers is None or not bdt_path.is_file():
+            return
+        for entry_header in entry_headers:
+            if not entry_header.path:
+                continue
+            source = BDTEntrySource(bdt_path, entry_header)
+            if TPF_RE.match(source.name):
+                self._add_tpf(
+                    TPF.from_binder_entry(source.read_entry()),
+                    bdt_path,
+                    entry_path=entry_header.path,
+                    data_offset=entry_header.data_offset,
+                    data_size=entry_header.compressed_size,
+                    entry_flags=entry_header.flags,
+                )
+
+    def _add_binder_tpfs(self, binder: Binder, binder_path: Path):
+        for tpf_entry in binder.find_entries_matching_name(TPF_RE):
+            self._add_tpf(TPF.from_binder_entry(tpf_entry), binder_path, entry_path=tpf_entry.path)
+        for chrtpfbhd_entry in binder.find_entries_matching_name(CHRTPFBHD_RE):
+            bdt_path = binder_path.parent / f"{chrtpfbhd_entry.name.split('.')[0]}.chrtpfbdt"
+            self._add_bdt_tpfs(read_bhd_entry_headers(chrtpfbhd_entry.data), bdt_path)
+
+
 class ImageImportManager:
     """Manages various texture sources across some import context, ensuring that Binders and TPFs are only loaded
     when requested for the first time during the operation.
@@ -42,7 +306,11 @@ class ImageImportManager:
     _binder_paths: dict[str, Path]
 
     # Maps TPF stems to file paths or Binder entries we are aware of, but have NOT yet loaded into TPF textures (below).
-    _pending_tpf_sources: dict[str, Path | BinderEntry]
+    # Entries of split TPFBHD Binders are only indexed from their BHD headers until they are loaded.
+    _pending_tpf_sources: dict[str, Path | BinderEntry | BDTEntrySource]
+
+    # Maps TPF stems of pending Binder entries to the path of their Binder, for session caching.
+    _pending_tpf_binder_paths: dict[str, Path]
 
     # Maps TPF stems to opened TPF textures.
     _tpf_textures: dict[str, TPFTexture]
@@ -56,22 +324,64 @@ class ImageImportManager:
     # Holds TPF stems that have already been opened and scanned, so they aren't checked again.
     _scanned_tpf_sources: set[str]
 
+    # Maximum size of session-level texture source cache (shared by all managers), from settings.
+    _session_cache_max_size: int
+
+    # Game-wide texture source catalog, if one has been built for the current game root (and is enabled).
+    _catalog: TextureSourceCatalog | None
+    # Texture discovery calls that are skipped while the catalog is in use, and only run if the catalog misses.
+    _deferred_discoveries: list[tp.Callable[[], None]]
+    # Resolution preference of the most recent `find_flver_textures()` call, used for catalog lookups.
+    _prefer_hi_res: bool
+
+    # Counters for catalog and multi-DDS TPF prefix resolution, reported by `log_stats()`.
+    _catalog_hits: int
+    _prefix_hits: int  # texture found in a TPF whose stem is a prefix of the texture (or model) stem
+    _prefix_misses: int  # texture not found in any prefix-matching TPF
+    _wasted_tpf_loads: int  # prefix-matching TPFs loaded that did not contain the texture
+
     def __init__(self, operator: LoggingOperator, context: bpy.types.Context):
         self.operator = operator
         self.context = context
 
         self._binder_paths = {}
         self._pending_tpf_sources = {}  # NOTE: keys are all lower case
+        self._pending_tpf_binder_paths = {}  # NOTE: keys are all lower case
         self._tpf_textures = {}  # NOTE: keys are all lower case
         self._scanned_binder_paths = set()
         self._scanned_tpf_sources = set()  # NOTE: all lower case
 
+        settings = operator.settings(context)
+        self._session_cache_max_size = settings.texture_session_cache_max_mb * 1024 * 1024
+        self._catalog = TextureSourceCatalog.from_settings(settings)
+        self._deferred_discoveries = []
+        self._prefer_hi_res = True
+
+        self._catalog_hits = 0
+        self._prefix_hits = 0
+        self._prefix_misses = 0
+        self._wasted_tpf_loads = 0
+
     def find_flver_textures(self, flver_source_path: Path, flver_binder: Binder = None, prefer_hi_res=True):
         """Register known game Binders/TPFs to be opened as needed.
 
         `flver_source_path` is the path to the Binder file containing the FLVER, or loose FLVER file.
         `flver_binder` is the Binder object that contains the FLVER, if it has already been opened.
+
+        If a texture source catalog is in use, only `flver_binder` is scanned now, and all other discovery is deferred
+        until a texture is not found in the catalog.
         """
+        if self._catalog:
+            self._prefer_hi_res = prefer_hi_res
+            if flver_binder:
+                self.scan_binder_textures(flver_binder)
+            self._deferred_discoveries.append(
+                functools.partial(self._discover_flver_textures, flver_source_path, flver_binder, prefer_hi_res)
+            )
+            return
+        self._discover_flver_textures(flver_source_path, flver_binder, prefer_hi_res)
+
+    def _discover_flver_textures(self, flver_source_path: Path, flver_binder: Binder = None, prefer_hi_res=True):
         source_name = Path(flver_source_path).name.removesuffix(".dcx")  # e.g. 'c1234.chrbnd' or 'm1234B0A10.flver'
         model_stem = source_name.split(".")[0]
         source_dir = flver_source_path.parent
@@ -132,8 +442,8 @@ class ImageImportManager:
                 if c9_chrbnd_path not in self._scanned_binder_paths and c9_chrbnd_path.is_file():
                     # Found cXXX9 CHRBND. Mark it as scanned now, then recur this method on it.
                     self._scanned_binder_paths.add(c9_chrbnd_path)
-                    c9_chrbnd = Binder.from_path(c9_chrbnd_path)
-                    self.find_flver_textures(c9_chrbnd_path, flver_binder=c9_chrbnd)
+                    c9_chrbnd = self._read_binder(c9_chrbnd_path)
+                    self._discover_flver_textures(c9_chrbnd_path, flver_binder=c9_chrbnd)
 
         # EQUIPMENT
         elif source_name.endswith(".partsbnd"):
@@ -171,14 +481,14 @@ class ImageImportManager:
         piece in m12 uses a texture named `m10_wall_01`, this method will be called with `map_area_dir` set to
         `{game_directory}/map/m10`.
         """
+        if self._catalog:
+            self._deferred_discoveries.append(functools.partial(self._find_map_area_tpfs, map_area_dir))
+            return
         self._find_map_area_tpfs(map_area_dir)
 
     def scan_binder_textures(self, binder: Binder):
         """Register all TPFs in an arbitrary opened Binder (usually the one containing the FLVER) as pending sources."""
-        for tpf_entry in binder.find_entries_matching_name(TPF_RE):
-            tpf_entry_stem = lower_stem(tpf_entry)
-            if tpf_entry_stem not in self._scanned_tpf_sources:
-                self._pending_tpf_sources.setdefault(tpf_entry_stem, tpf_entry)
+        self._register_binder_tpf_entries(binder)
 
     def get_flver_texture(self, texture_stem: str, model_name: str = "") -> TPFTexture:
         """Find texture from its stem across all registered/loaded texture file sources.
@@ -205,21 +515,39 @@ class ImageImportManager:
                 )
                 raise
 
-        # Search for a multi-DDS TPF whose stem is a prefix of the requested texture.
-        for tpf_stem in tuple(self._pending_tpf_sources):  # tpf keys may be popped when textures are loaded
-            if texture_stem.startswith(tpf_stem) or (model_name and model_name.startswith(tpf_stem)):
-                # TODO: Could also enforce that the texture stem only has two extra characters (e.g. '_n' or '_s').
-                self._load_tpf(tpf_stem)
-                try:
-                    return self._tpf_textures[texture_stem]
-                except KeyError:
-                    # TODO: Not sure if this should ever be allowed to happen (conflicting texture prefixes??).
-                    continue
+        # Search for a multi-DDS TPF whose stem is a prefix of the requested texture (or model), longest first.
+        for tpf_stem in self._get_pending_prefix_tpf_stems(texture_stem, model_name):
+            # TODO: Could also enforce that the texture stem only has two extra characters (e.g. '_n' or '_s').
+            self._load_tpf(tpf_stem)
+            try:
+                texture = self._tpf_textures[texture_stem]
+            except KeyError:
+                # TODO: Not sure if this should ever be allowed to happen (conflicting texture prefixes??).
+                self._wasted_tpf_loads += 1
+                continue
+            self._prefix_hits += 1
+            return texture
+
+        if self._catalog:
+            # Only checked after the sources already registered for this FLVER (e.g. its own Binder's TPFs), so that the
+            # catalog only replaces the deferred discovery below and never shadows a local texture with the same stem.
+            texture = self._get_catalog_texture(texture_stem)
+            if texture is not None:
+                self._catalog_hits += 1
+                return texture
+
+        if self._deferred_discoveries:
+            # Catalog miss. Run the normal discovery that was skipped in favor of the catalog, then search again.
+            deferred_discoveries, self._deferred_discoveries = self._deferred_discoveries, []
+            for discover in deferred_discoveries:
+                discover()
+            return self.get_flver_texture(texture_stem, model_name)
+
+        self._prefix_misses += 1
 
         if self._binder_paths:
             # Last resort: scan all pending Binders for new TPFs. We typically cannot tell which Binder has the texture.
-            # TODO: I could at least check JUST the BHD headers of TPFBHD split Binders before loading them.
-
+            # This is cheap for TPFBHD split Binders, as only their BHD headers are read (see `_load_binder`).
             for binder_stem in tuple(self._binder_paths):  # binder keys may be popped when textures are loaded
                 self._load_binder(binder_stem)
 
@@ -228,26 +556,149 @@ class ImageImportManager:
 
         raise KeyError(f"Could not find texture '{texture_stem}' in any registered Binders or TPFs.")
 
+    def log_stats(self):
+        """Report multi-DDS TPF prefix resolution counters to the operator log."""
+        if self._catalog:
+            self.operator.info(f"Texture source catalog: {self._catalog_hits} hits.")
+        self.operator.info(
+            f"Texture TPF prefix resolution: {self._prefix_hits} hits, {self._prefix_misses} misses, "
+            f"{self._wasted_tpf_loads} wasted TPF loads. Loaded {len(self._scanned_tpf_sources)} TPFs, "
+            f"{len(self._pending_tpf_sources)} still pending."
+        )
+
+    def _get_catalog_texture(self, texture_stem: str) -> TPFTexture | None:
+        """Load the TPF recorded for `texture_stem` in the catalog (unpacking all its textures) and return the texture.
+
+        Returns `None` if the texture is not cataloged or its source file has changed since indexing.
+        """
+        source = self._catalog.get_tpf_source(texture_stem, self._prefer_hi_res)
+        if source is None:
+            return None
+        file_path, entry_path, bdt_source = source
+        if bdt_source:
+            tpf = self._read_bdt_tpf(bdt_source)
+        elif entry_path:
+            tpf = self._read_binder_tpf(self._read_binder(file_path).find_entry_path(entry_path), file_path)
+        else:
+            tpf = self._read_tpf(file_path)
+
+        tpf_stem = lower_stem(Path(entry_path.replace("\\", "/"))) if entry_path else lower_stem(file_path)
+        self._pending_tpf_sources.pop(tpf_stem, None)
+        self._scanned_tpf_sources.add(tpf_stem)
+        for texture in tpf.textures:
+            # TODO: Handle duplicate textures/overwrites. Currently ignoring duplicates.
+            self._tpf_textures.setdefault(texture.stem.lower(), texture)
+        return self._tpf_textures.get(texture_stem)
+
+    def _get_pending_prefix_tpf_stems(self, texture_stem: str, model_name: str) -> list[str]:
+        """Get pending TPF stems that are prefixes of `texture_stem` or `model_name`, longest first.
+
+        Rather than testing every pending TPF stem with `startswith()`, we probe the pending source dictionary with
+        every prefix of the (short) stems, which is independent of the number of pending sources.
+        """
+        candidates = []
+        for stem in (texture_stem, model_name):
+            for i in range(len(stem), 0, -1):
+                prefix = stem[:i]
+                if prefix in self._pending_tpf_sources and prefix not in candidates:
+                    candidates.append(prefix)
+        return candidates
+
     def _load_binder(self, binder_stem):
         binder_path = self._binder_paths.pop(binder_stem)
         self._scanned_binder_paths.add(binder_path)
-        binder = Binder.from_path(binder_path)
+        if binder_path.name.endswith(".tpfbhd") and self._index_tpfbhd_headers(binder_path):
+            return  # TPF sources indexed without touching BDT data
+        self._register_binder_tpf_entries(self._read_binder(binder_path))
+
+    def _register_binder_tpf_entries(self, binder: Binder):
         for tpf_entry in binder.find_entries_matching_name(TPF_RE):
             tpf_entry_stem = lower_stem(tpf_entry)
+            if tpf_entry_stem not in self._scanned_tpf_sources and tpf_entry_stem not in self._pending_tpf_sources:
+                self._pending_tpf_sources[tpf_entry_stem] = tpf_entry
+                if binder.path:
+                    self._pending_tpf_binder_paths[tpf_entry_stem] = binder.path
+
+    def _index_tpfbhd_headers(self, tpfbhd_path: Path) -> bool:
+        """Register TPF entries of split TPFBHD Binder as pending sources by reading ONLY its BHD entry headers.
+
+        Returns `False` (and indexes nothing) if the BHD cannot be read this way (e.g. DCX-compressed or missing BDT),
+        in which case the caller should fall back to loading the full Binder.
+        """
+        bdt_path = tpfbhd_path.with_name(tpfbhd_path.name.replace(".tpfbhd", ".tpfbdt"))
+        if not bdt_path.is_file():
+            return False
+        entry_headers = get_session_cached_texture_source(
+            get_session_texture_cache_key(tpfbhd_path, "bhd"),
+            lambda: (read_bhd_entry_headers(tpfbhd_path.read_bytes()), 0),  # negligible size
+            self._session_cache_max_size,
+        )
+        if entry_headers is None:
+            return False
+
+        for entry_header in entry_headers:
+            if not entry_header.path:
+                continue
+            source = BDTEntrySource(bdt_path, entry_header)
+            if not TPF_RE.match(source.name):
+                continue
+            tpf_entry_stem = lower_stem(source)
             if tpf_entry_stem not in self._scanned_tpf_sources:
-                self._pending_tpf_sources.setdefault(tpf_entry_stem, tpf_entry)
+                self._pending_tpf_sources.setdefault(tpf_entry_stem, source)
+        return True
 
     def _load_tpf(self, tpf_stem):
         tpf_path_or_entry = self._pending_tpf_sources.pop(tpf_stem)
         self._scanned_tpf_sources.add(tpf_stem)
-        if isinstance(tpf_path_or_entry, BinderEntry):
-            tpf = TPF.from_binder_entry(tpf_path_or_entry)
+        if isinstance(tpf_path_or_entry, BDTEntrySource):
+            tpf = self._read_bdt_tpf(tpf_path_or_entry)
+        elif isinstance(tpf_path_or_entry, BinderEntry):
+            tpf = self._read_binder_tpf(tpf_path_or_entry, self._pending_tpf_binder_paths.pop(tpf_stem, None))
         else:
-            tpf = TPF.from_path(tpf_path_or_entry)
+            tpf = self._read_tpf(tpf_path_or_entry)
         for texture in tpf.textures:
             # TODO: Handle duplicate textures/overwrites. Currently ignoring duplicates.
             self._tpf_textures.setdefault(texture.stem.lower(), texture)
 
+    def _read_tpf(self, tpf_path: Path) -> TPF:
+        """Read loose TPF, or get it from the session cache."""
+        return get_session_cached_texture_source(
+            get_session_texture_cache_key(tpf_path, "tpf"),
+            lambda: self._get_tpf_and_size(TPF.from_path(tpf_path)),
+            self._session_cache_max_size,
+        )
+
+    def _read_binder_tpf(self, tpf_entry: BinderEntry, binder_path: Path | None) -> TPF:
+        """Read TPF from Binder entry, or get it from the session cache (if `binder_path` is known)."""
+        return get_session_cached_texture_source(
+            get_session_texture_cache_key(binder_path, tpf_entry.path),
+            lambda: self._get_tpf_and_size(TPF.from_binder_entry(tpf_entry)),
+            self._session_cache_max_size,
+        )
+
+    def _read_bdt_tpf(self, bdt_source: BDTEntrySource) -> TPF:
+        """Read TPF from split BDT, or get it from the session cache."""
+        return get_session_cached_texture_source(
+            get_session_texture_cache_key(bdt_source.bdt_path, bdt_source.entry_header.data_offset),
+            lambda: self._get_tpf_and_size(TPF.from_binder_entry(bdt_source.read_entry())),
+            self._session_cache_max_size,
+        )
+
+    def _read_binder(self, binder_path: Path) -> Binder:
+        """Read Binder (e.g. TEXBND or CHRBND), or get it from the session cache."""
+
+        def load_binder():
+            binder = Binder.from_path(binder_path)
+            return binder, sum(len(entry.data) for entry in binder.entries)
+
+        return get_session_cached_texture_source(
+            get_session_texture_cache_key(binder_path, "binder"), load_binder, self._session_cache_max_size
+        )
+
+    @staticmethod
+    def _get_tpf_and_size(tpf: TPF) -> tuple[TPF, int]:
+        return tpf, sum(len(texture.data) for texture in tpf.textures)
+
     def _find_map_tpfs(self, map_area_block_dir: Path):
         """Find 'mAA' directory adjacent to given 'mAA_BB_CC_DD' directory and find all TPFBHD split Binders in it.
 
@@ -282,7 +733,7 @@ class ImageImportManager:
                 # Loose map multi-texture TPF (usually 'mXX_9999.tpf'). We unpack all textures in it immediately.
                 tpf_stem = lower_stem(tpf_or_tpfbhd_path)
                 if tpf_stem not in self._scanned_tpf_sources:
-                    tpf = TPF.from_path(tpf_or_tpfbhd_path)
+                    tpf = self._read_tpf(tpf_or_tpfbhd_path)
                     for texture in tpf.textures:
                         # TODO: Handle duplicate textures/overwrites. Currently ignoring duplicates.
                         self._tpf_textures.setdefault(texture.stem.lower(), texture)
@@ -321,23 +772,30 @@ class ImageImportManager:
             _LOGGER.warning(f"Could not find expected CHRTPFBDT file for '{chrbnd.path}' at {tpfbdt_path}.")
             return
 
-        tpfbxf = Binder.from_bytes(tpfbhd_entry.data, bdt_data=tpfbdt_path.read_bytes())
-        for tpf_entry in tpfbxf.find_entries_matching_name(TPF_RE):
+        entry_headers = read_bhd_entry_headers(tpfbhd_entry.data)
+        if entry_headers is None:
+            tpfbxf = Binder.from_bytes(tpfbhd_entry.data, bdt_data=tpfbdt_path.read_bytes())
+            sources = tpfbxf.find_entries_matching_name(TPF_RE)
+        else:
+            # Only BHD headers are read. Entry data is read from the BDT only if needed.
+            sources = [BDTEntrySource(tpfbdt_path, entry_header) for entry_header in entry_headers if entry_header.path]
+            sources = [source for source in sources if TPF_RE.match(source.name)]
+        for tpf_source in sources:
             # These are very likely to be used by the FLVER, but we still queue them up rather than open them now.
-            tpf_stem = lower_stem(tpf_entry)
+            tpf_stem = lower_stem(tpf_source)
             if tpf_stem not in self._scanned_tpf_sources:
-                self._pending_tpf_sources.setdefault(tpf_stem, tpf_entry)
+                self._pending_tpf_sources.setdefault(tpf_stem, tpf_source)
 
     def _find_texbnd(self, source_dir: Path, model_stem: str, res: str):
         """Find character TPFs in a TEXBND next to the CHRBND. (Always DCX for games that use it.)"""
         texbnd_path = source_dir / f"{model_stem}{res}.texbnd.dcx"
         if texbnd_path not in self._scanned_binder_paths and texbnd_path.is_file():
             self._scanned_binder_paths.add(texbnd_path)
-            texbnd = Binder.from_path(texbnd_path)
+            texbnd = self._read_binder(texbnd_path)
             for tpf_entry in texbnd.find_entries_matching_name(TPF_RE):
                 # Multi-texture TPF; we unpack it now.
                 tpf_stem = lower_stem(tpf_entry)
-                texbnd_tpf = TPF.from_binder_entry(tpf_entry)
+                texbnd_tpf = self._read_binder_tpf(tpf_entry, texbnd_path)
                 self._scanned_tpf_sources.add(tpf_stem)
                 for texture in texbnd_tpf.textures:
                     self._tpf_textures.setdefault(texture.stem.lower(), texture)
@@ -348,14 +806,14 @@ class ImageImportManager:
         if "common_body" not in self._scanned_tpf_sources and common_body_path.is_file():
             # Multi-texture TPF; we unpack it now.
             self._scanned_tpf_sources.add("common_body")
-            common_body = TPF.from_path(common_body_path)
+            common_body = self._read_tpf(common_body_path)
             for texture in common_body.textures:
                 self._tpf_textures.setdefault(texture.stem.lower(), texture)
 
     def _find_parts_common_tpfs(self, source_dir: Path):
         """Find and immediately load all textures inside multi-texture 'Common' TPFs (e.g. player skin)."""
         for common_tpf_path in source_dir.glob("Common*.tpf"):
-            common_tpf = TPF.from_path(common_tpf_path)
+            common_tpf = self._read_tpf(common_tpf_path)
             common_tpf_stem = lower_stem(common_tpf_path)
             self._scanned_tpf_sources.add(common_tpf_stem)
             for texture in common_tpf.textures:
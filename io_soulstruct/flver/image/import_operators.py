@@ -2,6 +2,7 @@ from __future__ import annotations
 
 __all__ = [
     "ImportTextures",
+    "IndexGameTextures",
     "batch_get_tpf_texture_png_data",
     "batch_get_tpf_texture_tga_data",
 ]
@@ -9,16 +10,19 @@ __all__ = [
 import logging
 import re
 import tempfile
+import time
 import typing as tp
 from pathlib import Path
 
 import bpy
-from io_soulstruct.utilities.operators import LoggingImportOperator
+from io_soulstruct.utilities.operators import LoggingOperator, LoggingImportOperator
 from soulstruct.base.textures.dds import DDS
 from soulstruct.base.textures.texconv import texconv
 from soulstruct.containers.tpf import TPF, batch_get_tpf_texture_png_data, batch_get_tpf_texture_tga_data, TPFPlatform
 
 from io_soulstruct.general.enums import BlenderImageFormat
+from .image_import_manager import TextureSourceCatalog
+from .texture_cache import TextureContentCache
 from .types import *
 
 
@@ -39,7 +43,8 @@ class ImportTextures(LoggingImportOperator):
     bl_label = "Import Texture"
     bl_description = (
         "Import an image file (converting DDS to TGA/PNG) or all image files inside a TPF container into Blender, and "
-        "optionally set it to selected shader Image Texture nodes. Does not save any files to disk"
+        "optionally set it to selected shader Image Texture nodes. Does not save any files to disk, other than new "
+        "conversions added to the texture content cache (if enabled)"
     )
 
     filename_ext = ".dds"
@@ -108,11 +113,19 @@ class ImportTextures(LoggingImportOperator):
         deswizzle_platform = settings.game_config.swizzle_platform
 
         texture_collection = DDSTextureCollection()
+        content_cache = TextureContentCache.from_settings(settings)  # could be None
 
         for file_path in self.file_paths:
 
             if TPF_RE.match(file_path.name):
-                texture_collection |= self.import_tpf(file_path, settings.bl_image_format, deswizzle_platform)
+                texture_collection |= self.import_tpf(
+                    file_path,
+                    settings.bl_image_format,
+                    deswizzle_platform,
+                    content_cache,
+                    read_content_cache=settings.read_cached_images,
+                    write_content_cache=settings.write_cached_images,
+                )
             elif file_path.suffix == ".dds":
                 # Loose DDS file. (Must already be deswizzled and headerized.)
                 try:
@@ -126,6 +139,9 @@ class ImportTextures(LoggingImportOperator):
                 except Exception as ex:
                     self.warning(f"Could not import image file '{file_path.name}' into Blender: {ex}")
 
+        if content_cache:
+            content_cache.save()
+
         if not texture_collection:
             self.warning("No textures could be imported.")
             return {"CANCELLED"}
@@ -235,7 +251,12 @@ class ImportTextures(LoggingImportOperator):
         tpf_path: Path,
         image_format: BlenderImageFormat,
         deswizzle_platform: TPFPlatform,
+        content_cache: TextureContentCache | None = None,
+        read_content_cache=True,
+        write_content_cache=True,
     ) -> dict[str, DDSTexture]:
+        """Textures found in `content_cache` (if given and read) are not converted again, and new conversions are added
+        to it (if written)."""
         tpf = TPF.from_path(tpf_path)
         if self.image_node_assignment_mode == "SIMPLE_TEXTURE" and len(tpf.textures) > 1:
             self.info(
@@ -243,22 +264,56 @@ class ImportTextures(LoggingImportOperator):
             )
             return {}
 
-        if image_format == BlenderImageFormat.TARGA:
-            textures_image_data = batch_get_tpf_texture_tga_data(tpf.textures, deswizzle_platform)
-        elif image_format == BlenderImageFormat.PNG:
-            textures_image_data = batch_get_tpf_texture_png_data(tpf.textures, deswizzle_platform, fmt="rgba")
-        else:
-            raise ValueError(f"Unsupported image format: {image_format}")
-        self.info(f"Loaded {len(textures_image_data)} texture(s) from TPF: {tpf_path.name}")
+        # Each texture gets either a content cache path or (if the cache is disabled) newly converted image data.
+        content_cache_paths = {}  # type: dict[int, Path]
+        content_keys = {}  # type: dict[int, str]
+        if content_cache:
+            for i, texture in enumerate(tpf.textures):
+                content_keys[i] = key = content_cache.get_key(texture)
+                if not read_content_cache:
+                    continue
+                cached_path = content_cache.get_cached_image_path(key)
+                if cached_path:
+                    content_cache_paths[i] = cached_path
+        textures_to_convert = [i for i in range(len(tpf.textures)) if i not in content_cache_paths]
+
+        all_image_data = {}  # type: dict[int, bytes | None]
+        if textures_to_convert:
+            convert_textures = [tpf.textures[i] for i in textures_to_convert]
+            if image_format == BlenderImageFormat.TARGA:
+                textures_image_data = batch_get_tpf_texture_tga_data(convert_textures, deswizzle_platform)
+            elif image_format == BlenderImageFormat.PNG:
+                textures_image_data = batch_get_tpf_texture_png_data(convert_textures, deswizzle_platform, fmt="rgba")
+            else:
+                raise ValueError(f"Unsupported image format: {image_format}")
+            for i, image_data in zip(textures_to_convert, textures_image_data):
+                if content_cache and write_content_cache and image_data is not None:
+                    content_cache_paths[i] = content_cache.add_image_data(
+                        content_keys[i], tpf.textures[i].stem, image_data
+                    )
+                else:
+                    all_image_data[i] = image_data
+        self.info(
+            f"Loaded {len(tpf.textures)} texture(s) from TPF ({len(textures_to_convert)} converted): {tpf_path.name}"
+        )
 
         texture_images = {}
-        for texture, image_data in zip(tpf.textures, textures_image_data):
-            if image_data is None:
-                continue  # failed to convert this texture
+        for i, texture in enumerate(tpf.textures):
             try:
-                bl_image = DDSTexture.new_from_image_data(
-                    self, texture.stem.lower(), image_format, image_data, replace_existing=self.overwrite_existing
-                )
+                if i in content_cache_paths:
+                    bl_image = DDSTexture.new_from_cached_image_path(
+                        texture.stem.lower(),
+                        image_format,
+                        content_cache_paths[i],
+                        replace_existing=self.overwrite_existing,
+                        pack_image_data=True,  # all TPF/DDS imports are packed by this operator
+                    )
+                elif (image_data := all_image_data[i]) is not None:
+                    bl_image = DDSTexture.new_from_image_data(
+                        self, texture.stem.lower(), image_format, image_data, replace_existing=self.overwrite_existing
+                    )
+                else:
+                    continue  # failed to convert this texture
             except Exception as ex:
                 self.warning(f"Could not create Blender image from TPF texture '{texture.stem}': {ex}")
                 continue
@@ -322,3 +377,35 @@ class ImportTextures(LoggingImportOperator):
             # NOT packed into `.blend` file.
             self.info(f"Loaded image texture file: {image_path.name}")
         return {image_path.stem: DDSTexture(bl_image)}
+
+
+class IndexGameTextures(LoggingOperator):
+    """Scan every TPF in the game directory and write a catalog mapping texture stems to their exact source, which is
+    used by all FLVER/MSB imports to find textures without any directory scanning."""
+    bl_idname = "soulstruct.index_game_textures"
+    bl_label = "Index Game Textures"
+    bl_description = (
+        "Build a catalog of every texture in the game directory (saved in the image cache directory) so that FLVER "
+        "textures can be found instantly on import. Slow, but only needs to be done once per game installation"
+    )
+
+    @classmethod
+    def poll(cls, context):
+        settings = cls.settings(context)
+        return settings.game_root_path is not None and bool(settings.str_image_cache_directory)
+
+    def execute(self, context):
+        settings = self.settings(context)
+        catalog_path = TextureSourceCatalog.get_catalog_path(settings)
+        if not catalog_path:
+            return self.error("Game and image cache directory must be set to index game textures.")
+
+        t = time.perf_counter()
+        catalog = TextureSourceCatalog.build(settings.game_root_path)
+        catalog.write(catalog_path)
+        self.info(
+            f"Indexed {len(catalog.textures)} textures and {len(catalog.lo_res_textures)} low-res textures in "
+            f"{len(catalog.tpf_sources)} TPFs in "
+            f"{time.perf_counter() - t:.2f} s. Wrote catalog: {catalog_path}"
+        )
+        return {"FINISHED"}
@@ -51,10 +51,30 @@ class DDSTextureProps(bpy.types.PropertyGroup):
         max=16,
     )
 
+    # Internal tracking of the last export of this texture into map area TPFBHDs, so unchanged textures can be skipped.
+    export_pixel_hash: bpy.props.StringProperty(
+        name="Export Pixel Hash",
+        description="Hash of image pixels when this texture was last exported into map area TPFBHDs (INTERNAL)",
+        default="",
+    )
+
+    export_entry_hash: bpy.props.StringProperty(
+        name="Export Entry Hash",
+        description="Hash of TPFBHD entry data written when this texture was last exported (INTERNAL)",
+        default="",
+    )
+
 
 class TextureExportSettings(bpy.types.PropertyGroup):
     """Contains settings and enums that determine DDS compression type for each FLVER texture slot type."""
 
+    skip_unchanged_map_textures: bpy.props.BoolProperty(
+        name="Skip Unchanged Map Textures",
+        description="Do not re-encode map textures whose pixels have not changed since they were last exported into "
+                    "map area TPFBHDs that still contain that export, and only rewrite TPFBHDs whose entries changed",
+        default=True,
+    )
+
     overwrite_existing_map_textures: bpy.props.BoolProperty(
         name="Overwrite Existing Map Textures",
         description="Overwrite existing map TPF textures with the same name as exported textures. If False, an error "
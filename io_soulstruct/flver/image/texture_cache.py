@@ -0,0 +1,154 @@
+"""Persistent on-disk cache of converted FLVER texture images, keyed by the content of their original DDS data."""
+from __future__ import annotations
+
+__all__ = [
+    "TextureContentCache",
+]
+
+import hashlib
+import logging
+import time
+import typing as tp
+from pathlib import Path
+
+from soulstruct.utilities.files import read_json, write_json
+
+if tp.TYPE_CHECKING:
+    from soulstruct.containers.tpf import TPFTexture, TPFPlatform
+    from io_soulstruct.general.enums import BlenderImageFormat
+    from io_soulstruct.general.properties import SoulstructSettings
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TextureContentCache:
+    """Content-addressed cache of converted texture images with a size-bounded LRU eviction policy.
+
+    The stem-based image cache can't tell two different textures with the same stem apart (e.g. a modded texture and
+    its vanilla original) and goes stale silently when a TPF changes. This cache stores each converted image under a
+    hash of everything that determines its bytes, so unchanged textures are never converted twice and changed textures
+    are never served from an old conversion.
+
+    Index maps each content key to a `[texture_stem, size_in_bytes, last_access_time]` list. The stem is only recorded
+    for the user's benefit when inspecting the index; it plays no part in lookups.
+    """
+
+    DIRECTORY_NAME: tp.ClassVar[str] = ".content_cache"
+    INDEX_NAME: tp.ClassVar[str] = "index.json"
+    # Bump this if the conversion pipeline changes in a way that should invalidate all existing entries.
+    CACHE_VERSION: tp.ClassVar[int] = 1
+
+    directory: Path
+    image_format: BlenderImageFormat
+    deswizzle_platform: TPFPlatform | None
+    max_size: int
+
+    _index: dict[str, list]
+    _index_changed: bool
+
+    def __init__(
+        self,
+        directory: Path,
+        image_format: BlenderImageFormat,
+        deswizzle_platform: TPFPlatform | None,
+        max_size: int,
+    ):
+        self.directory = directory
+        self.image_format = image_format
+        self.deswizzle_platform = deswizzle_platform
+        self.max_size = max_size
+        self._index = {}
+        self._index_changed = False
+        self._read_index()
+
+    @classmethod
+    def from_settings(cls, settings: SoulstructSettings) -> TextureContentCache | None:
+        """Returns `None` if the cache is disabled or no image cache directory is set."""
+        if not settings.use_texture_content_cache or not settings.str_image_cache_directory:
+            return None
+        return cls(
+            directory=settings.image_cache_directory / cls.DIRECTORY_NAME,
+            image_format=settings.bl_image_format,
+            deswizzle_platform=settings.game_config.swizzle_platform,
+            max_size=settings.texture_content_cache_max_mb * 1024 * 1024,
+        )
+
+    @property
+    def index_path(self) -> Path:
+        return self.directory / self.INDEX_NAME
+
+    @property
+    def total_size(self) -> int:
+        return sum(entry[1] for entry in self._index.values())
+
+    def get_key(self, texture: TPFTexture) -> str:
+        """Hash everything that determines the converted image bytes."""
+        h = hashlib.blake2b(digest_size=20)
+        h.update(
+            f"{self.CACHE_VERSION}|{self.image_format.value}|{self.deswizzle_platform}|{texture.format}|".encode()
+        )
+        h.update(texture.data)
+        return h.hexdigest()
+
+    def get_path(self, key: str) -> Path:
+        return self.directory / f"{key}{self.image_format.get_suffix()}"
+
+    def get_cached_image_path(self, key: str) -> Path | None:
+        """Return path of cached image for `key` and mark it as recently used, or `None` if it is not cached."""
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        path = self.get_path(key)
+        if not path.is_file():
+            # Deleted externally. Forget it.
+            self._index.pop(key)
+            self._index_changed = True
+            return None
+        entry[2] = time.time()
+        self._index_changed = True
+        return path
+
+    def add_image_data(self, key: str, texture_stem: str, image_data: bytes) -> Path:
+        """Write converted `image_data` for `key` into the cache and return its path."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.get_path(key)
+        path.write_bytes(image_data)
+        self._index[key] = [texture_stem, len(image_data), time.time()]
+        self._index_changed = True
+        return path
+
+    def save(self):
+        """Evict least recently used images beyond `max_size` and write the index file, if anything has changed."""
+        if not self._index_changed:
+            return
+        self._evict()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        write_json(self.index_path, self._index)
+        self._index_changed = False
+
+    def _read_index(self):
+        if not self.index_path.is_file():
+            return
+        try:
+            index = read_json(self.index_path)
+        except Exception as ex:
+            # Corrupt index. Files will be rewritten as needed and orphans will never be served.
+            _LOGGER.warning(f"Could not read texture content cache index. Starting a new one. Error: {ex}")
+            self._index_changed = True
+            return
+        for key, entry in index.items():
+            if isinstance(entry, list) and len(entry) == 3:
+                self._index[key] = entry
+
+    def _evict(self):
+        total_size = self.total_size
+        if total_size <= self.max_size:
+            return
+        evicted_count = 0
+        for key in sorted(self._index, key=lambda k: self._index[k][2]):
+            if total_size <= self.max_size:
+                break
+            total_size -= self._index.pop(key)[1]
+            self.get_path(key).unlink(missing_ok=True)
+            evicted_count += 1
+        _LOGGER.info(f"Evicted {evicted_count} least recently used images from texture content cache.")
@@ -5,11 +5,15 @@ __all__ = [
     "DDSTextureCollection",
 ]
 
+import hashlib
+import struct
 import tempfile
 import typing as tp
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import bpy
+import numpy as np
 from soulstruct.containers import Binder, BinderEntry
 from soulstruct.containers.tpf import TPF, TPFTexture, TPFPlatform, TextureType
 from soulstruct.darksouls1r.maps.map_area_texture_manager import MapAreaTextureManager
@@ -19,6 +23,7 @@ from soulstruct.base.textures import *
 from io_soulstruct.exceptions import UnsupportedGameError, SoulstructTypeError, TextureExportError
 from io_soulstruct.utilities import *
 from .enums import *
+from .image_import_manager import read_bhd_entry_headers
 from .properties import *
 
 
@@ -174,6 +179,132 @@ class DDSTexture:
 
         return bl_image
 
+    @classmethod
+    def new_from_cached_image_path(
+        cls,
+        name: str,
+        image_format: BlenderImageFormat,
+        image_path: Path,
+        replace_existing=False,
+        pack_image_data=False,
+    ) -> DDSTexture:
+        """Load an image file from the texture content cache into Blender as Image `name`, optionally replacing an
+        existing image with the same name.
+
+        Unlike `new_from_image_data()`, nothing is written to disk. If `pack_image_data` is False, the image is linked
+        to its content cache file, whose path only depends on the texture's content (so re-importing the texture
+        restores it at the same path if it is ever evicted).
+        """
+        image_name = f"{name}{image_format.get_suffix()}"
+        try:
+            if not replace_existing:
+                # Go straight to creation below.
+                raise KeyError
+            image = bpy.data.images[image_name]
+        except KeyError:
+            image = bpy.data.images.load(str(image_path))
+            image.name = image_name
+        else:
+            if image.packed_file:
+                image.unpack(method="REMOVE")  # discard old packed data without writing it anywhere
+            image.filepath_raw = str(image_path)
+            image.file_format = image_format
+            image.source = "FILE"
+            image.reload()
+        if pack_image_data:
+            image.pack()
+
+        bl_image = cls(image)
+        bl_image.dds_format = BlenderDDSFormat.SAME
+
+        return bl_image
+
+    @classmethod
+    def new_from_image_pixels(
+        cls,
+        name: str,
+        image_format: BlenderImageFormat,
+        width: int,
+        height: int,
+        pixels: np.ndarray,
+    ) -> DDSTexture:
+        """Create a new Blender Image directly from flat float RGBA `pixels` (bottom row first) and pack it.
+
+        Avoids the disk round-trip of `new_from_image_data()` when no image cache file is wanted.
+        """
+        image_name = f"{name}{image_format.get_suffix()}"
+        image = bpy.data.images.new(image_name, width, height, alpha=True)
+        image.pixels.foreach_set(pixels)
+        image.file_format = image_format
+        image.pack()  # embed in Blend file, as there is no file to link to
+
+        bl_image = cls(image)
+        bl_image.dds_format = BlenderDDSFormat.SAME
+
+        return bl_image
+
+    @staticmethod
+    def tga_to_pixels(tga_data: bytes) -> tuple[int, int, np.ndarray]:
+        """Decode uncompressed 24/32-bit true-color TGA data (as written by `texconv`) to `(width, height, pixels)`.
+
+        `pixels` is a flat float32 RGBA array in Blender's row order (bottom row first). Raises `ValueError` for any
+        other TGA type (e.g. RLE-compressed or color-mapped), so the caller can fall back to loading the file.
+        """
+        id_length, color_map_type, image_type = tga_data[0], tga_data[1], tga_data[2]
+        width = int.from_bytes(tga_data[12:14], "little")
+        height = int.from_bytes(tga_data[14:16], "little")
+        bits_per_pixel, descriptor = tga_data[16], tga_data[17]
+        if color_map_type != 0 or image_type != 2 or bits_per_pixel not in {24, 32}:
+            raise ValueError(
+                f"Unsupported TGA type for direct pixel decoding (type {image_type}, {bits_per_pixel} bits per pixel)."
+            )
+        channels = bits_per_pixel // 8
+        offset = 18 + id_length
+        bgra = np.frombuffer(tga_data, dtype=np.uint8, count=width * height * channels, offset=offset)
+        bgra = bgra.reshape((height, width, channels))
+        if descriptor & 0x20:
+            # Top-left origin. Blender wants bottom row first.
+            bgra = bgra[::-1]
+        rgba = np.empty((height, width, 4), dtype=np.float32)
+        rgba[..., :3] = bgra[..., 2::-1]
+        rgba[..., 3] = bgra[..., 3] if channels == 4 else 255
+        rgba *= 1.0 / 255.0
+        return width, height, rgba.ravel()
+
+    @staticmethod
+    def pixels_to_tga(width: int, height: int, pixels: np.ndarray) -> bytes:
+        """Encode flat float RGBA `pixels` (bottom row first, as in Blender) as uncompressed 32-bit TGA data.
+
+        Inverse of `tga_to_pixels()`. Pure NumPy, so it is safe to call from worker threads.
+        """
+        rgba = np.clip(pixels.reshape((height, width, 4)) * 255.0 + 0.5, 0.0, 255.0).astype(np.uint8)
+        bgra = rgba[..., (2, 1, 0, 3)]
+        # Image type 2 (true-color), 32 bits per pixel, 8 alpha bits, bottom-left origin (so no row flip needed).
+        header = struct.pack("<BBBHHBHHHHBB", 0, 0, 2, 0, 0, 0, 0, 0, width, height, 32, 0x08)
+        return header + bgra.tobytes()
+
+    def get_pixel_array(self) -> np.ndarray | None:
+        """Read all image pixels in one `foreach_get` call. Returns `None` for float images, which must be saved by
+        Blender instead to preserve their color space.
+
+        Must be called on the main thread.
+        """
+        if self.image.is_float:
+            return None
+        width, height = self.image.size
+        pixels = np.empty(width * height * 4, dtype=np.float32)
+        self.image.pixels.foreach_get(pixels)
+        return pixels
+
+    def get_export_pixel_hash(self, pixels: np.ndarray | None) -> str:
+        """Hash image pixels and all DDS export settings, for detecting unchanged textures on later exports."""
+        if pixels is None:
+            return ""  # float images are always exported
+        h = hashlib.blake2b(digest_size=20)
+        h.update(f"{tuple(self.image.size)}|{self.dds_format}|{self.mipmap_count}|".encode())
+        h.update(pixels.tobytes())
+        return h.hexdigest()
+
     def get_dds_format_str(self, find_same_format: tp.Callable[[str], str]) -> str:
         if self.dds_format == BlenderDDSFormat.NONE:
             raise TextureExportError(f"Blender image '{self.name}' has DDS format set to 'NONE'. Cannot get format.")
@@ -260,9 +391,14 @@ class DDSTextureCollection(dict[str, DDSTexture]):
         self,
         operator: LoggingOperator,
         find_same_format: tp.Callable[[str], str] = None,
+        pixel_arrays: dict[str, np.ndarray | None] = None,
     ) -> list[tuple[DDSTexture, bytes, str]]:
         """Batch convert all textures in this collection to DDS format using `texconv`.
 
+        Pixels are read from each Blender Image on the main thread with one `foreach_get` call (or taken from
+        `pixel_arrays`, if the caller already read them), then encoded and written as temporary TGA files in worker
+        threads. Float images are still saved by Blender.
+
         Returns DDS data and actual DDS format used.
 
         TODO: Need to de-headerize and/or re-swizzle DDS data for consoles.
@@ -272,9 +408,15 @@ class DDSTextureCollection(dict[str, DDSTexture]):
         configs = []  # type: list[TexconvConfig]
 
         textures = self.get_sorted_textures()
+        if pixel_arrays is None:
+            pixel_arrays = {}
+
+        def write_tga(_path: Path, _width: int, _height: int, _pixels: np.ndarray):
+            _path.write_bytes(DDSTexture.pixels_to_tga(_width, _height, _pixels))
 
-        with tempfile.TemporaryDirectory() as input_dir:
+        with tempfile.TemporaryDirectory() as input_dir, ThreadPoolExecutor() as pool:
             with tempfile.TemporaryDirectory() as output_dir:
+                tga_futures = []
                 for texture in textures:
                     dds_format = texture.get_dds_format_str(find_same_format)
                     if len(texture.pixels) <= 4:
@@ -282,9 +424,18 @@ class DDSTextureCollection(dict[str, DDSTexture]):
                         raise TextureExportError(
                             f"Blender image '{texture.name}' contains one or less pixels. Cannot export it."
                         )
-                    temp_image_path = Path(input_dir, texture.image.name)
-                    texture.image.filepath_raw = str(temp_image_path)
-                    texture.image.save()  # TODO: sometimes fails with 'No error'?
+                    if texture.stem in pixel_arrays:
+                        pixels = pixel_arrays[texture.stem]
+                    else:
+                        pixels = texture.get_pixel_array()
+                    if pixels is not None:
+                        temp_image_path = Path(input_dir, f"{texture.stem}.tga")
+                        width, height = texture.image.size
+                        tga_futures.append(pool.submit(write_tga, temp_image_path, width, height, pixels))
+                    else:
+                        temp_image_path = Path(input_dir, texture.image.name)
+                        texture.image.filepath_raw = str(temp_image_path)
+                        texture.image.save()  # TODO: sometimes fails with 'No error'?
                     is_dx10 = texture.dds_format[:3] in {"BC5", "BC7"}
                     texconv_config = TexconvConfig(
                         output_dir, dds_format, is_dx10, texture.mipmap_count, temp_image_path
@@ -293,6 +444,8 @@ class DDSTextureCollection(dict[str, DDSTexture]):
                     dds_formats.append(dds_format)
                     configs.append(texconv_config)
 
+                for future in tga_futures:
+                    future.result()  # raise any write errors
                 dds_data_list = batch_texconv_to_dds(configs)
 
         data_formats = []
@@ -472,6 +625,10 @@ class DDSTextureCollection(dict[str, DDSTexture]):
         re-alphabetize the entries, split them into new TPFBHDs (enforcing maximum file-per-BHD limit), and return them
         for the caller to save.
 
+        If `skip_unchanged_map_textures` is enabled, textures whose pixels and DDS settings are unchanged since they
+        were last exported (and whose TPFBHD entry still holds that export) are not converted again, and only TPFBHDs
+        whose entries have changed are returned. Returned TPFBHDs have their `path` set in `map_area_dir`.
+
         Does NOT save the TPFBHDs, to be consistent with the single-TPF and single-TPFBHD exporters above. Caller must
         do that.
         """
@@ -488,7 +645,9 @@ class DDSTextureCollection(dict[str, DDSTexture]):
         area_id = int(map_area[1:3])
         manager = MapAreaTextureManager.from_existing_area_directory(map_directory, area_id)
 
-        overwrite = context.scene.texture_export_settings.overwrite_existing_map_textures
+        export_settings = context.scene.texture_export_settings
+        overwrite = export_settings.overwrite_existing_map_textures
+        skip_unchanged = export_settings.skip_unchanged_map_textures
         textures = self.get_sorted_textures()
 
         def find_same_format(_stem: str) -> BlenderDDSFormat:
@@ -518,12 +677,36 @@ class DDSTextureCollection(dict[str, DDSTexture]):
                         f"name does not already exist in map area TPFBHDs."
                     )
 
+        # Read all pixels once (main thread) for both change detection and DDS conversion.
+        pixel_arrays = {dds_texture.stem: dds_texture.get_pixel_array() for dds_texture in textures}
+        pixel_hashes = {
+            dds_texture.stem: dds_texture.get_export_pixel_hash(pixel_arrays[dds_texture.stem])
+            for dds_texture in textures
+        }
+
+        changed_textures = DDSTextureCollection()
+        for dds_texture in textures:
+            props = dds_texture.texture_properties
+            pixel_hash = pixel_hashes[dds_texture.stem]
+            if skip_unchanged and pixel_hash and props.export_pixel_hash == pixel_hash:
+                existing_entry = manager.tpfbhd_entries.get(dds_texture.stem)
+                if existing_entry is not None and props.export_entry_hash == self._get_entry_hash(existing_entry):
+                    continue  # same image already exported into this TPFBHD entry
+            changed_textures.add(dds_texture)
+
+        if not changed_textures:
+            operator.info(f"All {len(self)} textures are unchanged in map area {map_area} TPFBHDs. Nothing to export.")
+            return []
+        if len(changed_textures) < len(self):
+            operator.info(f"Skipping {len(self) - len(changed_textures)} unchanged textures.")
+
         # Convert images to DDS.
-        operator.info(f"Converting {len(self)} Blender Images to DDS textures for map area {map_area}...")
-        dds_data_batch = self.to_dds_data_batch(operator, find_same_format)
+        operator.info(f"Converting {len(changed_textures)} Blender Images to DDS textures for map area {map_area}...")
+        dds_data_batch = changed_textures.to_dds_data_batch(operator, find_same_format, pixel_arrays)
 
         # Export into found/new entries.
         success_count = 0
+        changed_stems = set()
         for dds_texture, dds_data, dds_format in dds_data_batch:
             if not dds_data:
                 # Conversion of this texture failed. (Error already reported.)
@@ -540,8 +723,42 @@ class DDSTextureCollection(dict[str, DDSTexture]):
                 texture_type=TextureType.Texture,
             )
             manager.add_tpfbhd_texture(tpf_texture, overwrite=overwrite)
+            changed_stems.add(stem)
+
+            # Record what was exported, so an unchanged image can be skipped next time.
+            props = dds_texture.texture_properties
+            props.export_pixel_hash = pixel_hashes[stem]
+            props.export_entry_hash = self._get_entry_hash(manager.tpfbhd_entries[stem])
+
+        all_tpfbhds = manager.get_tpfbhds()
+        tpfbhds = []
+        for i, tpfbhd in enumerate(all_tpfbhds):
+            tpfbhd.path = map_area_dir / f"m{area_id:02}_{i:04}.tpfbhd"
+            if skip_unchanged and not self._is_tpfbhd_changed(tpfbhd, changed_stems):
+                continue
+            tpfbhds.append(tpfbhd)
 
-        tpfbhds = manager.get_tpfbhds()
-        operator.info(f"Exported {success_count} textures to {len(tpfbhds)} TPFBHDs in map area {map_area}.")
+        operator.info(
+            f"Exported {success_count} textures to {len(tpfbhds)} (of {len(all_tpfbhds)}) TPFBHDs in map area "
+            f"{map_area}."
+        )
 
         return tpfbhds
+
+    @staticmethod
+    def _get_entry_hash(entry: BinderEntry) -> str:
+        return hashlib.blake2b(entry.data, digest_size=20).hexdigest()
+
+    @staticmethod
+    def _is_tpfbhd_changed(tpfbhd: Binder, changed_stems: set[str]) -> bool:
+        """Check if `tpfbhd` contains any changed texture entries or has a different entry list than the existing BHD
+        at its path (read from its header only). BDT entries can't be patched in place, so changed binders are always
+        rewritten in full."""
+        if any(entry.minimal_stem in changed_stems for entry in tpfbhd.entries):
+            return True
+        if not tpfbhd.path.is_file():
+            return True
+        existing_headers = read_bhd_entry_headers(tpfbhd.path.read_bytes())
+        if existing_headers is None:
+            return True
+        return [header.path for header in existing_headers] != [entry.path for entry in tpfbhd.entries]
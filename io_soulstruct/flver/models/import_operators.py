@@ -118,6 +118,8 @@ class BaseFLVERImportOperator(LoggingImportOperator):
 
             self.post_process_flver(context, settings, import_settings, bl_flver)
 
+        if import_settings.import_textures:
+            image_import_manager.log_stats()
         self.info(f"Imported {len(flvers)} FLVER(s) in {time.perf_counter() - start_time:.3f} seconds.")
 
         # Select and frame view on (final) newly imported Mesh.
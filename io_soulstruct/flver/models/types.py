@@ -9,6 +9,7 @@ import math
 import re
 import time
 import typing as tp
+from concurrent.futures import ThreadPoolExecutor
 from enum import StrEnum
 from pathlib import Path
 
@@ -31,6 +32,7 @@ from io_soulstruct.flver.material.types import BlenderFLVERMaterial
 from io_soulstruct.general.enums import BlenderImageFormat
 from io_soulstruct.flver.image.import_operators import *
 from io_soulstruct.flver.image.image_import_manager import ImageImportManager
+from io_soulstruct.flver.image.texture_cache import TextureContentCache
 from io_soulstruct.flver.image.types import DDSTexture, DDSTextureCollection
 from io_soulstruct.general import GAME_CONFIG
 from io_soulstruct.general.cached import get_cached_mtdbnd, get_cached_matbinbnd
@@ -1167,9 +1169,7 @@ class BlenderFLVER(SoulstructObject[BaseFLVER, FLVERProps]):
             face_vertex_indices = all_faces
 
         # Drop faces that don't use three unique vertex indices.
-        # TODO: Try a vectorized approach that calculates the difference between each pair of the three columns, then
-        #  takes the product of those differences. Any row that ends up with zero is degenerate.
-        unique_mask = np.apply_along_axis(lambda row: len(np.unique(row)) == 3, 1, face_vertex_indices)
+        unique_mask = get_non_degenerate_face_mask(face_vertex_indices)
         valid_face_vertex_indices = face_vertex_indices[unique_mask]
 
         valid_face_count = valid_face_vertex_indices.shape[0]
@@ -1236,27 +1236,49 @@ class BlenderFLVER(SoulstructObject[BaseFLVER, FLVERProps]):
         ]  # type: list[bpy.types.VertexGroup]
 
         # Awkwardly, we need a separate call to `bone_vertex_groups[bone_index].add(indices, weight)` for each combo
-        # of `bone_index` and `weight`, so the dictionary keys constructed below are a tuple of those two to minimize
-        # the number of `VertexGroup.add()` calls needed at the end of this function.
-        bone_vertex_group_indices = {}  # type: dict[tuple[int, float], list[int]]
+        # of `bone_index` and `weight`, so we flatten all weights into `(vertex, bone_index, weight)` triples and sort
+        # them by bone index and weight to minimize the number of `VertexGroup.add()` calls needed.
 
         # p = time.perf_counter()
-        # TODO: Can probably be vectorized better with NumPy.
-        for v_i, (bone_indices, bone_weights) in enumerate(zip(bl_vert_bone_indices, bl_vert_bone_weights)):
-            if all(weight == 0.0 for weight in bone_weights) and len(set(bone_indices)) == 1:
-                # Map Piece FLVERs use a single duplicated index and no weights.
-                # TODO: May be able to assert that this is ALWAYS true for ALL vertices in map pieces.
-                v_bone_index = bone_indices[0]
-                bone_vertex_group_indices.setdefault((v_bone_index, 1.0), []).append(v_i)
-            else:
-                # Standard multi-bone weighting.
-                for v_bone_index, v_bone_weight in zip(bone_indices, bone_weights):
-                    if v_bone_weight == 0.0:
-                        continue
-                    bone_vertex_group_indices.setdefault((v_bone_index, v_bone_weight), []).append(v_i)
-
-        for (bone_index, bone_weight), bone_vertices in bone_vertex_group_indices.items():
-            bone_vertex_groups[bone_index].add(bone_vertices, bone_weight, "ADD")
+        bl_vert_bone_indices = np.asarray(bl_vert_bone_indices)
+        bl_vert_bone_weights = np.asarray(bl_vert_bone_weights)
+        vertex_count = bl_vert_bone_indices.shape[0]
+
+        # Map Piece FLVERs use a single duplicated index and no weights. These vertices get a full weight of 1.0 for
+        # their single bone. (Detected for all vertices at once; normally this is true for ALL vertices or NONE.)
+        single_bone_mask = (
+            np.all(bl_vert_bone_weights == 0.0, axis=1)
+            & np.all(bl_vert_bone_indices == bl_vert_bone_indices[:, :1], axis=1)
+        )
+        single_vertices = np.flatnonzero(single_bone_mask)
+        single_bone_indices = bl_vert_bone_indices[single_vertices, 0]
+        single_weights = np.ones(single_vertices.size, dtype=bl_vert_bone_weights.dtype)
+
+        # Standard multi-bone weighting. Zero weights are skipped.
+        multi_vertex_mask = ~single_bone_mask[:, np.newaxis] & (bl_vert_bone_weights != 0.0)
+        multi_vertices = np.broadcast_to(np.arange(vertex_count)[:, np.newaxis], bl_vert_bone_indices.shape)
+        multi_vertices = multi_vertices[multi_vertex_mask]
+        multi_bone_indices = bl_vert_bone_indices[multi_vertex_mask]
+        multi_weights = bl_vert_bone_weights[multi_vertex_mask]
+
+        vertices = np.concatenate((single_vertices, multi_vertices))
+        bone_indices = np.concatenate((single_bone_indices, multi_bone_indices))
+        weights = np.concatenate((single_weights, multi_weights))
+        if vertices.size == 0:
+            return
+
+        # Sort by bone index, then weight, then vertex index; then split wherever bone index or weight changes.
+        order = np.lexsort((vertices, weights, bone_indices))
+        vertices = vertices[order]
+        bone_indices = bone_indices[order]
+        weights = weights[order]
+        group_starts = np.flatnonzero(
+            np.concatenate(([True], (bone_indices[1:] != bone_indices[:-1]) | (weights[1:] != weights[:-1])))
+        )
+        for bone_vertices, bone_index, bone_weight in zip(
+            np.split(vertices, group_starts[1:]), bone_indices[group_starts], weights[group_starts]
+        ):
+            bone_vertex_groups[bone_index].add(bone_vertices.tolist(), float(bone_weight), "ADD")
 
         # self.operator.info(f"Assigned Blender vertex groups to bones in {time.perf_counter() - p} s")
 
@@ -1441,6 +1463,10 @@ class BlenderFLVER(SoulstructObject[BaseFLVER, FLVERProps]):
     ) -> DDSTextureCollection:
         """Load texture images from PNG cache directory or TPFs found with `image_import_manager`.
 
+        If the texture content cache is enabled, it replaces the stem-keyed image cache (with the same read/write
+        settings): TPF textures are only converted if they are not already in the content cache (keyed by DDS content
+        rather than stem), and images are loaded straight from their content cache files.
+
         Will NEVER load an image that is already in Blender's data, regardless of image type (identified by stem only).
         Note that these stems ARE case-sensitive, as I don't want them to change when a FLVER is imported and exported
         without any other modifications. (The cached images are also case-sensitive.)
@@ -1453,6 +1479,10 @@ class BlenderFLVER(SoulstructObject[BaseFLVER, FLVERProps]):
 
         new_texture_collection = DDSTextureCollection()
 
+        image_format = settings.bl_image_format
+        deswizzle_platform = settings.game_config.swizzle_platform
+        content_cache = TextureContentCache.from_settings(settings)  # could be None
+
         tpf_textures_to_load = {}  # type: dict[str, TPFTexture]
         for texture_stem in texture_stems:
             if texture_stem in bl_image_stems:
@@ -1460,7 +1490,9 @@ class BlenderFLVER(SoulstructObject[BaseFLVER, FLVERProps]):
             if texture_stem in tpf_textures_to_load:
                 continue  # already queued to load below
 
-            if settings.read_cached_images and settings.str_image_cache_directory:
+            if not content_cache and settings.read_cached_images and settings.str_image_cache_directory:
+                # Stem-keyed cached images may be stale or belong to a different texture with the same stem, so they
+                # are only used if the content cache is disabled.
                 cached_path = settings.get_cached_image_path(texture_stem)
                 if cached_path.is_file():
                     # Found cached image.
@@ -1481,46 +1513,115 @@ class BlenderFLVER(SoulstructObject[BaseFLVER, FLVERProps]):
 
             operator.warning(f"Could not find TPF or cached image '{texture_stem}' for FLVER '{name}'.")
 
-        if tpf_textures_to_load:
-            for texture_stem in tpf_textures_to_load:
+        if not tpf_textures_to_load:
+            return new_texture_collection
+
+        # Content cache image paths of textures, found or newly added below.
+        content_cache_paths = {}  # type: dict[str, Path]
+        content_keys = {}  # type: dict[str, str]
+        if content_cache:
+            for texture_stem, texture in tpf_textures_to_load.items():
+                content_keys[texture_stem] = key = content_cache.get_key(texture)
+                if not settings.read_cached_images:
+                    continue
+                cached_path = content_cache.get_cached_image_path(key)
+                if cached_path:
+                    content_cache_paths[texture_stem] = cached_path
+            if content_cache_paths:
+                operator.info(f"Found {len(content_cache_paths)} converted textures in content cache.")
+
+        # Newly converted image data that is not stored in the content cache (i.e. if it is disabled or not written).
+        all_image_data = {}  # type: dict[str, bytes | None]
+        textures_to_convert = {
+            texture_stem: texture
+            for texture_stem, texture in tpf_textures_to_load.items()
+            if texture_stem not in content_cache_paths
+        }
+        if textures_to_convert:
+            for texture_stem in textures_to_convert:
                 operator.info(f"Loading texture into Blender: {texture_stem}")
             t = time.perf_counter()
-            image_format = settings.bl_image_format
-            deswizzle_platform = settings.game_config.swizzle_platform
             if image_format == BlenderImageFormat.TARGA:
-                all_image_data = batch_get_tpf_texture_tga_data(
-                    list(tpf_textures_to_load.values()), deswizzle_platform
+                converted_image_data = batch_get_tpf_texture_tga_data(
+                    list(textures_to_convert.values()), deswizzle_platform
                 )
             elif image_format == BlenderImageFormat.PNG:
-                all_image_data = batch_get_tpf_texture_png_data(
-                    list(tpf_textures_to_load.values()), deswizzle_platform, fmt="rgba"
+                converted_image_data = batch_get_tpf_texture_png_data(
+                    list(textures_to_convert.values()), deswizzle_platform, fmt="rgba"
                 )
             else:
                 raise ValueError(f"Unsupported image format for DDS conversion: {image_format}")
-
-            if settings.write_cached_images:
-                write_image_directory = settings.image_cache_directory  # could be None
-            else:
-                write_image_directory = None
+            cache_name = "content cache" if content_cache else "image cache directory"
             operator.info(
-                f"Converted images in {time.perf_counter() - t} s (cached = {settings.write_cached_images})"
+                f"Converted images in {time.perf_counter() - t} s (written to {cache_name} = "
+                f"{settings.write_cached_images})"
             )
-            for texture_stem, image_data in zip(tpf_textures_to_load.keys(), all_image_data):
-                if image_data is None:
-                    continue  # failed to convert this texture
-                dds_texture = DDSTexture.new_from_image_data(
-                    operator,
-                    name=texture_stem,
-                    image_format=image_format,
-                    image_data=image_data,
-                    image_cache_directory=write_image_directory,
-                    replace_existing=False,  # not currently used
-                    pack_image_data=settings.pack_image_data,
+            for texture_stem, image_data in zip(textures_to_convert.keys(), converted_image_data):
+                if content_cache and settings.write_cached_images and image_data is not None:
+                    content_cache_paths[texture_stem] = content_cache.add_image_data(
+                        content_keys[texture_stem], texture_stem, image_data
+                    )
+                else:
+                    all_image_data[texture_stem] = image_data
+
+        if content_cache:
+            for texture_stem, cached_path in content_cache_paths.items():
+                dds_texture = DDSTexture.new_from_cached_image_path(
+                    texture_stem, image_format, cached_path, pack_image_data=settings.pack_image_data
                 )
                 new_texture_collection.add(dds_texture)
+            content_cache.save()  # only evicts after loading, as this import's images are the most recently used
+
+        if settings.write_cached_images and not content_cache:
+            write_image_directory = settings.image_cache_directory  # could be None
+        else:
+            write_image_directory = None
+
+        all_image_pixels = {}  # type: dict[str, tuple[int, int, np.ndarray]]
+        if write_image_directory is None and image_format == BlenderImageFormat.TARGA:
+            # No image file is wanted, so we skip the temporary file round-trip and decode TGA data straight into pixel
+            # buffers (in parallel, as NumPy releases the GIL) to assign to new Blender Images.
+            t = time.perf_counter()
+            tga_stems = [texture_stem for texture_stem, data in all_image_data.items() if data is not None]
+            with ThreadPoolExecutor() as executor:
+                decoded = executor.map(
+                    BlenderFLVER._try_tga_to_pixels, [all_image_data[texture_stem] for texture_stem in tga_stems]
+                )
+                for texture_stem, pixels_tuple in zip(tga_stems, decoded):
+                    if pixels_tuple is not None:
+                        all_image_pixels[texture_stem] = pixels_tuple
+            operator.info(f"Decoded {len(all_image_pixels)} TGA images to pixels in {time.perf_counter() - t} s.")
+
+        for texture_stem in all_image_data:
+            if texture_stem in all_image_pixels:
+                width, height, pixels = all_image_pixels[texture_stem]
+                dds_texture = DDSTexture.new_from_image_pixels(texture_stem, image_format, width, height, pixels)
+                new_texture_collection.add(dds_texture)
+                continue
+            image_data = all_image_data[texture_stem]
+            if image_data is None:
+                continue  # failed to convert this texture
+            dds_texture = DDSTexture.new_from_image_data(
+                operator,
+                name=texture_stem,
+                image_format=image_format,
+                image_data=image_data,
+                image_cache_directory=write_image_directory,
+                replace_existing=False,  # not currently used
+                pack_image_data=settings.pack_image_data,
+            )
+            new_texture_collection.add(dds_texture)
 
         return new_texture_collection
 
+    @staticmethod
+    def _try_tga_to_pixels(tga_data: bytes) -> tuple[int, int, np.ndarray] | None:
+        """Returns `None` if TGA data cannot be decoded directly, in which case it is loaded from a file as usual."""
+        try:
+            return DDSTexture.tga_to_pixels(tga_data)
+        except ValueError:
+            return None
+
     # endregion
 
     # region Export
@@ -1701,8 +1802,8 @@ class BlenderFLVER(SoulstructObject[BaseFLVER, FLVERProps]):
         using_default_bone: bool,
     ):
         """
-        Construct a `MergedMesh` from Blender data, in a straightforward way (unfortunately using `for` loops over
-        vertices, faces, and loops), then split it into `Submesh` instances based on Blender materials.
+        Construct a `MergedMesh` from Blender data (mostly with `foreach_get()` calls and NumPy), then split it into
+        `Submesh` instances based on Blender materials.
 
         Also creates `Material` and `VertexArrayLayout` instances for each Blender material, and assigns them to the
         appropriate `Submesh` instances. Any duplicate instances here will be merged when FLVER is packed.
@@ -1757,8 +1858,7 @@ class BlenderFLVER(SoulstructObject[BaseFLVER, FLVERProps]):
 
         # 4. Construct arrays from Blender data and pass into a new `MergedMesh` for splitting.
 
-        # Slow part number 1: iterating over every Blender vertex to retrieve its position and bone weights/indices.
-        # We at least know the size of the array in advance.
+        # Vertex positions and bone weights/indices. We know the size of the array in advance.
         vertex_count = len(tri_mesh_data.vertices)
         if not use_chr_layout and settings.game_config.map_pieces_use_normal_w_bones:
             # Bone weights/indices not in array. `normal_w` is used for single Map Piece bone.
@@ -1778,77 +1878,16 @@ class BlenderFLVER(SoulstructObject[BaseFLVER, FLVERProps]):
         vertex_data = np.empty(vertex_count, dtype=vertex_data_dtype)
         vertex_positions = np.empty((vertex_count, 3), dtype=np.float32)
         self.mesh.data.vertices.foreach_get("co", vertex_positions.ravel())
-        vertex_bone_weights = np.zeros((vertex_count, 4), dtype=np.float32)  # default: 0.0
-        vertex_bone_indices = np.full((vertex_count, 4), -1, dtype=np.int32)  # default: -1
-
-        # Map bone names to their indices now to avoid `index()` calls in the loop.
-        bone_name_indices = {bone_name: i for i, bone_name in enumerate(bl_bone_names)}
-        # Map group indices to group objects for bone weights.
-        vertex_groups_dict = {group.index: group for group in self.mesh.vertex_groups}
-        no_bone_warning_done = False
-        used_bone_indices = set()  # for marking unused bones in FLVER
 
         p = time.perf_counter()
 
-        # Unfortunately, there is no way to retrieve the weighted bones of vertices without iterating over all vertices.
-        # We iterate over the original, non-triangulated mesh, as the vertices should be the same and these vertices
-        # have their bone vertex groups (which cannot easily be transferred to the triangulated copy).
-        for i, vertex in enumerate(self.mesh.data.vertices):
-            bone_indices = []  # global (splitter will make them local to submesh if appropriate)
-            bone_weights = []
-            for vertex_group in vertex.groups:  # only one for Map Pieces; max of 4 for other FLVER types
-                mesh_group = vertex_groups_dict[vertex_group.group]
-                try:
-                    bone_index = bone_name_indices[mesh_group.name]
-                except ValueError:
-                    raise FLVERExportError(f"Vertex is weighted to invalid bone name: '{mesh_group.name}'.")
-                bone_indices.append(bone_index)
-                used_bone_indices.add(bone_index)
-                # We don't waste time calling retrieval method `weight()` for map pieces.
-                if use_chr_layout:
-                    # TODO: `vertex_group` has `group` (int) and `weight` (float) on it already?
-                    bone_weights.append(mesh_group.weight(i))
-
-            if len(bone_indices) > 4:
-                raise FLVERExportError(
-                    f"Vertex {i} cannot be weighted to {len(bone_indices)} bones (max 1 for Map Pieces, 4 for others)."
-                )
-            elif len(bone_indices) == 0:
-                if len(bl_bone_names) == 1 and not use_chr_layout:
-                    # Omitted bone indices can be assumed to be the only bone in the skeleton.
-                    # We issue a warning (once) unless this FLVER export is using a default bone (no Armature), in which
-                    # case we obviously don't expect any vertices to be weighted to anything.
-                    if not using_default_bone and not no_bone_warning_done:
-                        operator.warning(
-                            f"WARNING: At least one vertex in mesh '{self.mesh.name}' is not weighted to any bones. "
-                            f"Weighting in 'Map Piece' mode to only bone in skeleton: '{bl_bone_names[0]}'"
-                        )
-                        no_bone_warning_done = True
-                    bone_indices = [0]  # padded out below
-                    used_bone_indices.add(0)
-                    # Leave weights as zero.
-                else:
-                    # Can't guess which bone to weight to. Raise error.
-                    raise FLVERExportError("Vertex is not weighted to any bones (cannot guess from multiple bones).")
-
-            if use_chr_layout:
-                # Pad out bone weights and (unused) indices for rigged meshes.
-                while len(bone_weights) < 4:
-                    bone_weights.append(0.0)
-                while len(bone_indices) < 4:
-                    # NOTE: we use -1 here to optimize the mesh splitting process; it will be changed to 0 for write.
-                    bone_indices.append(-1)
-            else:  # Map Pieces
-                if len(bone_indices) == 1:
-                    # Duplicate single-element list to four-element list.
-                    # (This is done even for games that will write only a single Map Piece bone to `normal_w`.)
-                    bone_indices *= 4
-                else:
-                    raise FLVERExportError(f"Non-CHR FLVER vertices must be weighted to exactly one bone (vertex {i}).")
+        # We use the original, non-triangulated mesh, as the vertices should be the same and these vertices have their
+        # bone vertex groups (which cannot easily be transferred to the triangulated copy).
+        vertex_bone_indices, vertex_bone_weights, used_bone_indices = self.get_vertex_bone_arrays(
+            operator, bl_bone_names, use_chr_layout, using_default_bone
+        )
 
-            vertex_bone_indices[i] = bone_indices
-            if bone_weights:  # rigged only
-                vertex_bone_weights[i] = bone_weights
+        operator.info(f"Retrieved vertex bone indices/weights in {time.perf_counter() - p} s.")
 
         for used_bone_index in used_bone_indices:
             flver.bones[used_bone_index].usage_flags &= ~1
@@ -1863,14 +1902,9 @@ class BlenderFLVER(SoulstructObject[BaseFLVER, FLVERProps]):
 
         operator.info(f"Constructed combined vertex array in {time.perf_counter() - p} s.")
 
-        # NOTE: We now iterate over the faces of the triangulated copy. Material index has been properly triangulated.
+        # NOTE: We now use the faces of the triangulated copy. Material index has been properly triangulated.
         p = time.perf_counter()
-        faces = np.empty((len(tri_mesh_data.polygons), 4), dtype=np.int32)
-        # TODO: Again, due to the unfortunate need to access Python attributes one by one, we need a `for` loop.
-        #  ...But, `foreach_get()` doesn't work for `loop_indices` and `material_index`?
-        for i, face in enumerate(tri_mesh_data.polygons):
-            # Since we've triangulated the mesh, no need to check face loop count here.
-            faces[i] = [*face.loop_indices, face.material_index]
+        faces = self.get_triangle_face_array(tri_mesh_data)
 
         operator.info(f"Constructed combined face array with {len(faces)} rows in {time.perf_counter() - p} s.")
 
@@ -2008,6 +2042,118 @@ class BlenderFLVER(SoulstructObject[BaseFLVER, FLVERProps]):
         )
         operator.info(f"Split mesh into {len(flver.submeshes)} submeshes in {time.perf_counter() - p} s.")
 
+    @staticmethod
+    def get_triangle_face_array(tri_mesh_data: bpy.types.Mesh) -> np.ndarray:
+        """Construct `(F, 4)` array of face loop indices and material indices from triangulated `tri_mesh_data`.
+
+        Since every face is a triangle, its loop indices are just `loop_start + (0, 1, 2)`, so the whole array can be
+        built from two `foreach_get()` calls.
+        """
+        face_count = len(tri_mesh_data.polygons)
+        loop_starts = np.empty(face_count, dtype=np.int32)
+        loop_totals = np.empty(face_count, dtype=np.int32)
+        material_indices = np.empty(face_count, dtype=np.int32)
+        tri_mesh_data.polygons.foreach_get("loop_start", loop_starts)
+        tri_mesh_data.polygons.foreach_get("loop_total", loop_totals)
+        tri_mesh_data.polygons.foreach_get("material_index", material_indices)
+        if np.any(loop_totals != 3):
+            raise FLVERExportError(f"Mesh '{tri_mesh_data.name}' is not fully triangulated.")
+
+        faces = np.empty((face_count, 4), dtype=np.int32)
+        faces[:, :3] = loop_starts[:, np.newaxis] + np.arange(3, dtype=np.int32)
+        faces[:, 3] = material_indices
+        return faces
+
+    def get_vertex_bone_arrays(
+        self,
+        operator: LoggingOperator,
+        bl_bone_names: list[str],
+        use_chr_layout: bool,
+        using_default_bone: bool,
+    ) -> tuple[np.ndarray, np.ndarray, set[int]]:
+        """Construct `(N, 4)` vertex bone index and weight arrays from the vertex groups of this FLVER's mesh.
+
+        There is no `foreach_get()` route for vertex group membership, so we do a single flat gather of every vertex's
+        `(group, weight)` elements (which avoids the very slow `VertexGroup.weight(i)` lookup entirely), then validate,
+        pad, and scatter those elements into the final arrays with NumPy.
+
+        Unused bone indices are -1 in rigged (CHR layout) meshes. Map Piece meshes have their single bone index
+        duplicated across all four columns and all-zero weights.
+
+        Also returns the set of all (global) bone indices used by at least one vertex.
+        """
+        vertices = self.mesh.data.vertices
+        vertex_count = len(vertices)
+
+        # Map Blender vertex group indices to bone indices. Groups that don't match a bone name map to -1.
+        bone_name_indices = {bone_name: i for i, bone_name in enumerate(bl_bone_names)}
+        group_bone_indices = np.full(max(len(self.mesh.vertex_groups), 1), -1, dtype=np.int32)
+        for group in self.mesh.vertex_groups:
+            group_bone_indices[group.index] = bone_name_indices.get(group.name, -1)
+
+        # Flat gather of all vertex group elements, in vertex order. Only one per vertex for Map Pieces.
+        vertex_groups = [vertex.groups for vertex in vertices]
+        vertex_group_counts = np.fromiter(map(len, vertex_groups), dtype=np.int32, count=vertex_count)
+        group_elements = np.array(
+            [(element.group, element.weight) for groups in vertex_groups for element in groups],
+            dtype=np.float64,
+        ).reshape(-1, 2)
+        element_bone_indices = group_bone_indices[group_elements[:, 0].astype(np.int32)]
+        element_bone_weights = group_elements[:, 1].astype(np.float32)
+
+        if np.any(invalid_elements := element_bone_indices == -1):
+            invalid_group = self.mesh.vertex_groups[int(group_elements[np.argmax(invalid_elements), 0])]
+            raise FLVERExportError(f"Vertex is weighted to invalid bone name: '{invalid_group.name}'.")
+
+        if np.any(overweighted := vertex_group_counts > 4):
+            i = int(np.argmax(overweighted))
+            raise FLVERExportError(
+                f"Vertex {i} cannot be weighted to {vertex_group_counts[i]} bones (max 1 for Map Pieces, 4 for others)."
+            )
+
+        used_bone_indices = set(np.unique(element_bone_indices).tolist())  # for marking unused bones in FLVER
+
+        unweighted = vertex_group_counts == 0
+        if np.any(unweighted):
+            if len(bl_bone_names) == 1 and not use_chr_layout:
+                # Omitted bone indices can be assumed to be the only bone in the skeleton.
+                # We issue a warning unless this FLVER export is using a default bone (no Armature), in which case we
+                # obviously don't expect any vertices to be weighted to anything.
+                if not using_default_bone:
+                    operator.warning(
+                        f"WARNING: At least one vertex in mesh '{self.mesh.name}' is not weighted to any bones. "
+                        f"Weighting in 'Map Piece' mode to only bone in skeleton: '{bl_bone_names[0]}'"
+                    )
+                used_bone_indices.add(0)
+                # Leave weights as zero.
+            else:
+                # Can't guess which bone to weight to. Raise error.
+                raise FLVERExportError("Vertex is not weighted to any bones (cannot guess from multiple bones).")
+
+        vertex_bone_weights = np.zeros((vertex_count, 4), dtype=np.float32)  # default: 0.0
+
+        if use_chr_layout:
+            # Scatter each vertex's elements into consecutive columns. Padding indices are left as -1 (not 0) to
+            # optimize the mesh splitting process; they will be changed to 0 for write.
+            vertex_bone_indices = np.full((vertex_count, 4), -1, dtype=np.int32)
+            element_rows = np.repeat(np.arange(vertex_count), vertex_group_counts)
+            element_starts = np.cumsum(vertex_group_counts) - vertex_group_counts
+            element_columns = np.arange(element_rows.size) - element_starts[element_rows]
+            vertex_bone_indices[element_rows, element_columns] = element_bone_indices
+            vertex_bone_weights[element_rows, element_columns] = element_bone_weights
+        else:  # Map Pieces
+            if np.any(multi_weighted := vertex_group_counts > 1):
+                raise FLVERExportError(
+                    f"Non-CHR FLVER vertices must be weighted to exactly one bone (vertex {np.argmax(multi_weighted)})."
+                )
+            # Duplicate single bone index to all four columns. Unweighted vertices use bone 0 (validated above).
+            # (This is done even for games that will write only a single Map Piece bone to `normal_w`.)
+            single_bone_indices = np.zeros(vertex_count, dtype=np.int32)
+            single_bone_indices[~unweighted] = element_bone_indices
+            vertex_bone_indices = np.repeat(single_bone_indices[:, np.newaxis], 4, axis=1)
+
+        return vertex_bone_indices, vertex_bone_weights, used_bone_indices
+
     @classmethod
     def get_tangents_for_uv_layer(
         cls,
@@ -6,9 +6,14 @@ __all__ = [
     "get_cached_mtdbnd",
     "get_cached_matbinbnd",
     "clear_cached_matdefs",
+    "get_session_texture_cache_key",
+    "get_session_cached_texture_source",
+    "get_session_texture_cache_usage",
+    "clear_session_texture_cache",
 ]
 
 import typing as tp
+from collections import OrderedDict
 from pathlib import Path
 
 from soulstruct.containers import Binder
@@ -114,3 +119,61 @@ def get_cached_matbinbnd(operator: LoggingOperator, settings: SoulstructSettings
 def clear_cached_matdefs():
     _CACHED_MTDBNDS.clear()
     _CACHED_MATBINBNDS.clear()
+
+
+# Session-level LRU cache of parsed TPFs, opened texture Binders, and BHD headers, shared by every `ImageImportManager`
+# so that importing several maps/models in one session only reads and parses shared texture sources once. Maps keys
+# from `get_session_texture_cache_key()` to `(source, size_in_bytes)` tuples. Cleared when a Blend file is loaded, or
+# with the 'Clear Texture Caches' operator.
+_SESSION_TEXTURE_CACHE: OrderedDict[tuple, tuple[tp.Any, int]] = OrderedDict()
+_SESSION_TEXTURE_CACHE_SIZE = 0
+
+
+def get_session_texture_cache_key(file_path: Path, *extra: str | int) -> tuple | None:
+    """Get a key for a texture source read from `file_path`, which changes if the file is modified.
+
+    Returns `None` (no caching) if `file_path` is not given or does not exist.
+    """
+    if file_path is None:
+        return None
+    try:
+        stat = Path(file_path).stat()
+    except OSError:
+        return None
+    return Path(file_path), stat.st_mtime_ns, stat.st_size, *extra
+
+
+def get_session_cached_texture_source(
+    key: tuple | None, loader: tp.Callable[[], tuple[tp.Any, int]], max_size: int
+) -> tp.Any:
+    """Get cached texture source for `key`, or call `loader` to get a new `(source, size_in_bytes)` and cache it.
+
+    Least recently used sources are evicted until the total size is no more than `max_size`. Sources are shared between
+    operations and must be treated as read-only.
+    """
+    global _SESSION_TEXTURE_CACHE_SIZE
+
+    if key is None:
+        return loader()[0]
+    if key in _SESSION_TEXTURE_CACHE:
+        _SESSION_TEXTURE_CACHE.move_to_end(key)
+        return _SESSION_TEXTURE_CACHE[key][0]
+
+    source, size = loader()
+    _SESSION_TEXTURE_CACHE[key] = (source, size)
+    _SESSION_TEXTURE_CACHE_SIZE += size
+    while _SESSION_TEXTURE_CACHE_SIZE > max_size and len(_SESSION_TEXTURE_CACHE) > 1:
+        _, (_, evicted_size) = _SESSION_TEXTURE_CACHE.popitem(last=False)
+        _SESSION_TEXTURE_CACHE_SIZE -= evicted_size
+    return source
+
+
+def get_session_texture_cache_usage() -> tuple[int, int]:
+    """Returns `(source_count, total_size_in_bytes)` of session texture cache."""
+    return len(_SESSION_TEXTURE_CACHE), _SESSION_TEXTURE_CACHE_SIZE
+
+
+def clear_session_texture_cache():
+    global _SESSION_TEXTURE_CACHE_SIZE
+    _SESSION_TEXTURE_CACHE.clear()
+    _SESSION_TEXTURE_CACHE_SIZE = 0
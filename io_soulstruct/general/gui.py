@@ -14,6 +14,7 @@ __all__ = [
 
 import bpy
 
+from .cached import get_session_texture_cache_usage
 from .operators import *
 from .properties import SoulstructSettings
 
@@ -65,6 +66,14 @@ class _GlobalSettingsPanel_ViewMixin:
             panel.prop(settings, "read_cached_images")
             panel.prop(settings, "write_cached_images")
             panel.prop(settings, "pack_image_data")
+            panel.prop(settings, "use_texture_content_cache")
+            if settings.use_texture_content_cache:
+                panel.prop(settings, "texture_content_cache_max_mb")
+            panel.prop(settings, "use_texture_source_catalog")
+            panel.prop(settings, "texture_session_cache_max_mb")
+            source_count, cache_size = get_session_texture_cache_usage()
+            panel.label(text=f"Session Texture Cache: {source_count} sources, {cache_size / 1024 ** 2:.1f} MB")
+            panel.operator(ClearTextureCaches.bl_idname)
 
         layout.operator(LoadCollectionsFromBlend.bl_idname, text="Load BLEND Collections")
 
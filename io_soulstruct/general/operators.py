@@ -7,6 +7,7 @@ __all__ = [
     "SelectCustomMTDBNDFile",
     "SelectCustomMATBINBNDFile",
     "LoadCollectionsFromBlend",
+    "ClearTextureCaches",
 ]
 
 import abc
@@ -16,6 +17,7 @@ from pathlib import Path
 import bpy
 from bpy_extras.io_utils import ImportHelper
 
+from io_soulstruct.general.cached import clear_session_texture_cache
 from io_soulstruct.general.game_config import GAME_CONFIG
 from io_soulstruct.utilities import LoggingOperator
 
@@ -314,3 +316,18 @@ class LoadCollectionsFromBlend(LoggingOperator, ImportHelper):
                 bpy.data.libraries.remove(lib)
 
         return {"FINISHED"}
+
+
+class ClearTextureCaches(LoggingOperator):
+    """Clear session-level cache of parsed TPFs and texture Binders shared by all FLVER/MSB import operators."""
+    bl_idname = "soulstruct.clear_texture_caches"
+    bl_label = "Clear Texture Caches"
+    bl_description = (
+        "Free memory used by TPFs and texture Binders cached for re-use across imports in this session. Does not "
+        "delete any image cache files on disk"
+    )
+
+    def execute(self, context):
+        clear_session_texture_cache()
+        self.info("Cleared session texture caches.")
+        return {"FINISHED"}
@@ -245,7 +245,8 @@ class SoulstructSettings(bpy.types.PropertyGroup):
     read_cached_images: bpy.props.BoolProperty(
         name="Read Cached Images",
         description="Read cached images of the given format with matching stems from image cache directory if given, "
-                    "rather than finding and converting DDS textures of imported FLVERs",
+                    "rather than finding and converting DDS textures of imported FLVERs. Applies to the texture "
+                    "content cache instead, if enabled",
         default=True,
     )
 
@@ -253,7 +254,7 @@ class SoulstructSettings(bpy.types.PropertyGroup):
         name="Write Cached Images",
         description="Write cached images of the given format of imported FLVER textures (converted from DDS files) to "
                     "image cache directory if given, so they can be loaded more quickly in the future or modified by "
-                    "the user without DDS headaches",
+                    "the user without DDS headaches. Applies to the texture content cache instead, if enabled",
         default=True,
     )
 
@@ -264,6 +265,40 @@ class SoulstructSettings(bpy.types.PropertyGroup):
         default=False,
     )
 
+    use_texture_content_cache: bpy.props.BoolProperty(
+        name="Use Texture Content Cache",
+        description="Keep converted images of imported FLVER textures in a hidden subdirectory of the image cache "
+                    "directory, keyed by a hash of the original DDS data rather than the texture stem. Unchanged "
+                    "textures are never converted twice, and modded textures with the same stem are never stale. "
+                    "When enabled, it replaces stem-named cached images, using the same read/write settings. "
+                    "Unpacked images are linked to their content cache files",
+        default=False,
+    )
+
+    texture_content_cache_max_mb: bpy.props.IntProperty(
+        name="Texture Cache Max Size (MB)",
+        description="Maximum total size of the texture content cache. Least recently used images are deleted when "
+                    "this size is exceeded at the end of an import operation",
+        default=2048,
+        min=16,
+    )
+
+    use_texture_source_catalog: bpy.props.BoolProperty(
+        name="Use Texture Source Catalog",
+        description="Find FLVER textures with the catalog written by 'Index Game Textures' (if it exists for the "
+                    "current game root) before scanning directories. Catalog entries for game files that have changed "
+                    "or are overridden in the project directory are ignored",
+        default=True,
+    )
+
+    texture_session_cache_max_mb: bpy.props.IntProperty(
+        name="Session Texture Cache Max Size (MB)",
+        description="Maximum memory used to keep parsed TPFs and texture Binders for re-use across all imports in this "
+                    "session. Least recently used sources are dropped when this size is exceeded",
+        default=1024,
+        min=0,
+    )
+
     import_bak_file: bpy.props.BoolProperty(
         name="Import BAK File",
         description="Import from '.bak' backup file when auto-importing from project/game directory. If enabled and a "
@@ -13,7 +13,7 @@ from io_soulstruct.flver.image.image_import_manager import ImageImportManager
 from io_soulstruct.flver.models import BlenderFLVER
 from io_soulstruct.flver.utilities import get_flvers_from_binder
 from io_soulstruct.msb.properties import MSBPartSubtype, MSBCharacterProps
-from io_soulstruct.msb.utilities import find_flver_model, batch_import_flver_models
+from io_soulstruct.msb.utilities import find_flver_model, read_flver_binders_batch, batch_import_flver_models
 from io_soulstruct.types import *
 from io_soulstruct.utilities import LoggingOperator, get_or_create_collection
 from soulstruct.containers import Binder
@@ -224,25 +224,21 @@ class BlenderMSBCharacter(BlenderMSBPart[MSBCharacter, MSBCharacterProps]):
     ):
         """Import all models for a batch of MSB Parts, as needed, in parallel as much as possible."""
         settings = operator.settings(context)
-        model_datas = {}
-        model_chrbnds = {}
+        model_chrbnd_paths = {}
         for part in parts:
             if not part.model:
                 continue  # ignore (warning will appear when `bl_part.model` assignes None)
             model_name = part.model.get_model_file_stem(map_stem)
-            if model_name in model_datas:
+            if model_name in model_chrbnd_paths:
                 continue  # already queued for import
             try:
                 cls.find_model_mesh(model_name, map_stem)
             except MissingPartModelError:
                 # Queue up path for batch import.
-                chrbnd_path = settings.get_import_file_path(f"chr/{model_name}.chrbnd")
-                chrbnd = Binder.from_path(chrbnd_path)
-                flver_entries = chrbnd.find_entries_matching_name(r".*\.flver(\.dcx)?")
-                if not flver_entries:
-                    raise FLVERImportError(f"Cannot find a FLVER file in CHRBND {chrbnd_path}.")
-                model_datas[model_name] = flver_entries[0]
-                model_chrbnds[model_name] = chrbnd
+                model_chrbnd_paths[model_name] = settings.get_import_file_path(f"chr/{model_name}.chrbnd")
+
+        # Open all CHRBNDs concurrently.
+        model_datas, model_chrbnds = read_flver_binders_batch(operator, model_chrbnd_paths, "CHRBND")
 
         if not model_datas:
             operator.info("No Character FLVER models to import.")
@@ -8,12 +8,14 @@ import traceback
 import typing as tp
 
 import bpy
-from io_soulstruct.exceptions import MissingPartModelError, MapCollisionImportError
+from io_soulstruct.exceptions import BatchOperationUnsupportedError, MissingPartModelError, MapCollisionImportError
 from io_soulstruct.collision.types import BlenderMapCollision
 from io_soulstruct.msb.properties import MSBPartSubtype, MSBCollisionProps
+from io_soulstruct.msb.utilities import batch_import_collision_models
 from io_soulstruct.types import *
 from io_soulstruct.utilities import *
 from soulstruct.base.maps.msb.utils import GroupBitSet128
+from soulstruct.containers import EntryNotFoundError
 from soulstruct.darksouls1ptde.maps.enums import CollisionHitFilter
 from soulstruct.darksouls1ptde.maps.models import MSBCollisionModel
 from soulstruct.darksouls1ptde.maps.parts import MSBCollision
@@ -248,5 +250,85 @@ class BlenderMSBCollision(BlenderMSBPart[MSBCollision, MSBCollisionProps]):
 
         return bl_map_collision.obj
 
+    @classmethod
+    def batch_import_models(
+        cls,
+        operator: LoggingOperator,
+        context: bpy.types.Context,
+        parts: list[MSBCollision],
+        map_stem: str,
+    ):
+        """Import all models for a batch of MSB Parts, as needed, in parallel as much as possible.
+
+        DSR HKXBHDs are opened only once for the whole batch.
+        """
+        settings = operator.settings(context)
+        if not settings.is_game_ds1():
+            raise BatchOperationUnsupportedError(
+                f"Cannot yet batch import HKX Collision models for game {settings.game.name} (only DS1)."
+            )
+
+        both_res_hkxbhd = None  # type: BothResHKXBHD | None  # opened on first missing model (DSR only)
+        hkx_sources = {}
+        for part in parts:
+            if not part.model:
+                continue  # ignore (warning will appear when `bl_part.model` assignes None)
+            model_name = part.model.get_model_file_stem(map_stem)
+            if model_name in hkx_sources:
+                continue  # already queued for import
+            try:
+                cls.find_model_mesh(model_name, map_stem)
+            except MissingPartModelError:
+                pass
+            else:
+                continue
+
+            if settings.is_game("DARK_SOULS_PTDE"):
+                # No HKX binders; hi and lo-res models are loose HKX files in map directory.
+                hi_res_hkx_name = f"h{model_name[1:]}.hkx"
+                try:
+                    hi_res_hkx_path = settings.get_import_map_file_path(hi_res_hkx_name)
+                except FileNotFoundError:
+                    raise FileNotFoundError(f"Cannot find hi-res HKX '{hi_res_hkx_name}' for map {map_stem}.")
+                lo_res_hkx_name = f"l{model_name[1:]}.hkx"
+                try:
+                    lo_res_hkx_path = settings.get_import_map_file_path(lo_res_hkx_name)
+                except FileNotFoundError:
+                    raise FileNotFoundError(f"Cannot find lo-res HKX '{lo_res_hkx_name}' for map {map_stem}.")
+                hkx_sources[model_name] = (hi_res_hkx_path, lo_res_hkx_path)
+            else:
+                if both_res_hkxbhd is None:
+                    # NOTE: Hi and lo-res binders could end up being found in different import folders.
+                    try:
+                        hi_res_hkxbhd_path = settings.get_import_map_file_path(f"h{map_stem[1:]}.hkxbhd")
+                    except FileNotFoundError:
+                        raise FileNotFoundError(f"Cannot find hi-res HKXBHD for map {map_stem}.")
+                    try:
+                        lo_res_hkxbhd_path = settings.get_import_map_file_path(f"l{map_stem[1:]}.hkxbhd")
+                    except FileNotFoundError:
+                        raise FileNotFoundError(f"Cannot find lo-res HKXBHD for map {map_stem}.")
+                    both_res_hkxbhd = BothResHKXBHD.from_both_paths(hi_res_hkxbhd_path, lo_res_hkxbhd_path)
+                hi_res_hkx_name = f"h{model_name[1:]}.hkx.dcx"
+                try:
+                    hi_res_entry = both_res_hkxbhd.hi_res.find_entry_name(hi_res_hkx_name)
+                except EntryNotFoundError as ex:
+                    raise MapCollisionImportError(
+                        f"Cannot load hi-res HKX '{hi_res_hkx_name}' from map {map_stem}. Error: {ex}"
+                    )
+                lo_res_hkx_name = f"l{model_name[1:]}.hkx.dcx"
+                try:
+                    lo_res_entry = both_res_hkxbhd.lo_res.find_entry_name(lo_res_hkx_name)
+                except EntryNotFoundError as ex:
+                    raise MapCollisionImportError(
+                        f"Cannot load lo-res HKX '{lo_res_hkx_name}' from map {map_stem}. Error: {ex}"
+                    )
+                hkx_sources[model_name] = (hi_res_entry, lo_res_entry)
+
+        if not hkx_sources:
+            operator.info("No Collision HKX models to import.")
+            return  # nothing to import
+
+        batch_import_collision_models(operator, context, hkx_sources, map_stem)
+
 
 BlenderMSBCollision.add_auto_subtype_props(*BlenderMSBCollision.AUTO_COLLISION_PROPS)
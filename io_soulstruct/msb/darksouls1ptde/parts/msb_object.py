@@ -13,7 +13,7 @@ from io_soulstruct.flver.image.image_import_manager import ImageImportManager
 from io_soulstruct.flver.models import BlenderFLVER
 from io_soulstruct.flver.utilities import get_flvers_from_binder
 from io_soulstruct.msb.properties import MSBPartSubtype, MSBObjectProps
-from io_soulstruct.msb.utilities import find_flver_model, batch_import_flver_models
+from io_soulstruct.msb.utilities import find_flver_model, read_flver_binders_batch, batch_import_flver_models
 from io_soulstruct.types import *
 from io_soulstruct.utilities import *
 from soulstruct.containers import Binder
@@ -186,13 +186,12 @@ class BlenderMSBObject(BlenderMSBPart[MSBObject, MSBObjectProps]):
         """Import all models for a batch of MSB Parts, as needed, in parallel as much as possible."""
         settings = operator.settings(context)
 
-        model_datas = {}
-        model_objbnds = {}
+        model_objbnd_paths = {}
         for part in parts:
             if not part.model:
                 continue  # ignore (warning will appear when `bl_part.model` assignes None)
             model_name = part.model.get_model_file_stem(map_stem)
-            if model_name in model_datas:
+            if model_name in model_objbnd_paths:
                 continue  # already queued for import
             try:
                 cls.find_model_mesh(model_name, map_stem)
@@ -200,13 +199,10 @@ class BlenderMSBObject(BlenderMSBPart[MSBObject, MSBObjectProps]):
                 # Queue up path for batch import.
                 objbnd_path = settings.get_import_file_path(f"obj/{model_name}.objbnd")
                 operator.info(f"Importing object FLVER from: {objbnd_path.name}")
-                objbnd = Binder.from_path(objbnd_path)
-                flver_entries = objbnd.find_entries_matching_name(r".*\.flver(\.dcx)?")
-                if not flver_entries:
-                    raise FLVERImportError(f"Cannot find a FLVER file in OBJBND {objbnd_path}.")
-                # TODO: Ignoring secondary object FLVERs for now.
-                model_datas[model_name] = flver_entries[0]
-                model_objbnds[model_name] = objbnd
+                model_objbnd_paths[model_name] = objbnd_path
+
+        # Open all OBJBNDs concurrently. TODO: Ignoring secondary object FLVERs for now.
+        model_datas, model_objbnds = read_flver_binders_batch(operator, model_objbnd_paths, "OBJBND")
 
         if not model_datas:
             operator.info("No Object FLVER models to import.")
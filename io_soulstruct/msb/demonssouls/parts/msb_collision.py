@@ -11,6 +11,7 @@ import bpy
 from io_soulstruct.exceptions import MissingPartModelError, MapCollisionImportError
 from io_soulstruct.collision.types import BlenderMapCollision
 from io_soulstruct.msb.properties import MSBPartSubtype, MSBCollisionProps
+from io_soulstruct.msb.utilities import batch_import_collision_models
 from io_soulstruct.types import *
 from io_soulstruct.utilities import *
 from soulstruct.base.maps.msb.utils import GroupBitSet128
@@ -218,5 +219,44 @@ class BlenderMSBCollision(BlenderMSBPart[MSBCollision, MSBCollisionProps]):
 
         return bl_map_collision.obj
 
+    @classmethod
+    def batch_import_models(
+        cls,
+        operator: LoggingOperator,
+        context: bpy.types.Context,
+        parts: list[MSBCollision],
+        map_stem: str,
+    ):
+        """Import all models for a batch of MSB Parts, as needed, in parallel as much as possible."""
+        settings = operator.settings(context)
+        hkx_sources = {}
+        for part in parts:
+            if not part.model:
+                continue  # ignore (warning will appear when `bl_part.model` assignes None)
+            model_name = part.model.get_model_file_stem(map_stem)
+            if model_name in hkx_sources:
+                continue  # already queued for import
+            try:
+                cls.find_model_mesh(model_name, map_stem)
+            except MissingPartModelError:
+                # Queue up loose hi and lo-res HKX paths for batch import.
+                hi_res_hkx_name = f"h{model_name[1:]}.hkx"
+                try:
+                    hi_res_hkx_path = settings.get_import_map_file_path(hi_res_hkx_name)
+                except FileNotFoundError:
+                    raise FileNotFoundError(f"Cannot find hi-res HKX '{hi_res_hkx_name}' for map {map_stem}.")
+                lo_res_hkx_name = f"l{model_name[1:]}.hkx"
+                try:
+                    lo_res_hkx_path = settings.get_import_map_file_path(lo_res_hkx_name)
+                except FileNotFoundError:
+                    raise FileNotFoundError(f"Cannot find lo-res HKX '{lo_res_hkx_name}' for map {map_stem}.")
+                hkx_sources[model_name] = (hi_res_hkx_path, lo_res_hkx_path)
+
+        if not hkx_sources:
+            operator.info("No Collision HKX models to import.")
+            return  # nothing to import
+
+        batch_import_collision_models(operator, context, hkx_sources, map_stem)
+
 
 BlenderMSBCollision.add_auto_subtype_props(*BlenderMSBCollision.AUTO_COLLISION_PROPS)
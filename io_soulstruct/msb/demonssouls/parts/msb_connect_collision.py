@@ -121,3 +121,14 @@ class BlenderMSBConnectCollision(BlenderMSBPart[MSBConnectCollision, MSBConnectC
         This just hijacks the model import class method of `BlenderMSBCollision`.
         """
         return BlenderMSBCollision.import_model_mesh(operator, context, model_name, map_stem, model_collection)
+
+    @classmethod
+    def batch_import_models(
+        cls,
+        operator: LoggingOperator,
+        context: bpy.types.Context,
+        parts: list[MSBConnectCollision],
+        map_stem: str,
+    ):
+        """Hijacks the batch model import class method of `BlenderMSBCollision`, as models are the same type."""
+        BlenderMSBCollision.batch_import_models(operator, context, parts, map_stem)
@@ -11,6 +11,7 @@ import typing as tp
 import bpy
 from io_soulstruct.exceptions import NVMImportError, MissingPartModelError
 from io_soulstruct.msb.properties import MSBPartSubtype, MSBNavmeshProps
+from io_soulstruct.msb.utilities import batch_import_nvm_models
 from io_soulstruct.navmesh.nvm.types import *
 from io_soulstruct.types import *
 from io_soulstruct.utilities import *
@@ -152,3 +153,53 @@ class BlenderMSBNavmesh(BlenderMSBPart[MSBNavmesh, MSBNavmeshProps]):
         # operator.info(f"Imported NVM model {import_info.model_file_stem} as '{import_info.bl_name}'.")
 
         return bl_nvm.obj
+
+    @classmethod
+    def batch_import_models(
+        cls,
+        operator: LoggingOperator,
+        context: bpy.types.Context,
+        parts: list[MSBNavmesh],
+        map_stem: str,
+    ):
+        """Import all models for a batch of MSB Parts, as needed, in parallel as much as possible.
+
+        The map NVMBND is opened only once for the whole batch.
+        """
+        settings = operator.settings(context)
+        nvmbnd = None  # type: Binder | None  # opened on first missing model
+        nvm_sources = {}
+        for part in parts:
+            if not part.model:
+                continue  # ignore (warning will appear when `bl_part.model` assignes None)
+            model_name = part.model.get_model_file_stem(map_stem)
+            if model_name in nvm_sources:
+                continue  # already queued for import
+            try:
+                cls.find_model_mesh(model_name, map_stem)
+            except MissingPartModelError:
+                pass
+            else:
+                continue
+
+            if nvmbnd is None:
+                try:
+                    nvmbnd_path = settings.get_import_map_file_path(f"{map_stem}.nvmbnd")
+                except FileNotFoundError:
+                    raise NVMImportError(f"Could not find NVMBND file for map {map_stem}.")
+                nvmbnd = Binder.from_path(nvmbnd_path)
+            nvm_entry_name = model_name + ".nvm"  # no DCX in DSR
+            try:
+                nvm_sources[model_name] = nvmbnd.find_entry_matching_name(
+                    nvm_entry_name, flags=re.IGNORECASE, escape=True
+                )
+            except EntryNotFoundError:
+                raise NVMImportError(
+                    f"Could not find NVM entry '{nvm_entry_name}' in NVMBND file '{nvmbnd.path.name}'."
+                )
+
+        if not nvm_sources:
+            operator.info("No Navmesh NVM models to import.")
+            return  # nothing to import
+
+        batch_import_nvm_models(operator, context, nvm_sources, map_stem)
@@ -5,12 +5,11 @@ __all__ = [
 ]
 
 import bpy
-from io_soulstruct.exceptions import FLVERImportError, MissingPartModelError
+from io_soulstruct.exceptions import MissingPartModelError
 from io_soulstruct.msb.properties import MSBPartSubtype, MSBPlayerStartProps
-from io_soulstruct.msb.utilities import find_flver_model, batch_import_flver_models
+from io_soulstruct.msb.utilities import find_flver_model, read_flver_binders_batch, batch_import_flver_models
 from io_soulstruct.types import *
 from io_soulstruct.utilities import LoggingOperator
-from soulstruct.containers import Binder
 from soulstruct.demonssouls.maps.models import MSBCharacterModel
 from soulstruct.demonssouls.maps.parts import MSBPlayerStart
 from .msb_part import BlenderMSBPart
@@ -69,25 +68,21 @@ class BlenderMSBPlayerStart(BlenderMSBPart[MSBPlayerStart, MSBPlayerStartProps])
     ):
         """Import all models for a batch of MSB Parts, as needed, in parallel as much as possible."""
         settings = operator.settings(context)
-        model_datas = {}
-        model_chrbnds = {}
+        model_chrbnd_paths = {}
         for part in parts:
             if not part.model:
                 continue  # ignore (warning will appear when `bl_part.model` assignes None)
             model_name = part.model.get_model_file_stem(map_stem)
-            if model_name in model_datas:
+            if model_name in model_chrbnd_paths:
                 continue  # already queued for import
             try:
                 cls.find_model_mesh(model_name, map_stem)
             except MissingPartModelError:
                 # Queue up path for batch import.
-                chrbnd_path = settings.get_import_file_path(f"chr/{model_name}/{model_name}.chrbnd")
-                chrbnd = Binder.from_path(chrbnd_path)
-                flver_entries = chrbnd.find_entries_matching_name(r".*\.flver(\.dcx)?")
-                if not flver_entries:
-                    raise FLVERImportError(f"Cannot find a FLVER file in CHRBND {chrbnd_path}.")
-                model_datas[model_name] = flver_entries[0]
-                model_chrbnds[model_name] = chrbnd
+                model_chrbnd_paths[model_name] = settings.get_import_file_path(f"chr/{model_name}/{model_name}.chrbnd")
+
+        # Open all CHRBNDs concurrently.
+        model_datas, model_chrbnds = read_flver_binders_batch(operator, model_chrbnd_paths, "CHRBND")
 
         if not model_datas:
             operator.info("No Player Start (Character) FLVER models to import.")
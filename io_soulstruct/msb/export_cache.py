@@ -0,0 +1,140 @@
+"""Session tracking of Blender objects changed since the last MSB export, for incremental MSB export.
+
+A `depsgraph_update_post` handler records the names of all updated Blender objects (and their parents, since some
+children, like NVM Event Entities, are exported as part of their parent) into the dirty set of every cached map export.
+`ExportMapMSB` then only regenerates the MSB and the NVM/HKX models that actually use dirty objects, and reuses the
+content it exported last time for everything else.
+"""
+from __future__ import annotations
+
+__all__ = [
+    "MSBExportCache",
+    "get_msb_export_cache",
+    "discard_msb_export_cache",
+    "clear_msb_export_caches",
+    "msb_export_depsgraph_handler",
+]
+
+import typing as tp
+
+import bpy
+
+if tp.TYPE_CHECKING:
+    from soulstruct.base.maps.msb import MSB
+    from soulstruct.base.maps.navmesh.nvm import NVM
+    from soulstruct_havok.fromsoft.shared.map_collision import MapCollisionModel
+
+
+class MSBExportCache:
+    """Content of the last export of one map MSB (and its models), plus names of Blender objects changed since then.
+
+    Cached models are keyed by model stem and store the name of the Blender model object they were converted from, so
+    a renamed or replaced model object is never reused.
+    """
+
+    dirty_names: set[str]
+    msb: MSB | None
+    msb_obj_names: frozenset[str]
+    msb_settings: tuple
+    nvms: dict[str, tuple[str, NVM]]
+    hkx_pairs: dict[str, tuple[str, tuple[MapCollisionModel, MapCollisionModel]]]
+
+    def __init__(self):
+        self.dirty_names = set()
+        self.msb = None
+        self.msb_obj_names = frozenset()
+        self.msb_settings = ()
+        self.nvms = {}
+        self.hkx_pairs = {}
+
+    def is_dirty(self, obj: bpy.types.Object | None) -> bool:
+        return obj is not None and obj.name in self.dirty_names
+
+    def get_msb(self, obj_names: frozenset[str], msb_settings: tuple) -> MSB | None:
+        """Return last exported MSB if exactly the same objects are exported again with the same settings and none of
+        them have changed."""
+        if self.msb is None or obj_names != self.msb_obj_names or msb_settings != self.msb_settings:
+            return None
+        if not obj_names.isdisjoint(self.dirty_names):
+            return None
+        return self.msb
+
+    def set_msb(self, msb: MSB, obj_names: frozenset[str], msb_settings: tuple):
+        self.msb = msb
+        self.msb_obj_names = obj_names
+        self.msb_settings = msb_settings
+
+    def get_nvm(self, model_stem: str, model_obj: bpy.types.Object) -> NVM | None:
+        return self._get_model(self.nvms, model_stem, model_obj)
+
+    def get_hkx_pair(
+        self, model_stem: str, model_obj: bpy.types.Object
+    ) -> tuple[MapCollisionModel, MapCollisionModel] | None:
+        return self._get_model(self.hkx_pairs, model_stem, model_obj)
+
+    def _get_model(self, models: dict[str, tuple[str, tp.Any]], model_stem: str, model_obj: bpy.types.Object):
+        try:
+            model_obj_name, model = models[model_stem]
+        except KeyError:
+            return None
+        if model_obj_name != model_obj.name or self.is_dirty(model_obj):
+            return None
+        return model
+
+    def invalidate(self):
+        """Forget all cached content, so the next export of this map is a full export."""
+        self.msb = None
+        self.msb_obj_names = frozenset()
+        self.msb_settings = ()
+        self.nvms.clear()
+        self.hkx_pairs.clear()
+
+
+# Maps `(game_name, map_stem)` keys to the `MSBExportCache` of the last incremental export of that map this session.
+_MSB_EXPORT_CACHES = {}  # type: dict[tuple[str, str], MSBExportCache]
+
+
+def get_msb_export_cache(game_name: str, map_stem: str) -> MSBExportCache:
+    """Get existing or new (empty) export cache for given map."""
+    try:
+        return _MSB_EXPORT_CACHES[game_name, map_stem]
+    except KeyError:
+        cache = _MSB_EXPORT_CACHES[game_name, map_stem] = MSBExportCache()
+        return cache
+
+
+def discard_msb_export_cache(game_name: str, map_stem: str):
+    """Stop tracking changes for given map (e.g. if it is exported without incremental mode)."""
+    _MSB_EXPORT_CACHES.pop((game_name, map_stem), None)
+
+
+def clear_msb_export_caches():
+    """Discard all cached exports. Called when a new Blend file is loaded and on undo/redo, which can change any object
+    without reliably reporting it to the depsgraph handler."""
+    _MSB_EXPORT_CACHES.clear()
+
+
+@bpy.app.handlers.persistent
+def msb_export_depsgraph_handler(_scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph):
+    """Record names of all updated objects (and their parents) in every map export cache.
+
+    Material changes (e.g. names, which determine HKX material indices and NVM flags) cannot be traced to specific
+    models cheaply, so they invalidate all cached content.
+    """
+    if not _MSB_EXPORT_CACHES:
+        return  # no incremental exports yet; nothing to track
+
+    dirty_names = set()
+    for update in depsgraph.updates:
+        id_data = update.id.original
+        if isinstance(id_data, bpy.types.Object):
+            dirty_names.add(id_data.name)
+            if id_data.parent:
+                dirty_names.add(id_data.parent.name)
+        elif isinstance(id_data, bpy.types.Material):
+            for cache in _MSB_EXPORT_CACHES.values():
+                cache.invalidate()
+
+    if dirty_names:
+        for cache in _MSB_EXPORT_CACHES.values():
+            cache.dirty_names |= dirty_names
@@ -5,14 +5,16 @@ __all__ = [
 ]
 
 import re
+import time
 import traceback
 import typing as tp
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import bpy
 from io_soulstruct.general.game_config import GAME_CONFIG
-from io_soulstruct.collision.types import BlenderMapCollision
-from io_soulstruct.navmesh.nvm.types import BlenderNVM
+from io_soulstruct.collision.types import BlenderMapCollision, MapCollisionExportData
+from io_soulstruct.navmesh.nvm.types import BlenderNVM, NVMExportData
 from io_soulstruct.types import SoulstructType
 from io_soulstruct.utilities.operators import LoggingOperator
 from soulstruct.darksouls1ptde.maps.msb import MSB as MSB_PTDE
@@ -25,7 +27,9 @@ from soulstruct.demonssouls.maps.navmesh import NVMBND as NVMBND_DES
 from soulstruct.dcx import DCXType
 from soulstruct.games import *
 from soulstruct.utilities.text import natural_keys
+from soulstruct_havok.enums import PyHavokModule
 from soulstruct_havok.fromsoft.shared import HKXBHD, BothResHKXBHD
+from .export_cache import MSBExportCache, get_msb_export_cache, discard_msb_export_cache
 from .operator_config import *
 from .properties import MSBPartSubtype
 
@@ -33,6 +37,8 @@ if tp.TYPE_CHECKING:
     from io_soulstruct.msb.types import *
     from soulstruct.base.maps.msb.regions import BaseMSBRegion
     from soulstruct.base.maps.msb.events import BaseMSBEvent
+    from soulstruct.base.maps.navmesh.nvm import NVM
+    from soulstruct_havok.fromsoft.shared.map_collision import MapCollisionModel
 
 _MSB_COLLECTION_RE = re.compile(r"^(m\d\d_\d\d_\d\d_\d\d) MSB$")
 
@@ -126,6 +132,110 @@ class ExportMapMSB(LoggingOperator):
 
         self.to_object_mode()
 
+        if export_settings.incremental_export:
+            export_cache = get_msb_export_cache(settings.game.name, map_stem)
+            # Flush pending depsgraph updates (e.g. from leaving Edit Mode above) into the dirty set before using it.
+            context.view_layer.update()
+            self.info(f"{len(export_cache.dirty_names)} objects have changed since last export of MSB {map_stem}.")
+        else:
+            discard_msb_export_cache(settings.game.name, map_stem)
+            export_cache = None
+
+        # All objects whose changes affect MSB content, including Part models (e.g. for model names).
+        msb_obj_names = frozenset(
+            [obj.name for obj in bl_parts + bl_regions + bl_events]
+            + [obj.MSB_PART.model.name for obj in bl_parts if obj.MSB_PART.model]
+        )
+        msb_settings = (export_settings.use_world_transforms,)
+        msb = export_cache.get_msb(msb_obj_names, msb_settings) if export_cache else None
+        if msb is not None:
+            self.info(f"No MSB Parts, Regions, or Events have changed since last export. Reusing MSB {map_stem}.")
+        else:
+            msb = self.create_msb(context, msb_class, map_stem, bl_parts, bl_regions, bl_events)
+
+        # MSB is ready to write.
+        relative_msb_path = settings.get_relative_msb_path(map_stem)  # will use latest MSB version
+
+        try:
+            settings.export_file(self, msb, relative_msb_path, class_name="MSB")
+        except Exception as ex:
+            # Do not try to export NVMBND or NVMDUMP below.
+            if export_cache:
+                export_cache.invalidate()
+            return self.error(f"Could not export MSB. Error: {ex}")
+
+        self.info(
+            f"Exported MSB {map_stem} successfully with {len(bl_regions)} Regions, {len(bl_events)} Events, "
+            f"{len(bl_parts)} Parts, and {len(msb.get_models())} Models."
+        )
+        if export_cache:
+            export_cache.set_msb(msb, msb_obj_names, msb_settings)
+
+        soulstruct_project_root_path = settings.soulstruct_project_root_path
+        if soulstruct_project_root_path is not None and export_settings.export_soulstruct_jsons:
+            # Write MSB JSON to project 'maps' subfolder.
+            msb_json_path = soulstruct_project_root_path / "maps" / f"{map_stem}.json"
+            try:
+                msb.write_json(msb_json_path)
+            except Exception as ex:
+                self.error(f"Could not write MSB JSON to Soulstruct Project folder (MSBs still written). Error: {ex}")
+
+        if export_settings.export_nvmdump and isinstance(msb, MSB_DSR):
+            # Export NVMDUMP text file (DSR only).
+            relative_nvmdump_path = Path(f"map/{map_stem}/{map_stem}.nvmdump")
+            nvmdump = msb.get_nvmdump(map_stem)
+            settings.export_text_file(self, nvmdump, relative_nvmdump_path)
+            self.info(f"Exported NVMDUMP file next to NVMBND: {relative_nvmdump_path.name}")
+
+        part_classes = BLENDER_MSB_PART_TYPES[settings.game]  # type: dict[str, type[IBlenderMSBPart]]
+
+        if export_settings.export_navmesh_models:
+            bl_navmesh_type = part_classes[MSBPartSubtype.Navmesh]
+            bl_navmesh_parts = [
+                bl_navmesh_type(obj) for obj in bl_parts if obj.MSB_PART.part_subtype == MSBPartSubtype.Navmesh
+            ]
+            # NOTE: All these games use NVMBNDs.
+            if settings.is_game(DEMONS_SOULS, DARK_SOULS_PTDE, DARK_SOULS_DSR):
+                self.export_nvmbnd(context, map_stem, bl_navmesh_parts, export_cache)
+            else:
+                self.warning(f"Navmesh model export not supported for game '{settings.game}'.")
+        elif export_cache:
+            export_cache.nvms.clear()  # changes are not tracked for models that are not exported
+
+        if export_settings.export_collision_models:
+            bl_collision_type = part_classes[MSBPartSubtype.Collision]
+            bl_collision_parts = [
+                bl_collision_type(obj) for obj in bl_parts if obj.MSB_PART.part_subtype == MSBPartSubtype.Collision
+            ]
+            if settings.is_game(DEMONS_SOULS, DARK_SOULS_PTDE):
+                self.export_loose_hkxs(context, map_stem, bl_collision_parts, export_cache)
+            elif settings.is_game(DARK_SOULS_DSR):
+                self.export_hkxbhds(context, map_stem, bl_collision_parts, export_cache)
+            else:
+                self.warning(f"Collision model export not supported for game '{settings.game}'.")
+        elif export_cache:
+            export_cache.hkx_pairs.clear()  # changes are not tracked for models that are not exported
+
+        # NOTE: There is no option to export FLVER models, as this is slow and better done individually by user.
+
+        if export_cache:
+            # Everything changed so far is now reflected in the cache.
+            export_cache.dirty_names.clear()
+
+        return {"FINISHED"}
+
+    def create_msb(
+        self,
+        context: bpy.types.Context,
+        msb_class: type[MSB_PTDE | MSB_DSR | MSB_DES],
+        map_stem: str,
+        bl_parts: list[bpy.types.Object],
+        bl_regions: list[bpy.types.Object],
+        bl_events: list[bpy.types.Object],
+    ) -> MSB_PTDE | MSB_DSR | MSB_DES:
+        """Create a new MSB from all given (sorted) Blender MSB Part, Region, and Event objects."""
+        settings = self.settings(context)
+
         # Create new MSB. TODO: Type-hinting DS1 for now for my own convenience.
         msb = msb_class()  # type: MSB_PTDE | MSB_DSR | MSB_DES
 
@@ -181,62 +291,8 @@ class ExportMapMSB(LoggingOperator):
         # Finalize automatic references (e.g. Collision environments).
         msb.set_auto_references()
 
-        # MSB is ready to write.
-        relative_msb_path = settings.get_relative_msb_path(map_stem)  # will use latest MSB version
-
-        try:
-            settings.export_file(self, msb, relative_msb_path, class_name="MSB")
-        except Exception as ex:
-            # Do not try to export NVMBND or NVMDUMP below.
-            return self.error(f"Could not export MSB. Error: {ex}")
-
-        self.info(
-            f"Exported MSB {map_stem} successfully with {region_count} Regions, {event_count} Events, "
-            f"{part_count} Parts, and {len(msb.get_models())} Models."
-        )
-
-        soulstruct_project_root_path = settings.soulstruct_project_root_path
-        if soulstruct_project_root_path is not None and export_settings.export_soulstruct_jsons:
-            # Write MSB JSON to project 'maps' subfolder.
-            msb_json_path = soulstruct_project_root_path / "maps" / f"{map_stem}.json"
-            try:
-                msb.write_json(msb_json_path)
-            except Exception as ex:
-                self.error(f"Could not write MSB JSON to Soulstruct Project folder (MSBs still written). Error: {ex}")
-
-        if export_settings.export_nvmdump and isinstance(msb, MSB_DSR):
-            # Export NVMDUMP text file (DSR only).
-            relative_nvmdump_path = Path(f"map/{map_stem}/{map_stem}.nvmdump")
-            nvmdump = msb.get_nvmdump(map_stem)
-            settings.export_text_file(self, nvmdump, relative_nvmdump_path)
-            self.info(f"Exported NVMDUMP file next to NVMBND: {relative_nvmdump_path.name}")
-
-        if export_settings.export_navmesh_models:
-            bl_navmesh_type = part_classes[MSBPartSubtype.Navmesh]
-            bl_navmesh_parts = [
-                bl_navmesh_type(obj) for obj in bl_parts if obj.MSB_PART.part_subtype == MSBPartSubtype.Navmesh
-            ]
-            # NOTE: All these games use NVMBNDs.
-            if settings.is_game(DEMONS_SOULS, DARK_SOULS_PTDE, DARK_SOULS_DSR):
-                self.export_nvmbnd(context, map_stem, bl_navmesh_parts)
-            else:
-                self.warning(f"Navmesh model export not supported for game '{settings.game}'.")
-
-        if export_settings.export_collision_models:
-            bl_collision_type = part_classes[MSBPartSubtype.Collision]
-            bl_collision_parts = [
-                bl_collision_type(obj) for obj in bl_parts if obj.MSB_PART.part_subtype == MSBPartSubtype.Collision
-            ]
-            if settings.is_game(DEMONS_SOULS, DARK_SOULS_PTDE):
-                self.export_loose_hkxs(context, map_stem, bl_collision_parts)
-            elif settings.is_game(DARK_SOULS_DSR):
-                self.export_hkxbhds(context, map_stem, bl_collision_parts)
-            else:
-                self.warning(f"Collision model export not supported for game '{settings.game}'.")
-
-        # NOTE: There is no option to export FLVER models, as this is slow and better done individually by user.
-
-        return {"FINISHED"}
+        self.info(f"Created MSB {map_stem} with {region_count} Regions, {event_count} Events, and {part_count} Parts.")
+        return msb
 
     def export_loose_nvms(
         self, context: bpy.types.Context, map_stem: str, bl_navmeshes: list[IBlenderMSBPart]
@@ -245,37 +301,23 @@ class ExportMapMSB(LoggingOperator):
         settings = context.scene.soulstruct_settings
 
         relative_map_dir = Path(f"map/{map_stem}")
-        added_models = set()
-        for bl_navmesh in bl_navmeshes:
-            if not bl_navmesh.model:
-                # Log error (should never happen in any valid MSB), but continue.
-                self.error(f"Blender MSB Navmesh '{bl_navmesh.name}' has no model assigned to export.")
-                continue
-            model_stem = bl_navmesh.export_name
-            if model_stem in added_models:
-                self.warning(
-                    f"MSB {map_stem} has duplicate MSB Navmesh models ('{model_stem}'), which is extremely unusual."
-                )
-                continue
-            added_models.add(model_stem)
-            try:
-                nvm = BlenderNVM(bl_navmesh.model).to_soulstruct_obj(self, context)
-            except Exception as ex:
-                traceback.print_exc()
-                self.error(f"Could not export NVM navmesh model. Error: {ex}")
-                continue
-            else:
-                nvm.dcx_type = DCXType.Null  # no DCX compression inside DS1 NVMBND
-
+        nvms = self.convert_bl_navmeshes(context, map_stem, bl_navmeshes)
+        for model_stem, nvm in nvms.items():
             settings.export_file(self, nvm, relative_map_dir / f"{model_stem}.nvm")
 
-        if not added_models:
+        if not nvms:
             self.warning(f"No Navmesh models found to export in MSB {map_stem}. No NVMs written.")
             return {"CANCELLED"}
 
         return {"FINISHED"}
 
-    def export_nvmbnd(self, context: bpy.types.Context, map_stem: str, bl_navmeshes: list[IBlenderMSBPart]) -> set[str]:
+    def export_nvmbnd(
+        self,
+        context: bpy.types.Context,
+        map_stem: str,
+        bl_navmeshes: list[IBlenderMSBPart],
+        export_cache: MSBExportCache | None = None,
+    ) -> set[str]:
         """Collect and export brand new NVMBND containing all MSB Navmesh models."""
         settings = context.scene.soulstruct_settings
 
@@ -289,43 +331,122 @@ class ExportMapMSB(LoggingOperator):
         else:
             return self.error(f"NVMBND export not supported for game '{settings.game}'.")
 
-        added_models = set()
+        nvms = self.convert_bl_navmeshes(context, map_stem, bl_navmeshes, export_cache)
+        for model_stem, nvm in nvms.items():
+            nvmbnd.nvms[model_stem] = nvm  # no file suffix needed in `NVMBND` keys
+
+        if not nvms:
+            self.warning(f"No Navmesh models found to export in MSB {map_stem}. NVMBND not written.")
+            return {"CANCELLED"}
+
+        try:
+            settings.export_file(self, nvmbnd, relative_nvmbnd_path)
+        except Exception as ex:
+            return self.error(f"MSB {map_stem} was exported, but could not export new NVMBND. Error: {ex}")
+
+        return {"FINISHED"}
+
+    def convert_bl_navmeshes(
+        self,
+        context: bpy.types.Context,
+        map_stem: str,
+        bl_navmeshes: list[IBlenderMSBPart],
+        export_cache: MSBExportCache | None = None,
+    ) -> dict[str, NVM]:
+        """Convert the unique models of all given MSB Navmeshes to `NVM`s (with no DCX), keyed by model stem.
+
+        Mesh arrays are extracted from Blender for every model on the main thread first. Each model's connectivity,
+        triangles, and quadtree boxes are then computed in a thread pool, as this is independent CPU work that does not
+        touch Blender data. (Worker processes are not an option, as they cannot import this add-on without `bpy`.)
+        The returned dictionary preserves `bl_navmeshes` order regardless of completion order.
+
+        If `export_cache` is given, unchanged models are reused from the last export rather than converted again, and
+        the cache is updated with all models.
+
+        Logs a timing report of all converted models, slowest first.
+        """
+        export_datas = {}  # type: dict[str, NVMExportData]
+        extract_times = {}  # type: dict[str, float]
+        reused_nvms = {}  # type: dict[str, NVM]
+        model_obj_names = {}  # type: dict[str, str]
         for bl_navmesh in bl_navmeshes:
             if not bl_navmesh.model:
                 # Log error (should never happen in any valid MSB), but continue.
                 self.error(f"Blender MSB Navmesh '{bl_navmesh.name}' has no model assigned to export.")
                 continue
             model_stem = bl_navmesh.export_name
-            if model_stem in added_models:
+            if model_stem in export_datas or model_stem in reused_nvms:
                 self.warning(
                     f"MSB {map_stem} has duplicate MSB Navmesh models ('{model_stem}'), which is extremely unusual."
                 )
                 continue
-            added_models.add(model_stem)
+            model_obj_names[model_stem] = bl_navmesh.model.name
+            if export_cache and (nvm := export_cache.get_nvm(model_stem, bl_navmesh.model)) is not None:
+                reused_nvms[model_stem] = nvm
+                continue
+            p = time.perf_counter()
             try:
-                nvm = BlenderNVM(bl_navmesh.model).to_soulstruct_obj(self, context)
+                export_datas[model_stem] = BlenderNVM(bl_navmesh.model).get_nvm_export_data(self, context)
             except Exception as ex:
                 traceback.print_exc()
                 self.error(f"Could not export NVM navmesh model. Error: {ex}")
                 continue
-            else:
+            extract_times[model_stem] = time.perf_counter() - p
+
+        def convert(export_data: NVMExportData) -> tuple[NVM, list[str], float]:
+            _p = time.perf_counter()
+            _nvm, _warnings = BlenderNVM.nvm_from_export_data(export_data)
+            return _nvm, _warnings, time.perf_counter() - _p
+
+        p = time.perf_counter()
+        nvms = {}  # type: dict[str, NVM]
+        convert_times = {}  # type: dict[str, float]
+        with ThreadPoolExecutor() as executor:
+            futures = {
+                model_stem: executor.submit(convert, export_data) for model_stem, export_data in export_datas.items()
+            }
+            for model_stem, future in futures.items():
+                try:
+                    nvm, warnings, convert_times[model_stem] = future.result()
+                except Exception as ex:
+                    traceback.print_exc()
+                    self.error(f"Could not export NVM navmesh model '{model_stem}'. Error: {ex}")
+                    continue
+                for warning in warnings:
+                    self.warning(f"{model_stem}: {warning}")
                 nvm.dcx_type = DCXType.Null  # no DCX compression inside DS1 NVMBND
+                nvms[model_stem] = nvm
 
-            nvmbnd.nvms[model_stem] = nvm  # no file suffix needed in `NVMBND` keys
-
-        if not added_models:
-            self.warning(f"No Navmesh models found to export in MSB {map_stem}. NVMBND not written.")
-            return {"CANCELLED"}
-
-        try:
-            settings.export_file(self, nvmbnd, relative_nvmbnd_path)
-        except Exception as ex:
-            return self.error(f"MSB {map_stem} was exported, but could not export new NVMBND. Error: {ex}")
-
-        return {"FINISHED"}
+        self.info(
+            f"Converted {len(nvms)} NVM models in {sum(extract_times.values()):.3f} s (Blender data extraction) + "
+            f"{time.perf_counter() - p:.3f} s (parallel conversion)."
+        )
+        if export_cache:
+            self.info(f"Reused {len(reused_nvms)} unchanged NVM models from last export.")
+        model_times = {model_stem: extract_times[model_stem] + convert_times[model_stem] for model_stem in nvms}
+        for model_stem in sorted(model_times, key=lambda stem: model_times[stem], reverse=True):
+            self.info(
+                f"    {model_stem}: {model_times[model_stem]:.3f} s (extract {extract_times[model_stem]:.3f} s, "
+                f"convert {convert_times[model_stem]:.3f} s)"
+            )
+
+        if export_cache:
+            # Merge reused models back in `bl_navmeshes` order, and cache all (and only) current models.
+            nvms = {
+                model_stem: nvms[model_stem] if model_stem in nvms else reused_nvms[model_stem]
+                for model_stem in model_obj_names
+                if model_stem in nvms or model_stem in reused_nvms
+            }
+            export_cache.nvms = {model_stem: (model_obj_names[model_stem], nvm) for model_stem, nvm in nvms.items()}
+
+        return nvms
 
     def export_loose_hkxs(
-        self, context: bpy.types.Context, map_stem: str, bl_collisions: list[IBlenderMSBPart]
+        self,
+        context: bpy.types.Context,
+        map_stem: str,
+        bl_collisions: list[IBlenderMSBPart],
+        export_cache: MSBExportCache | None = None,
     ) -> set[str]:
         """Collect and export all both-res loose HKXs for all MSB Collision models."""
         settings = context.scene.soulstruct_settings
@@ -335,41 +456,24 @@ class ExportMapMSB(LoggingOperator):
             return self.error(f"Cannot export Collision models for game '{settings.game}' without PyHavok module.")
 
         relative_map_dir = Path(f"map/{map_stem}")
-        added_models = set()
-        for bl_collision in bl_collisions:
-            if not bl_collision.model:
-                # Log error (should never happen in any valid MSB), but continue.
-                self.error(f"Blender MSB Collision '{bl_collision.name}' has no model assigned to export.")
-                continue
-            model_stem = bl_collision.export_name
-            if model_stem in added_models:
-                # Acceptable, unlike navmeshes (e.g. kill planes or shifted dupes of some other kind).
-                continue
-            added_models.add(model_stem)
-
-            bl_collision_model = BlenderMapCollision(bl_collision.model)
-            try:
-                hi_hkx, lo_hkx = bl_collision_model.to_hkx_pair(
-                    self, py_havok_module, require_hi=True, use_hi_if_missing_lo=True
-                )
-            except Exception as ex:
-                self.error(f"Cannot get exported hi/lo HKX for '{bl_collision.model.name}'. Error: {ex}")
-                continue
-            hi_hkx.dcx_type = dcx_type
-            lo_hkx.dcx_type = dcx_type
-
+        hkx_pairs = self.convert_bl_collisions(context, bl_collisions, py_havok_module, dcx_type, export_cache)
+        for hi_hkx, lo_hkx in hkx_pairs.values():
             # TODO: Don't export lo if hi fails.
             settings.export_file(self, hi_hkx, relative_map_dir / f"{hi_hkx.path_stem}.hkx")
             settings.export_file(self, lo_hkx, relative_map_dir / f"{lo_hkx.path_stem}.hkx")
 
-        if not added_models:
+        if not hkx_pairs:
             self.warning(f"No Collision models found to export in MSB {map_stem}. No HKX files written.")
             return {"CANCELLED"}
 
         return {"FINISHED"}
 
     def export_hkxbhds(
-        self, context: bpy.types.Context, map_stem: str, bl_collisions: list[IBlenderMSBPart]
+        self,
+        context: bpy.types.Context,
+        map_stem: str,
+        bl_collisions: list[IBlenderMSBPart],
+        export_cache: MSBExportCache | None = None,
     ) -> set[str]:
         """Collect and export brand new both-res HKXBHDs containing all MSB Collision models."""
         settings = context.scene.soulstruct_settings
@@ -384,34 +488,14 @@ class ExportMapMSB(LoggingOperator):
             lo_res=HKXBHD(map_stem=map_stem, path=Path(f"map/{map_stem}/l{map_stem[1:]}.hkxbhd")),
             path=Path(f"map/{map_stem}"),
         )  # brand new empty HKXBHDs
-        added_models = set()
-
-        for bl_collision in bl_collisions:
-            if not bl_collision.model:
-                # Log error (should never happen in any valid MSB), but continue.
-                self.error(f"Blender MSB Collision '{bl_collision.name}' has no model assigned to export.")
-                continue
-            model_stem = bl_collision.export_name
-            if model_stem in added_models:
-                # Acceptable, unlike navmeshes (e.g. kill planes or shifted dupes of some other kind).
-                continue
-            added_models.add(model_stem)
-
-            bl_collision_model = BlenderMapCollision(bl_collision.model)
-            try:
-                hi_hkx, lo_hkx = bl_collision_model.to_hkx_pair(
-                    self, py_havok_module, require_hi=True, use_hi_if_missing_lo=True
-                )
-            except Exception as ex:
-                self.error(f"Cannot get exported hi/lo HKX for '{bl_collision.model.name}'. Error: {ex}")
-                continue
-            hi_hkx.dcx_type = dcx_type
-            lo_hkx.dcx_type = dcx_type
 
+        # Entries are set in MSB Part order, regardless of conversion completion order.
+        hkx_pairs = self.convert_bl_collisions(context, bl_collisions, py_havok_module, dcx_type, export_cache)
+        for hi_hkx, lo_hkx in hkx_pairs.values():
             both_res_hkxbhd.hi_res.set_hkx(hi_hkx.path_stem, hi_hkx)
             both_res_hkxbhd.lo_res.set_hkx(lo_hkx.path_stem, lo_hkx)
 
-        if not added_models:
+        if not hkx_pairs:
             self.warning(f"No Collision models found to export in MSB {map_stem}. HKXBHDs not written.")
             return {"CANCELLED"}
 
@@ -423,3 +507,101 @@ class ExportMapMSB(LoggingOperator):
             return self.error(f"MSB {map_stem} was exported, but could not export new Collision HKXBHDs. Error: {ex}")
 
         return {"FINISHED"}
+
+    def convert_bl_collisions(
+        self,
+        context: bpy.types.Context,
+        bl_collisions: list[IBlenderMSBPart],
+        py_havok_module: PyHavokModule,
+        dcx_type: DCXType,
+        export_cache: MSBExportCache | None = None,
+    ) -> dict[str, tuple[MapCollisionModel, MapCollisionModel]]:
+        """Convert the unique models of all given MSB Collisions to hi/lo `MapCollisionModel` pairs, keyed by model
+        stem.
+
+        Every model is triangulated and has its mesh arrays extracted from Blender on the main thread first. Each
+        model's submesh splitting and hi/lo `MapCollisionModel` creation is then done in a thread pool, as this does not
+        touch Blender data. The returned dictionary preserves `bl_collisions` order regardless of completion order, so
+        binder entry order is deterministic.
+
+        If `export_cache` is given, unchanged models are reused from the last export rather than converted again, and
+        the cache is updated with all models.
+
+        Logs a timing report of all converted models, slowest first.
+        """
+        export_datas = {}  # type: dict[str, MapCollisionExportData]
+        extract_times = {}  # type: dict[str, float]
+        reused_hkx_pairs = {}  # type: dict[str, tuple[MapCollisionModel, MapCollisionModel]]
+        model_obj_names = {}  # type: dict[str, str]
+        for bl_collision in bl_collisions:
+            if not bl_collision.model:
+                # Log error (should never happen in any valid MSB), but continue.
+                self.error(f"Blender MSB Collision '{bl_collision.name}' has no model assigned to export.")
+                continue
+            model_stem = bl_collision.export_name
+            if model_stem in export_datas or model_stem in reused_hkx_pairs:
+                # Acceptable, unlike navmeshes (e.g. kill planes or shifted dupes of some other kind).
+                continue
+            model_obj_names[model_stem] = bl_collision.model.name
+            if export_cache and (hkx_pair := export_cache.get_hkx_pair(model_stem, bl_collision.model)) is not None:
+                reused_hkx_pairs[model_stem] = hkx_pair
+                continue
+            p = time.perf_counter()
+            try:
+                export_datas[model_stem] = BlenderMapCollision(bl_collision.model).get_hkx_export_data()
+            except Exception as ex:
+                self.error(f"Cannot get exported hi/lo HKX for '{bl_collision.model.name}'. Error: {ex}")
+                continue
+            extract_times[model_stem] = time.perf_counter() - p
+
+        def convert(export_data: MapCollisionExportData):
+            _p = time.perf_counter()
+            _hi_hkx, _lo_hkx, _warnings = BlenderMapCollision.hkx_pair_from_export_data(
+                export_data, py_havok_module, require_hi=True, use_hi_if_missing_lo=True
+            )
+            return _hi_hkx, _lo_hkx, _warnings, time.perf_counter() - _p
+
+        p = time.perf_counter()
+        hkx_pairs = {}  # type: dict[str, tuple[MapCollisionModel, MapCollisionModel]]
+        convert_times = {}  # type: dict[str, float]
+        with ThreadPoolExecutor() as executor:
+            futures = {
+                model_stem: executor.submit(convert, export_data) for model_stem, export_data in export_datas.items()
+            }
+            for model_stem, future in futures.items():
+                try:
+                    hi_hkx, lo_hkx, warnings, convert_times[model_stem] = future.result()
+                except Exception as ex:
+                    self.error(f"Cannot get exported hi/lo HKX for '{export_datas[model_stem].name}'. Error: {ex}")
+                    continue
+                for warning in warnings:
+                    self.warning(warning)
+                hi_hkx.dcx_type = dcx_type
+                lo_hkx.dcx_type = dcx_type
+                hkx_pairs[model_stem] = (hi_hkx, lo_hkx)
+
+        self.info(
+            f"Converted {len(hkx_pairs)} Collision models in {sum(extract_times.values()):.3f} s (Blender data "
+            f"extraction) + {time.perf_counter() - p:.3f} s (parallel conversion)."
+        )
+        if export_cache:
+            self.info(f"Reused {len(reused_hkx_pairs)} unchanged Collision models from last export.")
+        model_times = {model_stem: extract_times[model_stem] + convert_times[model_stem] for model_stem in hkx_pairs}
+        for model_stem in sorted(model_times, key=lambda stem: model_times[stem], reverse=True):
+            self.info(
+                f"    {model_stem}: {model_times[model_stem]:.3f} s (extract {extract_times[model_stem]:.3f} s, "
+                f"convert {convert_times[model_stem]:.3f} s)"
+            )
+
+        if export_cache:
+            # Merge reused models back in `bl_collisions` order, and cache all (and only) current models.
+            hkx_pairs = {
+                model_stem: hkx_pairs[model_stem] if model_stem in hkx_pairs else reused_hkx_pairs[model_stem]
+                for model_stem in model_obj_names
+                if model_stem in hkx_pairs or model_stem in reused_hkx_pairs
+            }
+            export_cache.hkx_pairs = {
+                model_stem: (model_obj_names[model_stem], hkx_pair) for model_stem, hkx_pair in hkx_pairs.items()
+            }
+
+        return hkx_pairs
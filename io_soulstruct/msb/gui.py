@@ -111,6 +111,7 @@ class MSBImportExportPanel(bpy.types.Panel):
         if settings.map_stem:
             layout.label(text=f"From/To {settings.map_stem}:")
             layout.operator(ImportMapMSB.bl_idname)
+            layout.operator(UpdateMapMSB.bl_idname)
             layout.operator(ExportMapMSB.bl_idname)
         else:
             layout.label(text="No game map selected.")
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 __all__ = [
     "ImportMapMSB",
+    "UpdateMapMSB",
     "ImportAnyMSB",
 ]
 
@@ -19,13 +20,17 @@ from soulstruct.darksouls1ptde.maps import MSB as PTDE_MSB
 from soulstruct.darksouls1r.maps import MSB as DSR_MSB
 from soulstruct.demonssouls.maps import MSB as DES_MSB
 
-from io_soulstruct.exceptions import BatchOperationUnsupportedError, UnsupportedGameTypeError, MissingPartModelError
+from io_soulstruct.exceptions import *
 from io_soulstruct.msb import darksouls1ptde, darksouls1r, demonssouls
+from io_soulstruct.msb.utilities import get_msb_entry_hash
 from io_soulstruct.general.cached import get_cached_file
+from io_soulstruct.types import SoulstructType
 from io_soulstruct.utilities import *
 from io_soulstruct.utilities.operators import LoggingOperator, LoggingImportOperator
+from soulstruct.base.maps.msb import MSBEntry
 from soulstruct.games import *
 from soulstruct.utilities.misc import IDList
+from soulstruct.utilities.text import natural_keys
 
 if tp.TYPE_CHECKING:
     from io_soulstruct.type_checking import *
@@ -67,9 +72,119 @@ PART_SUBTYPE_ORDER = (
 )
 
 
+def _get_bl_obj_entry_group(obj: bpy.types.Object) -> tuple[str, str] | None:
+    """Get `(soulstruct_type, subtype)` of an existing Blender MSB entry object, or `None` if it isn't one."""
+    match obj.soulstruct_type:
+        case SoulstructType.MSB_PART:
+            return obj.soulstruct_type, obj.MSB_PART.part_subtype
+        case SoulstructType.MSB_REGION:
+            return obj.soulstruct_type, obj.MSB_REGION.region_subtype
+        case SoulstructType.MSB_EVENT:
+            return obj.soulstruct_type, obj.MSB_EVENT.event_subtype
+    return None
+
+
+def _get_bl_type_entry_group(
+    bl_type: type[IBlenderMSBPart | IBlenderMSBRegion | IBlenderMSBEvent],
+) -> tuple[str, str]:
+    """Get `(soulstruct_type, subtype)` of objects created by `bl_type`, matching `_get_bl_obj_entry_group()`."""
+    match bl_type.TYPE:
+        case SoulstructType.MSB_PART:
+            return bl_type.TYPE, bl_type.PART_SUBTYPE
+        case SoulstructType.MSB_REGION:
+            return bl_type.TYPE, bl_type.REGION_SUBTYPE
+        case _:
+            return bl_type.TYPE, bl_type.EVENT_SUBTYPE.value
+
+
+class _ExistingMSBEntries:
+    """Existing Blender entry objects in an MSB collection, matched to incoming MSB entries by subtype and export name
+    when updating from MSB. Objects that are never matched have vanished from the MSB.
+
+    Event names need not be unique, so duplicates are matched in Blender name order.
+    """
+
+    def __init__(self, msb_collection: bpy.types.Collection | None):
+        self._unnamed = {}  # type: dict[tuple[str, str], list[bpy.types.Object]]
+        self._named = {}  # type: dict[tuple[str, str], dict[str, list[bpy.types.Object]]]
+        if msb_collection is None:
+            return
+        checked_names = set()
+        for collection in [msb_collection] + list(msb_collection.children_recursive):
+            for obj in collection.objects:
+                if obj.name in checked_names:
+                    continue
+                checked_names.add(obj.name)
+                if (group := _get_bl_obj_entry_group(obj)) is not None:
+                    self._unnamed.setdefault(group, []).append(obj)
+        for objs in self._unnamed.values():
+            objs.sort(key=lambda x: natural_keys(x.name))
+
+    def pop(
+        self, bl_type: type[IBlenderMSBPart | IBlenderMSBRegion | IBlenderMSBEvent], entry_name: str
+    ) -> bpy.types.Object | None:
+        """Pop the first unmatched existing object of `bl_type` with export name `entry_name`, if any."""
+        group = _get_bl_type_entry_group(bl_type)
+        if group not in self._named:
+            # Resolve export names of this group on first use (depends on `bl_type`).
+            named = self._named[group] = {}
+            for obj in self._unnamed.pop(group, []):
+                try:
+                    export_name = bl_type(obj).export_name
+                except SoulstructTypeError:
+                    continue  # invalid object data type; ignored entirely
+                named.setdefault(export_name, []).append(obj)
+        objs = self._named[group].get(entry_name)
+        return objs.pop(0) if objs else None
+
+    def get_unmatched(self) -> list[bpy.types.Object]:
+        unmatched = [obj for objs in self._unnamed.values() for obj in objs]
+        for named in self._named.values():
+            for objs in named.values():
+                unmatched.extend(objs)
+        return unmatched
+
+
+def _remove_bl_msb_entry(obj: bpy.types.Object, replacement: bpy.types.Object = None):
+    """Delete MSB entry `obj`, along with its own Mesh (e.g. Region shape) and duplicated Part Armature parent if they
+    are no longer used.
+
+    If `replacement` is given, all references to `obj` (entry pointer properties, Blender children, etc.) are remapped
+    to it first, and it takes the name of `obj`.
+    """
+    name = obj.name
+    data = obj.data
+    armature_parent = obj.parent if obj.parent and obj.parent.type == "ARMATURE" else None
+    if replacement is not None:
+        for collection in obj.users_collection:
+            collection.objects.unlink(obj)
+        obj.user_remap(replacement)
+    bpy.data.objects.remove(obj)
+    if isinstance(data, bpy.types.Mesh) and data.users == 0:
+        bpy.data.meshes.remove(data)  # not a shared model mesh
+    if armature_parent is not None and not armature_parent.children:
+        armature = armature_parent.data
+        bpy.data.objects.remove(armature_parent)
+        if armature.users == 0:
+            bpy.data.armatures.remove(armature)
+    if replacement is not None:
+        replacement.name = name
+
+
 def _import_msb(
-    operator: LoggingOperator, context: Context, msb: MSB_TYPING, msb_stem: str, oldest_map_stem: str
+    operator: LoggingOperator,
+    context: Context,
+    msb: MSB_TYPING,
+    msb_stem: str,
+    oldest_map_stem: str,
+    update_existing=False,
 ) -> set[str]:
+    """Create Blender objects for all MSB Regions, Parts, and Events, with Part models if enabled.
+
+    If `update_existing` is enabled, existing entries in the MSB collection are matched by subtype and name. Those whose
+    MSB entry is unchanged since they were last updated are skipped, changed ones are re-created in place (with
+    references to them remapped), and vanished ones are optionally removed. Otherwise, no matching or hashing is done.
+    """
 
     settings = operator.settings(context)
     msb_import_settings = context.scene.msb_import_settings
@@ -109,13 +224,49 @@ def _import_msb(
         context.scene.collection, f"{msb_stem} MSB", f"{msb_stem} Regions/Events"
     )
 
+    # For `update_existing` only. Existing entries are matched lazily, in the same order as they are created below.
+    existing_entries = _ExistingMSBEntries(bpy.data.collections.get(f"{msb_stem} MSB") if update_existing else None)
+    created_count = updated_count = unchanged_count = 0
+
+    def match_existing(bl_type_, entry_: MSBEntry) -> tuple[bpy.types.Object | None, str | None, bool]:
+        """Returns existing object (if any), `entry_` hash, and whether the existing object is already up to date."""
+        if not update_existing:
+            return None, None, False
+        entry_hash_ = get_msb_entry_hash(entry_)
+        existing_obj_ = existing_entries.pop(bl_type_, entry_.name)
+        is_unchanged_ = existing_obj_ is not None and existing_obj_.get("MSB_ENTRY_HASH") == entry_hash_
+        return existing_obj_, entry_hash_, is_unchanged_
+
+    def finish_entry(bl_obj_: bpy.types.Object, existing_obj_: bpy.types.Object | None, entry_hash_: str | None):
+        """Record `entry_hash_` (if updating) on new object and swap it in for `existing_obj_`, if given."""
+        nonlocal created_count, updated_count
+        if entry_hash_ is not None:
+            bl_obj_["MSB_ENTRY_HASH"] = entry_hash_
+        if existing_obj_ is not None:
+            _remove_bl_msb_entry(existing_obj_, replacement=bl_obj_)
+            updated_count += 1
+        else:
+            created_count += 1
+
     # TODO: Delete all created objects if/when an error is raised.
 
+    # 0. Match existing Parts first (if updating), so only new and changed Parts have their models imported.
+    # MSB entries are not hashable, so matches are keyed by Part ID.
+    parts_to_import = IDList()
+    existing_part_matches = {}  # type: dict[int, tuple[bpy.types.Object | None, str | None]]
+    for part in msb.get_parts():
+        existing_obj, entry_hash, is_unchanged = match_existing(get_bl_part_type(part), part)
+        if is_unchanged:
+            unchanged_count += 1
+            continue
+        parts_to_import.append(part)
+        existing_part_matches[id(part)] = (existing_obj, entry_hash)
+
     # 1. Find all Parts that will have their models imported.
     part_name_filter = msb_import_settings.get_name_match_filter()
     batched_parts_with_models = {}  # for batch import attempt
     all_parts_with_models = IDList()  # for backup single import attempt
-    for part in msb.get_parts():
+    for part in parts_to_import:
 
         if not part.model:
             continue
@@ -154,13 +305,20 @@ def _import_msb(
     region_count = 0
     for region in msb.get_regions():
         bl_region_type = get_bl_region_type(region)
+        existing_obj, entry_hash, is_unchanged = match_existing(bl_region_type, region)
+        if is_unchanged:
+            unchanged_count += 1
+            continue
         try:
-            # Don't need to get created object or provide a subcollection.
-            bl_region_type.new_from_soulstruct_obj(operator, context, region, region.name, regions_events_collection)
+            # Don't need to provide a subcollection.
+            bl_region = bl_region_type.new_from_soulstruct_obj(
+                operator, context, region, region.name, regions_events_collection
+            )
         except Exception as ex:
             # Fatal error.
             traceback.print_exc()
             return operator.error(f"Failed to import {region.cls_name} '{region.name}': {ex}")
+        finish_entry(bl_region.obj, existing_obj, entry_hash)
         region_count += 1
 
     # 4. Import Parts in a particular order so references will exist. TODO: Currently DS1 subtypes only.
@@ -172,6 +330,9 @@ def _import_msb(
             continue  # not a subtype in this game
         parts = getattr(msb, part_list_name)
         for part in parts:
+            if part not in parts_to_import:
+                continue  # unchanged
+            existing_obj, entry_hash = existing_part_matches[id(part)]
             bl_part_type = get_bl_part_type(part)
             part_subtype_collection = get_or_create_collection(
                 parts_collection,
@@ -181,7 +342,7 @@ def _import_msb(
                 # We only import the model here if models were requested for this part subtype and batch import for
                 # this subtype was unsupported above. Otherwise, an empty model will be created (with a warning).
                 try_import_model = part in all_parts_with_models
-                bl_part_type.new_from_soulstruct_obj(
+                bl_part = bl_part_type.new_from_soulstruct_obj(
                     operator,
                     context,
                     part,
@@ -194,12 +355,17 @@ def _import_msb(
                 # Fatal error.
                 traceback.print_exc()
                 return operator.error(f"Failed to import {part.cls_name} '{part.name}': {ex}")
+            finish_entry(bl_part.obj, existing_obj, entry_hash)
             part_count += 1
 
     # 5. Import Events last, as they may reference Parts and Regions.
     event_count = 0
     for event in msb.get_events():
         bl_event_type = get_bl_event_type(event)
+        existing_obj, entry_hash, is_unchanged = match_existing(bl_event_type, event)
+        if is_unchanged:
+            unchanged_count += 1
+            continue
         try:
             bl_event = bl_event_type.new_from_soulstruct_obj(
                 operator, context, event, event.name, regions_events_collection, msb_stem
@@ -213,8 +379,27 @@ def _import_msb(
             # Should exist in Blender among Parts or Regions imported above. If `None`, it's a harmless assignment.
             bl_event.parent = getattr(bl_event, bl_event.PARENT_PROP_NAME)
 
+        finish_entry(bl_event.obj, existing_obj, entry_hash)
         event_count += 1
 
+    if update_existing:
+        # 6. Remove (or just report) existing entries that are no longer in the MSB.
+        vanished_objs = existing_entries.get_unmatched()
+        removed_count = 0
+        if msb_import_settings.update_removes_vanished_entries:
+            for obj in vanished_objs:
+                _remove_bl_msb_entry(obj)
+                removed_count += 1
+        elif vanished_objs:
+            operator.warning(
+                f"Kept {len(vanished_objs)} existing Blender MSB entries that are no longer in MSB {msb_stem}."
+            )
+        operator.info(
+            f"Updated MSB {msb_stem} in {time.perf_counter() - p:.3f} seconds: {created_count} entries created, "
+            f"{updated_count} updated, {unchanged_count} unchanged, and {removed_count} removed."
+        )
+        return {"FINISHED"}
+
     operator.info(
         f"Imported {part_count} Parts, {region_count} Regions, and {event_count} Events from MSB {msb_stem} "
         f"in {time.perf_counter() - p:.3f} seconds."
@@ -254,7 +439,39 @@ class ImportMapMSB(LoggingOperator):
         msb = get_cached_file(msb_path, settings.get_game_msb_class())  # type: MSB_TYPING
         oldest_map_stem = settings.get_oldest_map_stem_version(msb_stem)
 
-        return _import_msb(self, context, msb, msb_stem, oldest_map_stem)
+        with indexed_objects():  # MSB model and reference lookups reuse one tight name index
+            return _import_msb(self, context, msb, msb_stem, oldest_map_stem)
+
+
+class UpdateMapMSB(LoggingOperator):
+    """Update existing Parts, Regions, and Events of active map's MSB collection from its (externally edited) MSB.
+
+    Only entries that are new or have changed since they were last updated are (re-)created. Changed entries replace
+    their existing Blender objects, with all Blender references to those objects preserved. Entries are hashed only by
+    this operator (not by normal MSB import), so the first update of a map re-creates all of its entries once.
+    """
+
+    bl_idname = "import_scene.update_map_msb"
+    bl_label = "Update From MSB"
+    bl_options = {"REGISTER", "UNDO"}
+    bl_description = ("Update existing Parts, Regions, and Events from the active map's MSB, re-creating only new or "
+                      "changed entries (and optionally removing vanished ones)")
+
+    @classmethod
+    def poll(cls, context):
+        return ImportMapMSB.poll(context)
+
+    def execute(self, context):
+
+        settings = self.settings(context)
+
+        msb_stem = settings.get_latest_map_stem_version()
+        msb_path = settings.get_import_msb_path()  # will automatically use latest MSB version if known and enabled
+        msb = get_cached_file(msb_path, settings.get_game_msb_class())  # type: MSB_TYPING  # re-read if changed
+        oldest_map_stem = settings.get_oldest_map_stem_version(msb_stem)
+
+        with indexed_objects():
+            return _import_msb(self, context, msb, msb_stem, oldest_map_stem, update_existing=True)
 
 
 class ImportAnyMSB(LoggingImportOperator):
@@ -312,4 +529,5 @@ class ImportAnyMSB(LoggingImportOperator):
             except Exception as ex:
                 return self.error(f"Failed to load MSB file: {ex}")
 
-        return _import_msb(self, context, msb, msb_stem, oldest_map_stem)
+        with indexed_objects():  # MSB model and reference lookups reuse one tight name index
+            return _import_msb(self, context, msb, msb_stem, oldest_map_stem)
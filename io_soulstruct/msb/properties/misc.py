@@ -86,6 +86,13 @@ class MSBImportSettings(bpy.types.PropertyGroup):
         default=True,
     )
 
+    update_removes_vanished_entries: bpy.props.BoolProperty(
+        name="Update Removes Vanished Entries",
+        description="When updating from MSB, delete existing Blender Parts, Regions, and Events in the MSB collection "
+                    "that are no longer in the MSB. Otherwise, they are kept and reported",
+        default=False,
+    )
+
 
 class MSBExportSettings(bpy.types.PropertyGroup):
 
@@ -123,6 +130,14 @@ class MSBExportSettings(bpy.types.PropertyGroup):
         default=False,
     )
 
+    incremental_export: bpy.props.BoolProperty(
+        name="Incremental Export",
+        description="Track changes to Blender objects after each export of this map and, on the next export, only "
+                    "regenerate the MSB and Navmesh/Collision models affected by changed objects (reusing the last "
+                    "exported content for the rest). The first export of a map in each session is always a full export",
+        default=False,
+    )
+
 
 class MSBToolSettings(bpy.types.PropertyGroup):
 
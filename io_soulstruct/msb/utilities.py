@@ -2,8 +2,12 @@ from __future__ import annotations
 
 __all__ = [
     "find_flver_model",
+    "get_msb_entry_hash",
     "BaseMSBEntrySelectOperator",
+    "read_flver_binders_batch",
     "batch_import_flver_models",
+    "batch_import_collision_models",
+    "batch_import_nvm_models",
     "primitive_circle",
     "primitive_sphere",
     "primitive_cylinder",
@@ -14,19 +18,23 @@ __all__ = [
 ]
 
 import abc
+import hashlib
 import re
 import shutil
 import tempfile
 import time
 import traceback
 import typing as tp
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import bpy
-from io_soulstruct.exceptions import FLVERError, MissingPartModelError
+from io_soulstruct.collision.types import BlenderMapCollision
+from io_soulstruct.exceptions import FLVERError, FLVERImportError, MissingPartModelError
 from io_soulstruct.flver.models import BlenderFLVER
 from io_soulstruct.flver.image.image_import_manager import ImageImportManager
 from io_soulstruct.general.cached import get_cached_file
+from io_soulstruct.navmesh.nvm.types import BlenderNVM
 from io_soulstruct.types import SoulstructType
 from io_soulstruct.utilities import *
 from soulstruct.containers import Binder, BinderEntry
@@ -35,6 +43,9 @@ from soulstruct.base.models.flver0 import FLVER0
 from soulstruct.base.models.flver0.mesh_tools import MergedMesh as FLVER0MergedMesh
 from soulstruct.base.models.flver import FLVER
 from soulstruct.base.models.flver.mesh_tools import MergedMesh as FLVERMergedMesh
+from soulstruct.base.maps.navmesh.nvm import NVM
+from soulstruct.utilities.maths import BaseVector
+from soulstruct_havok.fromsoft.shared import MapCollisionModel
 
 
 def find_flver_model(model_name: str) -> BlenderFLVER:
@@ -51,6 +62,23 @@ def find_flver_model(model_name: str) -> BlenderFLVER:
         raise MissingPartModelError(f"Blender object '{model_name}' is not a valid FLVER model mesh.")
 
 
+def get_msb_entry_hash(entry: MSBEntry) -> str:
+    """Hash the subtype, name, description, and all field values of MSB `entry`, with referenced MSB entries (models,
+    parts, regions) represented by their names and vectors by their full-precision floats. Used to detect entries that
+    have changed since they were last imported."""
+    values = [entry.cls_name, entry.name, entry.description]
+    for field_name in entry.get_field_names(visible_only=False):
+        value = getattr(entry, field_name)
+        if isinstance(value, MSBEntry):
+            value = value.name
+        elif isinstance(value, BaseVector):
+            value = tuple(float(x) for x in value)  # `repr` is rounded
+        elif isinstance(value, list):
+            value = [element.name if isinstance(element, MSBEntry) else element for element in value]
+        values.append((field_name, value))
+    return hashlib.sha1(repr(values).encode()).hexdigest()
+
+
 class BaseMSBEntrySelectOperator(LoggingOperator):
 
     # Set by `invoke` when entry choices are written to temp directory.
@@ -183,6 +211,47 @@ class BaseMSBEntrySelectOperator(LoggingOperator):
         ...
 
 
+def read_flver_binders_batch(
+    operator: LoggingOperator,
+    binder_paths: dict[str, Path],
+    binder_type_name: str,
+) -> tuple[dict[str, BinderEntry], dict[str, Binder]]:
+    """Open and decompress all given binders (e.g. CHRBNDs or OBJBNDs) concurrently and return each one's first FLVER
+    entry and the binder itself, both keyed by model name, for `batch_import_flver_models()`.
+
+    Raises `FLVERImportError` for the first binder (in `binder_paths` order) that contains no FLVER, as before.
+    """
+    if not binder_paths:
+        return {}, {}
+
+    p = time.perf_counter()
+    # DCX decompression (zlib) and file reading release the GIL, so threads suffice here.
+    with ThreadPoolExecutor() as executor:
+        binders = dict(zip(binder_paths.keys(), executor.map(Binder.from_path, binder_paths.values())))
+    operator.info(f"Opened {len(binders)} {binder_type_name}s in {time.perf_counter() - p:.2f} seconds.")
+
+    flver_entries = {}
+    for model_name, binder in binders.items():
+        entries = binder.find_entries_matching_name(r".*\.flver(\.dcx)?")
+        if not entries:
+            raise FLVERImportError(f"Cannot find a FLVER file in {binder_type_name} {binder_paths[model_name]}.")
+        flver_entries[model_name] = entries[0]
+    return flver_entries, binders
+
+
+def _read_batch(
+    file_class: type[FLVER | FLVER0 | MapCollisionModel | NVM], sources: list[BinderEntry | Path]
+) -> list[tp.Any | None]:
+    """Read all `sources` in parallel with `file_class` batch reader. Failed reads are `None`."""
+    if all(isinstance(data, Path) for data in sources):
+        return file_class.from_path_batch(sources)
+    elif all(isinstance(data, BinderEntry) for data in sources):
+        return file_class.from_binder_entry_batch(sources)
+    raise ValueError(
+        f"All {file_class.__name__} model data for batch importing must be either `BinderEntry` or `Path` objects."
+    )
+
+
 def batch_import_flver_models(
     operator: LoggingOperator,
     context: Context,
@@ -202,12 +271,7 @@ def batch_import_flver_models(
     flver_class = FLVER0 if uses_flver0 else FLVER
     merged_mesh_class = FLVER0MergedMesh if uses_flver0 else FLVERMergedMesh
 
-    if all(isinstance(data, Path) for data in flver_sources.values()):
-        flvers_list = flver_class.from_path_batch(list(flver_sources.values()))
-    elif all(isinstance(data, BinderEntry) for data in flver_sources.values()):
-        flvers_list = flver_class.from_binder_entry_batch(list(flver_sources.values()))
-    else:
-        raise ValueError("All FLVER model data for batch importing must be either `BinderEntry` or `Path` objects.")
+    flvers_list = _read_batch(flver_class, list(flver_sources.values()))
     # Drop failed FLVERs immediately.
     flvers = {
         model_name: flver
@@ -260,6 +324,8 @@ def batch_import_flver_models(
             (submesh_bl_material_indices, bl_material_uv_layer_names, merge_submesh_vertices)
         )
 
+    if image_import_manager:
+        image_import_manager.log_stats()
     operator.info(
         f"Created materials for {len(flvers)} {part_subtype_title} FLVERs in {time.perf_counter() - p:.2f} seconds."
     )
@@ -324,6 +390,91 @@ def batch_import_flver_models(
     operator.info(f"Imported {len(flvers)} {part_subtype_title} FLVERs in {time.perf_counter() - p:.2f} seconds.")
 
 
+def batch_import_collision_models(
+    operator: LoggingOperator,
+    context: Context,
+    hkx_sources: dict[str, tuple[BinderEntry | Path, BinderEntry | Path]],
+    map_stem: str,
+):
+    """Read all hi-res and lo-res HKX pairs in `hkx_sources` in parallel, then create a Blender Map Collision mesh for
+    each model."""
+    operator.info(f"Importing {len(hkx_sources)} Collision HKX pairs in parallel.")
+
+    p = time.perf_counter()
+    # Hi and lo-res sources are interleaved in one batch.
+    hkx_list = _read_batch(MapCollisionModel, [data for hi_lo_data in hkx_sources.values() for data in hi_lo_data])
+    collisions = {}  # type: dict[str, tuple[MapCollisionModel, MapCollisionModel]]
+    for i, model_name in enumerate(hkx_sources.keys()):
+        hi_collision, lo_collision = hkx_list[2 * i], hkx_list[2 * i + 1]
+        if hi_collision is None or lo_collision is None:
+            # Drop failed HKX pairs immediately. Batch reader has already logged the error.
+            operator.error(f"Cannot import HKX '{model_name}' in map {map_stem}: failed to read hi-res or lo-res HKX.")
+            continue
+        collisions[model_name] = (hi_collision, lo_collision)
+
+    operator.info(f"Read {len(collisions)} Collision HKX pairs in {time.perf_counter() - p:.2f} seconds.")
+    p = time.perf_counter()
+
+    model_collection = get_or_create_collection(
+        context.scene.collection,
+        f"{map_stem} Models",
+        f"{map_stem} Collision Models",
+        hide_viewport=context.scene.msb_import_settings.hide_model_collections,
+    )
+    for model_name, (hi_collision, lo_collision) in collisions.items():
+        try:
+            BlenderMapCollision.new_from_soulstruct_obj(
+                operator, context, hi_collision, model_name, collection=model_collection, lo_collision=lo_collision
+            )
+        except Exception as ex:
+            traceback.print_exc()  # for inspection in Blender console
+            operator.error(f"Cannot import HKX '{model_name}' in map {map_stem}. Error: {ex}")
+
+    operator.info(f"Imported {len(collisions)} Collision HKX pairs in {time.perf_counter() - p:.2f} seconds.")
+
+
+def batch_import_nvm_models(
+    operator: LoggingOperator,
+    context: Context,
+    nvm_sources: dict[str, BinderEntry | Path],
+    map_stem: str,
+):
+    """Read all NVMs in `nvm_sources` in parallel, then create a Blender NVM mesh for each model."""
+    operator.info(f"Importing {len(nvm_sources)} Navmesh NVMs in parallel.")
+
+    p = time.perf_counter()
+    nvms_list = _read_batch(NVM, list(nvm_sources.values()))
+    # Drop failed NVMs immediately.
+    nvms = {
+        model_name: nvm
+        for model_name, nvm in zip(nvm_sources.keys(), nvms_list)
+        if nvm is not None
+    }
+    if len(nvms) < len(nvm_sources):
+        operator.error(f"Failed to read {len(nvm_sources) - len(nvms)} NVMs in map {map_stem}. See console.")
+
+    operator.info(f"Read {len(nvms)} Navmesh NVMs in {time.perf_counter() - p:.2f} seconds.")
+    p = time.perf_counter()
+
+    model_collection = get_or_create_collection(
+        context.scene.collection,
+        f"{map_stem} Models",
+        f"{map_stem} Navmesh Models",
+        hide_viewport=context.scene.msb_import_settings.hide_model_collections,
+    )
+    for model_name, nvm in nvms.items():
+        try:
+            bl_nvm = BlenderNVM.new_from_soulstruct_obj(operator, context, nvm, model_name, collection=model_collection)
+        except Exception as ex:
+            traceback.print_exc()  # for inspection in Blender console
+            operator.error(f"Cannot import NVM: {model_name}. Error: {ex}")
+            continue
+        bl_nvm.set_face_materials(nvm)
+        # Don't create quadtree boxes.
+
+    operator.info(f"Imported {len(nvms)} Navmesh NVMs in {time.perf_counter() - p:.2f} seconds.")
+
+
 def primitive_circle(mesh: bpy.types.Mesh):
     """Create a primitive 32-point 2D circle."""
     mesh.clear_geometry()
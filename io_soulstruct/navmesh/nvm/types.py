@@ -3,11 +3,13 @@ from __future__ import annotations
 __all__ = [
     "BlenderNVM",
     "BlenderNVMEventEntity",
+    "NVMExportData",
 ]
 
+import typing as tp
+
 import numpy as np
 
-import bmesh
 import bpy
 from mathutils import Vector
 
@@ -16,7 +18,18 @@ from io_soulstruct.exceptions import NVMExportError
 from io_soulstruct.types import *
 from io_soulstruct.utilities import *
 from .properties import *
-from .utilities import set_face_material
+from .utilities import get_face_flags_material_index, get_face_edge_connectivity
+
+
+class NVMExportData(tp.NamedTuple):
+    """Arrays extracted from a Blender NVM mesh (in game coordinates), which can be converted to an `NVM` off the main
+    thread."""
+    name: str
+    vertices: np.ndarray
+    faces: np.ndarray
+    face_flags: np.ndarray
+    face_obstacle_counts: np.ndarray
+    event_entities: list[NVMEventEntity]
 
 
 class BlenderNVM(SoulstructObject[NVM, NVMProps]):
@@ -44,42 +57,44 @@ class BlenderNVM(SoulstructObject[NVM, NVMProps]):
 
         nvm = soulstruct_obj
 
-        # Create mesh.
+        # Create mesh with `foreach_set()` calls. NVM meshes are already triangulated.
         mesh = bpy.data.meshes.new(name=name)
-        vertices = GAME_TO_BL_ARRAY(nvm.vertices)
-        edges = []  # no edges in NVM
-        faces = [triangle.vertex_indices for triangle in nvm.triangles]
-        mesh.from_pydata(vertices, edges, faces)
-
-        # Create `BMesh` (as we need to assign face flag data to a custom `int` layer).
-        bm = bmesh.new()
-        bm.from_mesh(mesh)
-        bm.verts.ensure_lookup_table()
-        bm.faces.ensure_lookup_table()
-        flags_layer = bm.faces.layers.int.new("nvm_face_flags")
-        obstacle_count_layer = bm.faces.layers.int.new("nvm_face_obstacle_count")
-        for f_i, face in enumerate(bm.faces):
-            nvm_triangle = nvm.triangles[f_i]
-            face[flags_layer] = nvm_triangle.flags
-            face[obstacle_count_layer] = nvm_triangle.obstacle_count
+        vertices = GAME_TO_BL_ARRAY(nvm.vertices).astype(np.float32)
+        faces = np.array([triangle.vertex_indices for triangle in nvm.triangles], dtype=np.int32).reshape(-1, 3)
+        face_count = faces.shape[0]
+
+        mesh.vertices.add(vertices.shape[0])
+        mesh.vertices.foreach_set("co", vertices.ravel())
+        mesh.loops.add(faces.size)
+        mesh.loops.foreach_set("vertex_index", faces.ravel())
+        mesh.polygons.add(face_count)
+        mesh.polygons.foreach_set("loop_start", np.arange(0, face_count * 3, 3, dtype=np.int32))
+        mesh.polygons.foreach_set("loop_total", np.full(face_count, 3, dtype=np.int32))
+        mesh.update(calc_edges=True)
+
+        # Assign face flag data to custom `int` face attributes (accessible as `BMesh` face layers).
+        face_flags = np.fromiter((triangle.flags for triangle in nvm.triangles), dtype=np.int32, count=face_count)
+        face_obstacle_counts = np.fromiter(
+            (triangle.obstacle_count for triangle in nvm.triangles), dtype=np.int32, count=face_count
+        )
+        mesh.attributes.new("nvm_face_flags", "INT", "FACE").data.foreach_set("value", face_flags)
+        mesh.attributes.new("nvm_face_obstacle_count", "INT", "FACE").data.foreach_set("value", face_obstacle_counts)
 
         bl_nvm = cls.new(name, data=mesh, collection=collection)  # type: BlenderNVM
 
+        face_centers = vertices[faces].mean(axis=1)  # same as `BMFace.calc_center_median()` for triangles
         for nvm_event in nvm.event_entities:
             # Get the average position of the faces. This is purely for show and is not exported.
-            avg_pos = Vector((0, 0, 0))
-            for i in nvm_event.triangle_indices:
-                avg_pos += bm.faces[i].calc_center_median()
-            avg_pos /= len(nvm_event.triangle_indices)
+            if nvm_event.triangle_indices:
+                avg_pos = Vector(face_centers[nvm_event.triangle_indices].mean(axis=0))
+            else:
+                avg_pos = Vector((0, 0, 0))
             nvm_event_name = f"{name} Event {nvm_event.entity_id}"
             bl_event = BlenderNVMEventEntity.new_from_soulstruct_obj(
                 operator, context, nvm_event, nvm_event_name, collection, location=avg_pos
             )
             bl_event.obj.parent = bl_nvm.obj
 
-        bm.to_mesh(mesh)
-        del bm
-
         return bl_nvm
 
     def get_nvm_event_entities(self) -> list[BlenderNVMEventEntity]:
@@ -97,92 +112,116 @@ class BlenderNVM(SoulstructObject[NVM, NVMProps]):
         We do not do any triangulation here; the NVM model should already be triangulated exactly as desired, as the
         triangles actually matter for navigation.
         """
+        export_data = self.get_nvm_export_data(operator, context)
+        nvm, warnings = self.nvm_from_export_data(export_data)
+        for warning in warnings:
+            operator.warning(warning)
+        return nvm
+
+    def get_nvm_export_data(self, operator: LoggingOperator, context: bpy.types.Context) -> NVMExportData:
+        """Extract all Blender data needed to create an `NVM` as arrays, which can then be converted on any thread with
+        `nvm_from_export_data()`. Must be called on the main thread, as it accesses Blender data.
+        """
         mesh_data = self.obj.data
-        nvm_verts = np.array([vert.co for vert in mesh_data.vertices], dtype=np.float32)
+        nvm_verts = np.empty((len(mesh_data.vertices), 3), dtype=np.float32)
+        mesh_data.vertices.foreach_get("co", nvm_verts.ravel())
         # Swap Y and Z coordinates.
         nvm_verts[:, [1, 2]] = nvm_verts[:, [2, 1]]
 
-        nvm_faces = []  # type: list[tuple[int, int, int]]
-        for face in mesh_data.polygons:
-            if len(face.vertices) != 3:
-                raise NVMExportError(
-                    f"Found a non-triangle mesh face in NVM (face {face.index}). You must triangulate it first."
-                )
-            # noinspection PyTypeChecker
-            vertices = tuple(face.vertices)  # type: tuple[int, int, int]
-            nvm_faces.append(vertices)
-
-        def find_connected_face_index(edge_v1: int, edge_v2: int, not_face) -> int:
-            """Find face that shares an edge with the given edge.
-
-            Returns -1 if no connected face is found (i.e. edge is on the edge of the mesh).
-            """
-            # TODO: Could surely iterate over faces just once for this?
-            for i_, f_ in enumerate(nvm_faces):
-                if f_ != not_face and edge_v1 in f_ and edge_v2 in f_:  # order doesn't matter
-                    return i_
-            return -1
+        face_count = len(mesh_data.polygons)
+        loop_starts = np.empty(face_count, dtype=np.int32)
+        loop_totals = np.empty(face_count, dtype=np.int32)
+        mesh_data.polygons.foreach_get("loop_start", loop_starts)
+        mesh_data.polygons.foreach_get("loop_total", loop_totals)
+        if np.any(non_triangles := loop_totals != 3):
+            raise NVMExportError(
+                f"Found a non-triangle mesh face in NVM (face {np.argmax(non_triangles)}). "
+                f"You must triangulate it first."
+            )
+        loop_vertex_indices = np.empty(len(mesh_data.loops), dtype=np.int32)
+        mesh_data.loops.foreach_get("vertex_index", loop_vertex_indices)
+        nvm_faces = loop_vertex_indices[loop_starts[:, np.newaxis] + np.arange(3)]
+
+        # Read custom `int` face attributes for `flags` and `obstacle_count` (same data as `BMesh` face layers).
+        face_layer_arrays = []
+        for layer_name in ("nvm_face_flags", "nvm_face_obstacle_count"):
+            attribute = mesh_data.attributes.get(layer_name)
+            if attribute is None or attribute.domain != "FACE" or attribute.data_type != "INT":
+                raise ValueError(f"NVM mesh does not have '{layer_name}' custom face layer.")
+            layer_array = np.empty(face_count, dtype=np.int32)
+            attribute.data.foreach_get("value", layer_array)
+            face_layer_arrays.append(layer_array)
+
+        event_entities = [
+            nvm_event_entity.to_soulstruct_obj(operator, context)
+            for nvm_event_entity in self.get_nvm_event_entities()
+        ]
+
+        return NVMExportData(
+            name=self.name,
+            vertices=nvm_verts,
+            faces=nvm_faces,
+            face_flags=face_layer_arrays[0],
+            face_obstacle_counts=face_layer_arrays[1],
+            event_entities=event_entities,
+        )
+
+    @staticmethod
+    def nvm_from_export_data(export_data: NVMExportData) -> tuple[NVM, list[str]]:
+        """Compute face connectivity, create `NVM` triangles, and create `NVM` (which also generates its quadtree
+        boxes) from extracted `export_data`.
+
+        Does not access any Blender data, so can be run in a worker thread. Returns the new `NVM` and a list of warning
+        messages for the caller to log.
+        """
+        warnings = []
 
         # Get connected faces along each edge of each face.
-        nvm_connected_face_indices = []  # type: list[tuple[int, int, int]]
-        for face in nvm_faces:
-            connected_v1 = find_connected_face_index(face[0], face[1], face)
-            connected_v2 = find_connected_face_index(face[1], face[2], face)
-            connected_v3 = find_connected_face_index(face[2], face[0], face)
-            nvm_connected_face_indices.append((connected_v1, connected_v2, connected_v3))
-            if connected_v1 == -1 and connected_v2 == -1 and connected_v3 == -1:
-                operator.warning(f"NVM face {face} appears to have no connected faces, which is very suspicious!")
-
-        # Create `BMesh` to access custom face layers for `flags` and `obstacle_count`.
-        bm = bmesh.new()
-        bm.from_mesh(mesh_data)
-        bm.verts.ensure_lookup_table()
-        bm.faces.ensure_lookup_table()
-
-        flags_layer = bm.faces.layers.int.get("nvm_face_flags")
-        if not flags_layer:
-            raise ValueError("NVM mesh does not have 'nvm_face_flags' custom face layer.")
-        obstacle_count_layer = bm.faces.layers.int.get("nvm_face_obstacle_count")
-        if not obstacle_count_layer:
-            raise ValueError("NVM mesh does not have 'nvm_face_obstacle_count' custom face layer.")
-
-        nvm_flags = []
-        nvm_obstacle_counts = []
-        for bm_face in bm.faces:
-            nvm_flags.append(bm_face[flags_layer])
-            nvm_obstacle_counts.append(bm_face[obstacle_count_layer])
-        if len(nvm_flags) != len(nvm_faces):
-            raise ValueError("NVM mesh has different number of `Mesh` faces and `BMesh` face flags.")
+        connected_array, non_manifold_edges = get_face_edge_connectivity(export_data.faces)
+        for v1, v2 in non_manifold_edges.tolist():
+            warnings.append(
+                f"NVM edge between vertices {v1} and {v2} is shared by more than two faces. Only the first other face "
+                f"will be recorded as connected along it."
+            )
+        # noinspection PyTypeChecker
+        nvm_faces = [tuple(face) for face in export_data.faces.tolist()]  # type: list[tuple[int, int, int]]
+        for i in np.flatnonzero(np.all(connected_array == -1, axis=1)):
+            warnings.append(f"NVM face {nvm_faces[i]} appears to have no connected faces, which is very suspicious!")
 
         nvm_triangles = [
             NVMTriangle(
-                vertex_indices=nvm_faces[i],
-                connected_indices=nvm_connected_face_indices[i],
-                obstacle_count=nvm_obstacle_counts[i],
-                flags=nvm_flags[i],
+                vertex_indices=vertex_indices,
+                connected_indices=tuple(connected_indices),
+                obstacle_count=obstacle_count,
+                flags=flags,
+            )
+            for vertex_indices, connected_indices, obstacle_count, flags in zip(
+                nvm_faces,
+                connected_array.tolist(),
+                export_data.face_obstacle_counts.tolist(),
+                export_data.face_flags.tolist(),
             )
-            for i in range(len(nvm_faces))
-        ]
-
-        event_entities = [
-            nvm_event_entity.to_soulstruct_obj(operator, context)
-            for nvm_event_entity in self.get_nvm_event_entities()
         ]
 
         nvm = NVM(
             big_endian=False,
-            vertices=nvm_verts,
+            vertices=export_data.vertices,
             triangles=nvm_triangles,
-            event_entities=event_entities,
-            # quadtree boxes generated automatically on pack
+            event_entities=export_data.event_entities,
+            # quadtree boxes generated automatically on creation
         )
 
-        return nvm
+        return nvm, warnings
 
     def set_face_materials(self, nvm: NVM):
+        """Set all face material indices in one batch, looking up each unique `flags` value's material only once."""
         mesh_data = self.obj.data
-        for bl_tri, nvm_triangle in zip(mesh_data.polygons, nvm.triangles):
-            set_face_material(mesh_data, bl_tri, nvm_triangle.flags)
+        face_flags = np.fromiter((triangle.flags for triangle in nvm.triangles), dtype=np.int32)
+        unique_flags, face_flag_indices = np.unique(face_flags, return_inverse=True)
+        flag_material_indices = np.array(
+            [get_face_flags_material_index(mesh_data, int(flags)) for flags in unique_flags], dtype=np.int32
+        )
+        mesh_data.polygons.foreach_set("material_index", flag_material_indices[face_flag_indices.ravel()])
 
     def create_nvm_quadtree(
         self, context: bpy.types.Context, nvm: NVM, model_name: str, collection: bpy.types.Collection = None
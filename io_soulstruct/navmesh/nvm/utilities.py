@@ -7,11 +7,14 @@ __all__ = [
     "NAVMESH_FLAG_COLORS",
     "NAVMESH_MULTIPLE_FLAG_COLOR",
     "set_face_material",
+    "get_face_flags_material_index",
+    "get_face_edge_connectivity",
 ]
 
 import re
 
 import bpy
+import numpy as np
 from io_soulstruct.utilities.materials import hsv_color, create_basic_material
 from soulstruct.base.maps.navmesh import NavmeshFlag
 
@@ -52,6 +55,17 @@ def set_face_material(bl_mesh, bl_face, face_flags: int):
 
     NOTE: `bl_face` can be from a `Mesh` or `BMesh`. Both have `material_index`.
     """
+    material_index = get_face_flags_material_index(bl_mesh, face_flags)
+    bl_face.material_index = material_index
+    return bl_mesh.materials[material_index]
+
+
+def get_face_flags_material_index(bl_mesh, face_flags: int) -> int:
+    """Get the index of the material for `NVMTriangle` flags `face_flags` in `bl_mesh`, adding it to the mesh (and
+    creating it, if it doesn't exist in the Blender session yet) as required.
+
+    Allows whole meshes to have their face material indices set in one batch.
+    """
 
     # Color face according to its single `flag` if present.
     try:
@@ -63,8 +77,7 @@ def set_face_material(bl_mesh, bl_face, face_flags: int):
 
     material_index = bl_mesh.materials.find(material_name)
     if material_index >= 0:
-        bl_face.material_index = material_index
-        return bl_mesh.materials[material_name]
+        return material_index
 
     # Try to get existing material from Blender.
     try:
@@ -87,7 +100,72 @@ def set_face_material(bl_mesh, bl_face, face_flags: int):
     except (AttributeError, KeyError):
         pass  # ignore
 
-    # Add material to this mesh and this face.
-    bl_face.material_index = len(bl_mesh.materials)
+    # Add material to this mesh.
     bl_mesh.materials.append(bl_material)
-    return bl_material
+    return len(bl_mesh.materials) - 1
+
+
+def get_face_edge_connectivity(faces: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Find the face connected along each edge of each triangle in `(F, 3)` vertex index array `faces`.
+
+    Returns an `(F, 3)` array of connected face indices (-1 for boundary edges), where column `i` corresponds to the
+    edge from vertex `i` to vertex `(i + 1) % 3`, as used by `NVMTriangle.connected_indices`. Also returns a `(E, 2)`
+    array of the (sorted) vertex pairs of any non-manifold edges, i.e. edges shared by more than two faces.
+
+    Each face edge is keyed by its sorted vertex pair, and all edge keys are sorted together, so every face sharing an
+    edge is found in one pass rather than by scanning all faces for each edge. When an edge is shared by more than two
+    faces, the lowest-indexed other face is used. Faces with identical vertex tuples are never connected to each other.
+    """
+    faces = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+    face_count = faces.shape[0]
+    connected = np.full((face_count, 3), -1, dtype=np.int32)
+    if face_count == 0:
+        return connected, np.empty((0, 2), dtype=np.int64)
+
+    # One 'half-edge' per face corner, in face-major order (matching raveled `connected`).
+    half_edges = np.stack((faces, np.roll(faces, -1, axis=1)), axis=2).reshape(-1, 2)
+    half_edges.sort(axis=1)
+    half_edge_faces = np.repeat(np.arange(face_count), 3)
+
+    # Sort half-edges by edge key (then face index) and find runs of the same edge.
+    edge_keys = half_edges[:, 0] * (faces.max() + 1) + half_edges[:, 1]
+    order = np.lexsort((half_edge_faces, edge_keys))
+    sorted_keys = edge_keys[order]
+    group_starts = np.flatnonzero(np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1])))
+    group_sizes = np.diff(np.append(group_starts, sorted_keys.size))
+
+    connected_flat = connected.reshape(-1)  # view
+
+    # Standard (manifold) edges: each half-edge's connected face is the other one.
+    pair_starts = group_starts[group_sizes == 2]
+    first, second = order[pair_starts], order[pair_starts + 1]
+    connected_flat[first] = half_edge_faces[second]
+    connected_flat[second] = half_edge_faces[first]
+    # Faces with identical vertex tuples (including a degenerate face's own repeated edge) don't count.
+    same_tuple = np.all(faces[half_edge_faces[first]] == faces[half_edge_faces[second]], axis=1)
+    connected_flat[first[same_tuple]] = -1
+    connected_flat[second[same_tuple]] = -1
+
+    def first_other_face(half_edge: int, candidate_faces: np.ndarray) -> int:
+        own_face = faces[half_edge_faces[half_edge]]
+        for candidate in candidate_faces:
+            if not np.array_equal(faces[candidate], own_face):
+                return int(candidate)
+        return -1
+
+    # Edges shared by more than two half-edges (rare): take the lowest-indexed other face.
+    non_manifold_edges = []
+    for start, size in zip(group_starts[group_sizes > 2], group_sizes[group_sizes > 2]):
+        group_half_edges = order[start:start + size]
+        group_faces = np.unique(half_edge_faces[group_half_edges])
+        for half_edge in group_half_edges:
+            connected_flat[half_edge] = first_other_face(half_edge, group_faces)
+        if group_faces.size > 2 and half_edges[group_half_edges[0], 0] != half_edges[group_half_edges[0], 1]:
+            non_manifold_edges.append(half_edges[group_half_edges[0]])
+
+    # Degenerate edges (same vertex twice): any other face that uses that vertex is considered connected.
+    for half_edge in np.flatnonzero(half_edges[:, 0] == half_edges[:, 1]):
+        candidate_faces = np.flatnonzero(np.any(faces == half_edges[half_edge, 0], axis=1))
+        connected_flat[half_edge] = first_other_face(half_edge, candidate_faces)
+
+    return connected, np.array(non_manifold_edges, dtype=np.int64).reshape(-1, 2)
@@ -101,6 +101,8 @@ class SoulstructObject(abc.ABC, tp.Generic[SOULSTRUCT_T, SOULSTRUCT_PROPS_T]):
                 raise SoulstructTypeError(f"Unsupported Soulstruct OBJ_DATA_TYPE '{cls.OBJ_DATA_TYPE}'.")
         obj.soulstruct_type = cls.TYPE
         (collection or bpy.context.scene.collection).objects.link(obj)
+        from io_soulstruct.utilities.bpy_data import index_new_obj  # circular import
+        index_new_obj(obj)
         return cls(obj)
 
     @classmethod
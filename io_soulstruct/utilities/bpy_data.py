@@ -4,12 +4,15 @@ __all__ = [
     "new_mesh_object",
     "new_armature_object",
     "new_empty_object",
+    "indexed_objects",
+    "index_new_obj",
     "find_obj",
     "find_obj_or_create_empty",
     "copy_obj_property_group",
     "copy_armature_pose",
 ]
 
+import contextlib
 import typing as tp
 
 import bpy
@@ -21,11 +24,68 @@ if tp.TYPE_CHECKING:
     PROPS_TYPE = tp.Union[tp.Dict[str, tp.Any], bpy.types.Object, None]
 
 
+# Operation-scoped index of all Blender objects by tight name (see `indexed_objects()`). `None` when inactive.
+_TIGHT_NAME_INDEX = None  # type: dict[str, list[bpy.types.Object]] | None
+
+
+@contextlib.contextmanager
+def indexed_objects():
+    """Index all Blender objects by tight name once for the duration of a large operation (e.g. MSB import), so that
+    `find_obj(find_stem=True)` and `find_obj_or_create_empty(find_stem=True)` don't scan all of `bpy.data.objects` on
+    every exact-name miss.
+
+    Objects created with `new_*_object()`, `SoulstructObject.new()`, or `find_obj_or_create_empty()` are added to the
+    index as they are created (see `index_new_obj()`). Soulstruct type is checked at lookup time, so it may be set after
+    creation. Nested uses share the outermost index.
+    """
+    global _TIGHT_NAME_INDEX
+    if _TIGHT_NAME_INDEX is not None:
+        yield
+        return
+    index = {}
+    for obj in bpy.data.objects:
+        index.setdefault(get_bl_obj_tight_name(obj), []).append(obj)
+    _TIGHT_NAME_INDEX = index
+    try:
+        yield
+    finally:
+        _TIGHT_NAME_INDEX = None
+
+
+def index_new_obj(obj: bpy.types.Object):
+    """Add newly created `obj` to the active `indexed_objects()` index, if any."""
+    if _TIGHT_NAME_INDEX is not None:
+        _TIGHT_NAME_INDEX.setdefault(get_bl_obj_tight_name(obj), []).append(obj)
+
+
+def _find_obj_with_stem(name: str, soulstruct_type: SoulstructType | None) -> bpy.types.Object | None:
+    """Find first object whose tight name is `name` and whose Soulstruct type is `soulstruct_type` (required)."""
+    if not soulstruct_type:
+        return None
+    if _TIGHT_NAME_INDEX is None:
+        for obj in bpy.data.objects:
+            if get_bl_obj_tight_name(obj) == name and obj.soulstruct_type == soulstruct_type:
+                return obj
+        return None
+
+    objs = _TIGHT_NAME_INDEX.get(name, [])
+    for obj in tuple(objs):
+        try:
+            is_match = get_bl_obj_tight_name(obj) == name and obj.soulstruct_type == soulstruct_type
+        except ReferenceError:
+            objs.remove(obj)  # deleted during operation
+            continue
+        if is_match:
+            return obj
+    return None
+
+
 def new_mesh_object(
     name: str, data: bpy.types.Mesh, soulstruct_type: SoulstructType = SoulstructType.NONE
 ) -> bpy.types.MeshObject:
     mesh_obj = bpy.data.objects.new(name, data)
     mesh_obj.soulstruct_type = soulstruct_type
+    index_new_obj(mesh_obj)
     # noinspection PyTypeChecker
     return mesh_obj
 
@@ -37,6 +97,7 @@ def new_armature_object(
 ) -> bpy.types.ArmatureObject:
     armature_obj = bpy.data.objects.new(name, data)
     armature_obj.soulstruct_type = soulstruct_type
+    index_new_obj(armature_obj)
     # noinspection PyTypeChecker
     return armature_obj
 
@@ -45,6 +106,7 @@ def new_empty_object(name: str, soulstruct_type: SoulstructType = SoulstructType
     # noinspection PyTypeChecker
     empty_obj = bpy.data.objects.new(name, None)
     empty_obj.soulstruct_type = soulstruct_type
+    index_new_obj(empty_obj)
     return empty_obj
 
 
@@ -61,9 +123,7 @@ def find_obj(
     except KeyError:
         if find_stem:
             # Try to find an object with the same stem (e.g. "h1234" for "h1234 (Floor).003").
-            for obj in bpy.data.objects:
-                if get_bl_obj_tight_name(obj) == name and (soulstruct_type and obj.soulstruct_type == soulstruct_type):
-                    return obj
+            return _find_obj_with_stem(name, soulstruct_type)
     return None
 
 
@@ -81,15 +141,16 @@ def find_obj_or_create_empty(
     except KeyError:
         if find_stem:
             # Try to find an object with the same stem (e.g. "h1234" for "h1234 (Floor).003").
-            for obj in bpy.data.objects:
-                if get_bl_obj_tight_name(obj) == name and (soulstruct_type and obj.soulstruct_type == soulstruct_type):
-                    return False, obj
+            obj = _find_obj_with_stem(name, soulstruct_type)
+            if obj is not None:
+                return False, obj
 
         missing_collection = get_or_create_collection(bpy.context.scene.collection, missing_collection_name)
         obj = bpy.data.objects.new(name, None)
         if soulstruct_type:
             obj.soulstruct_type = soulstruct_type
         missing_collection.objects.link(obj)
+        index_new_obj(obj)
         return True, obj
 
 
@@ -2,6 +2,12 @@ from __future__ import annotations
 
 __all__ = [
     "np_cross",
+    "get_non_degenerate_face_mask",
+    "quaternion_to_matrix_arrays",
+    "euler_to_matrix_arrays",
+    "compose_matrix_arrays",
+    "decompose_matrix_arrays",
+    "make_quaternions_continuous",
 ]
 
 import numpy as np
@@ -15,3 +21,117 @@ def np_cross(array_a: np.ndarray, array_b: np.ndarray) -> np.ndarray:
     See line 506 in `numpy/core/numeric.pyi`.
     """
     return np.cross(array_a, array_b)
+
+
+def get_non_degenerate_face_mask(faces: np.ndarray) -> np.ndarray:
+    """Return a boolean mask of the rows of `faces` (vertex indices) that do NOT repeat any vertex index.
+
+    Exactly equivalent to `len(np.unique(row)) == faces.shape[1]` for every row, but compares each pair of columns
+    across the whole array rather than calling into Python per row. Works for any number of columns, so any extra
+    (e.g. material index) columns should be dropped before calling this.
+    """
+    faces = np.asarray(faces)
+    mask = np.ones(faces.shape[0], dtype=bool)
+    column_count = faces.shape[1]
+    for i in range(column_count - 1):
+        for j in range(i + 1, column_count):
+            mask &= faces[:, i] != faces[:, j]
+    return mask
+
+
+def quaternion_to_matrix_arrays(quats: np.ndarray) -> np.ndarray:
+    """Convert an `(..., 4)` array of unit quaternions (WXYZ) to an `(..., 3, 3)` array of rotation matrices."""
+    w, x, y, z = quats[..., 0], quats[..., 1], quats[..., 2], quats[..., 3]
+    rot = np.empty(quats.shape[:-1] + (3, 3), dtype=np.float64)
+    rot[..., 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    rot[..., 0, 1] = 2.0 * (x * y - w * z)
+    rot[..., 0, 2] = 2.0 * (x * z + w * y)
+    rot[..., 1, 0] = 2.0 * (x * y + w * z)
+    rot[..., 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    rot[..., 1, 2] = 2.0 * (y * z - w * x)
+    rot[..., 2, 0] = 2.0 * (x * z - w * y)
+    rot[..., 2, 1] = 2.0 * (y * z + w * x)
+    rot[..., 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return rot
+
+
+def euler_to_matrix_arrays(eulers: np.ndarray, order: str) -> np.ndarray:
+    """Convert an `(..., 3)` array of Blender Euler angles (XYZ, radians) with rotation `order` (e.g. 'XYZ', which
+    rotates around X first) to an `(..., 3, 3)` array of rotation matrices."""
+    rot = np.broadcast_to(np.eye(3), eulers.shape[:-1] + (3, 3))
+    for axis_name in order:
+        axis = "XYZ".index(axis_name)
+        i, j = (axis + 1) % 3, (axis + 2) % 3
+        cos, sin = np.cos(eulers[..., axis]), np.sin(eulers[..., axis])
+        axis_rot = np.zeros(eulers.shape[:-1] + (3, 3), dtype=np.float64)
+        axis_rot[..., axis, axis] = 1.0
+        axis_rot[..., i, i] = cos
+        axis_rot[..., i, j] = -sin
+        axis_rot[..., j, i] = sin
+        axis_rot[..., j, j] = cos
+        rot = axis_rot @ rot  # later axes are applied on the left
+    return rot
+
+
+def compose_matrix_arrays(locations: np.ndarray, rotations: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """Compose `(..., 3)` locations, `(..., 3, 3)` rotation matrices, and `(..., 3)` scales into an `(..., 4, 4)` array
+    of affine matrices, as in `Matrix.LocRotScale()`."""
+    matrices = np.zeros(locations.shape[:-1] + (4, 4), dtype=np.float64)
+    matrices[..., :3, :3] = rotations * scales[..., np.newaxis, :]
+    matrices[..., :3, 3] = locations
+    matrices[..., 3, 3] = 1.0
+    return matrices
+
+
+def decompose_matrix_arrays(matrices: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Decompose an `(..., 4, 4)` array of affine matrices into location `(..., 3)`, rotation quaternion WXYZ
+    `(..., 4)`, and scale `(..., 3)` arrays.
+
+    Array equivalent of `Matrix.decompose()`: a negative determinant negates all scale components, and quaternions are
+    returned with non-negative W.
+    """
+    location = matrices[..., :3, 3].copy()
+    rot_scale = matrices[..., :3, :3]
+    scale = np.linalg.norm(rot_scale, axis=-2)  # column lengths
+    rot = np.divide(
+        rot_scale, scale[..., np.newaxis, :], out=np.zeros_like(rot_scale), where=scale[..., np.newaxis, :] != 0.0
+    )
+    negative = np.linalg.det(rot) < 0.0
+    rot[negative] *= -1.0
+    scale[negative] *= -1.0
+
+    # Same branches as Blender's `mat3_normalized_to_quat_fast()` (Mike Day's method), which matters for the sheared
+    # rotation matrices produced under non-uniformly scaled parents.
+    m00, m11, m22 = rot[..., 0, 0], rot[..., 1, 1], rot[..., 2, 2]
+    squares = np.stack(
+        [1.0 + m00 + m11 + m22, 1.0 + m00 - m11 - m22, 1.0 - m00 + m11 - m22, 1.0 - m00 - m11 + m22], axis=-1
+    )
+    largest = np.where(m22 < 0.0, np.where(m00 > m11, 1, 2), np.where(m00 < -m11, 3, 0))
+    diffs = (rot[..., 2, 1] - rot[..., 1, 2], rot[..., 0, 2] - rot[..., 2, 0], rot[..., 1, 0] - rot[..., 0, 1])
+    sums = (rot[..., 2, 1] + rot[..., 1, 2], rot[..., 0, 2] + rot[..., 2, 0], rot[..., 1, 0] + rot[..., 0, 1])
+    quat = np.empty(rot.shape[:-2] + (4,), dtype=rot.dtype)
+    for i, (w, x, y, z) in enumerate((
+        (squares[..., 0], diffs[0], diffs[1], diffs[2]),
+        (diffs[0], squares[..., 1], sums[2], sums[1]),
+        (diffs[1], sums[2], squares[..., 2], sums[0]),
+        (diffs[2], sums[1], sums[0], squares[..., 3]),
+    )):
+        mask = largest == i
+        quat[mask] = np.stack([w[mask], x[mask], y[mask], z[mask]], axis=-1)
+    quat /= np.linalg.norm(quat, axis=-1, keepdims=True)
+    quat[quat[..., 0] < 0.0] *= -1.0  # canonical non-negative W
+    return location, quat, scale
+
+
+def make_quaternions_continuous(quats: np.ndarray):
+    """Negate quaternions in `(F, ..., 4)` array `quats` (in place) wherever their dot product with the previous
+    frame's (possibly already negated) quaternion is negative, to avoid discontinuities (reversed rotation direction).
+    """
+    if len(quats) < 2:
+        return
+    dots = np.einsum("f...i,f...i->f...", quats[:-1], quats[1:])  # dots of original (canonical) quaternions
+    signs = np.ones(quats.shape[:-1], dtype=quats.dtype)
+    for f, frame_dots in enumerate(dots, start=1):
+        # Sign flips accumulate, except that a zero dot product with the previous (flipped) quaternion resets it.
+        signs[f] = np.where(signs[f - 1] * frame_dots < 0.0, -1.0, 1.0)
+    quats *= signs[..., np.newaxis]
@@ -0,0 +1,131 @@
+"""Module-level functions for `multiprocessing` worker processes used by the add-on.
+
+Worker processes are spawned with Blender's bundled Python interpreter, where `bpy` (and therefore the `io_soulstruct`
+package) cannot be imported. The add-on puts this directory on `sys.path`, which spawned workers inherit, so this module
+is imported by its top-level name on both sides. It must only depend on Soulstruct, Soulstruct-Havok, and NumPy.
+"""
+from __future__ import annotations
+
+__all__ = [
+    "get_hkx_game_module",
+    "get_root_motion",
+    "get_armature_frames",
+    "get_transform_frames",
+    "init_animation_worker",
+    "read_transform_frames",
+]
+
+import types
+import typing as tp
+
+import numpy as np
+from soulstruct.containers import BinderEntry
+from soulstruct_havok.core import HKX
+from soulstruct_havok.utilities.maths import TRSTransform
+from soulstruct_havok.fromsoft.base import BaseAnimationHKX, BaseSkeletonHKX
+from soulstruct_havok.fromsoft import darksouls1ptde, darksouls1r, bloodborne, eldenring
+
+
+def get_hkx_game_module(data: bytes) -> types.ModuleType:
+    """Get Soulstruct-Havok game module (with `AnimationHKX` and `SkeletonHKX` classes) for uncompressed HKX `data`."""
+    packfile_version = data[0x28:0x38]
+    tagfile_version = data[0x10:0x18]
+    if packfile_version.startswith(b"hk_2010.2.0-r1"):  # PTDE
+        return darksouls1ptde
+    elif tagfile_version == b"20150100":  # DSR
+        return darksouls1r
+    elif packfile_version.startswith(b"hk_2014.1.0-r1"):  # BB
+        return bloodborne
+    elif tagfile_version == b"20180100":  # ER
+        return eldenring
+    raise ValueError(
+        f"Cannot support this HKX file version in Soulstruct and/or Blender.\n"
+        f"   Possible packfile version: {packfile_version}\n"
+        f"   Possible tagfile version: {tagfile_version}"
+    )
+
+
+def get_root_motion(animation_hkx: BaseAnimationHKX, swap_yz=True) -> np.ndarray | None:
+    try:
+        root_motion = animation_hkx.animation_container.get_reference_frame_samples()
+    except (ValueError, TypeError):
+        return None
+
+    if swap_yz:
+        # Swap Y and Z axes and negate rotation (now around Z axis). Array is read-only, so we construct a new one.
+        root_motion = np.c_[root_motion[:, 0], root_motion[:, 2], root_motion[:, 1], -root_motion[:, 3]]
+    return root_motion
+
+
+def get_armature_frames(
+    animation_hkx: BaseAnimationHKX, skeleton_hkx: BaseSkeletonHKX
+) -> list[dict[str, TRSTransform]]:
+    """Get a list of animation frame dictionaries, which each map bone names to armature-space transforms that frame."""
+
+    # Get track bone names.
+    track_bone_indices = animation_hkx.animation_container.animation_binding.transformTrackToBoneIndices
+    track_bone_names = [skeleton_hkx.skeleton.bones[i].name for i in track_bone_indices]
+
+    # Get frames as standard nested lists of transforms.
+    interleaved_frames = animation_hkx.animation_container.get_interleaved_data_in_armature_space(skeleton_hkx.skeleton)
+
+    # Convert to dictionary using given `track_bone_names` list.
+    arma_frame_dicts = [
+        {bone_name: transform for bone_name, transform in zip(track_bone_names, frame)}
+        for frame in interleaved_frames
+    ]
+    return arma_frame_dicts
+
+
+def get_transform_frames(
+    animation_hkx: BaseAnimationHKX,
+    skeleton_hkx: BaseSkeletonHKX,
+    bl_bone_names: tp.Container[str],
+) -> tuple[list[dict[str, TRSTransform]], np.ndarray | None]:
+    """Check animated bones, convert spline animation to interleaved, and return armature-space frames and root motion.
+
+    Raises `ValueError` if an animated bone is missing from `bl_bone_names`.
+    """
+    # We cannot rely on track annotations for bone names in later games (e.g. Elden Ring).
+    # Here, we just check that all animated bones are present in Blender Armature.
+    hk_bone_names = [b.name for b in skeleton_hkx.skeleton.bones]
+    track_bone_indices = animation_hkx.animation_container.animation_binding.transformTrackToBoneIndices
+    track_bone_names = [hk_bone_names[i] for i in track_bone_indices]
+
+    for bone_name in track_bone_names:
+        if bone_name not in bl_bone_names:
+            if bone_name == "TwistRoot":
+                raise ValueError(
+                    f"Animated bone name '{bone_name}' is missing from Armature. This problem is known for this "
+                    f"specific bone, which is absent from the FLVER, but has not yet been resolved in Soulstruct."
+                )
+            raise ValueError(f"Animated bone name '{bone_name}' is missing from Armature.")
+
+    animation_hkx.animation_container.spline_to_interleaved()
+    arma_frames = get_armature_frames(animation_hkx, skeleton_hkx)
+    root_motion = get_root_motion(animation_hkx)
+    return arma_frames, root_motion
+
+
+# Set once per worker process by `init_animation_worker()`, so they are not sent with every animation.
+_WORKER_SKELETON_HKX = None  # type: BaseSkeletonHKX | None
+_WORKER_COMPENDIUM = None  # type: HKX | None
+
+
+def init_animation_worker(skeleton_hkx: BaseSkeletonHKX, compendium: HKX | None):
+    """Pool initializer for `read_transform_frames()`."""
+    global _WORKER_SKELETON_HKX, _WORKER_COMPENDIUM
+    _WORKER_SKELETON_HKX = skeleton_hkx
+    _WORKER_COMPENDIUM = compendium
+
+
+def read_transform_frames(
+    entry: BinderEntry, bl_bone_names: tp.Container[str]
+) -> tuple[list[dict[str, TRSTransform]], np.ndarray | None]:
+    """Read, decompress, and convert animation HKX `entry` with the skeleton (and compendium) of this worker process.
+
+    Pool must be created with `initializer=init_animation_worker`.
+    """
+    data = entry.get_uncompressed_data()
+    animation_hkx = get_hkx_game_module(data).AnimationHKX.from_bytes(data, compendium=_WORKER_COMPENDIUM)
+    return get_transform_frames(animation_hkx, _WORKER_SKELETON_HKX, bl_bone_names)
@@ -0,0 +1,84 @@
+"""Benchmark of bulk ANIBND animation conversion (read -> spline to interleaved -> armature-space frames).
+
+Compares converting every animation entry of a real ANIBND serially, in a thread pool, and in the process pool used by
+`BaseImportHKXAnimation.import_queued_entries()`, and checks that all three give the same frames. Blender Action
+creation is not included, as it always runs on the main thread.
+
+Does not need Blender, only Soulstruct and Soulstruct-Havok, as it uses the `bpy`-free worker module directly:
+
+    python tests/_benchmark_anibnd_conversion.py path/to/c2240.anibnd.dcx
+"""
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "io_soulstruct/workers"))
+
+from soulstruct.containers import EntryNotFoundError
+from soulstruct.eldenring.containers import DivBinder
+from soulstruct_havok.core import HKX
+
+from io_soulstruct_workers import get_hkx_game_module, init_animation_worker, read_transform_frames
+
+
+def read_skeleton_compendium(anibnd: DivBinder):
+    try:
+        compendium = HKX.from_binder_entry(anibnd.find_entry_matching_name(r".*\.compendium"))
+    except EntryNotFoundError:
+        compendium = None
+    data = anibnd.find_entry_matching_name(r"skeleton\.hkx(\.dcx)?").get_uncompressed_data()
+    skeleton_hkx = get_hkx_game_module(data).SkeletonHKX.from_bytes(data, compendium=compendium)
+    return skeleton_hkx, compendium
+
+
+def assert_same_frames(expected, actual):
+    for (expected_frames, expected_root_motion), (frames, root_motion) in zip(expected, actual, strict=True):
+        assert len(expected_frames) == len(frames)
+        for expected_frame, frame in zip(expected_frames, frames):
+            assert expected_frame.keys() == frame.keys()
+            for bone_name, transform in frame.items():
+                expected_transform = expected_frame[bone_name]
+                np.testing.assert_allclose(transform.translation, expected_transform.translation)
+                np.testing.assert_allclose(transform.rotation, expected_transform.rotation)
+                np.testing.assert_allclose(transform.scale, expected_transform.scale)
+        if expected_root_motion is None:
+            assert root_motion is None
+        else:
+            np.testing.assert_allclose(root_motion, expected_root_motion)
+
+
+def main(anibnd_path: Path):
+    anibnd = DivBinder.from_path(anibnd_path)
+    skeleton_hkx, compendium = read_skeleton_compendium(anibnd)
+    bl_bone_names = {bone.name for bone in skeleton_hkx.skeleton.bones}
+    entries = anibnd.find_entries_matching_name(r"a.*\.hkx(\.dcx)?")
+    print(f"Benchmarking {len(entries)} animations from '{anibnd_path.name}'.")
+
+    init_animation_worker(skeleton_hkx, compendium)  # for serial and threads in this process
+
+    p = time.perf_counter()
+    serial = [read_transform_frames(entry, bl_bone_names) for entry in entries]
+    serial_time = time.perf_counter() - p
+
+    p = time.perf_counter()
+    with ThreadPoolExecutor() as executor:
+        threaded = list(executor.map(read_transform_frames, entries, [bl_bone_names] * len(entries)))
+    thread_time = time.perf_counter() - p
+
+    p = time.perf_counter()
+    with ProcessPoolExecutor(initializer=init_animation_worker, initargs=(skeleton_hkx, compendium)) as executor:
+        processed = list(executor.map(read_transform_frames, entries, [bl_bone_names] * len(entries)))
+    process_time = time.perf_counter() - p
+
+    assert_same_frames(serial, threaded)
+    assert_same_frames(serial, processed)
+    print(f"Serial:       {serial_time:.3f} s")
+    print(f"Thread pool:  {thread_time:.3f} s ({serial_time / thread_time:.1f}x)")
+    print(f"Process pool: {process_time:.3f} s ({serial_time / process_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(Path(sys.argv[1]))
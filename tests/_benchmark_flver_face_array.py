@@ -0,0 +1,79 @@
+"""Benchmark of FLVER export face array construction on a synthetic 500k-triangle mesh.
+
+Compares the old row-by-row builder (Python loop over `MeshPolygon.loop_indices` and `material_index`) with the
+`loop_start + arange(3)` gather of `BlenderFLVER.get_triangle_face_array()`, and checks that both give the same array.
+
+Must be run inside Blender, as both builders read `bpy` mesh data:
+
+    blender --background --factory-startup --python tests/_benchmark_flver_face_array.py
+"""
+import sys
+import time
+from pathlib import Path
+
+import bpy
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from io_soulstruct.flver.models.types import BlenderFLVER
+
+
+TRIANGLE_COUNT = 500_000
+MATERIAL_COUNT = 8
+
+
+def make_triangle_mesh(triangle_count: int) -> bpy.types.Mesh:
+    """Create a triangulated grid mesh with (at least) `triangle_count` faces and random material indices."""
+    side = int(np.ceil(np.sqrt(triangle_count / 2))) + 1
+    xs, ys = np.meshgrid(np.arange(side, dtype=np.float32), np.arange(side, dtype=np.float32))
+    vertices = np.column_stack([xs.ravel(), ys.ravel(), np.zeros(side * side, dtype=np.float32)])
+    corners = (np.arange(side - 1)[:, np.newaxis] * side + np.arange(side - 1)).ravel()  # bottom-left of each quad
+    faces = np.concatenate([
+        np.column_stack([corners, corners + 1, corners + side + 1]),
+        np.column_stack([corners, corners + side + 1, corners + side]),
+    ])[:triangle_count]
+
+    mesh = bpy.data.meshes.new("__BENCHMARK_FACES__")
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set("co", vertices.ravel())
+    mesh.loops.add(faces.size)
+    mesh.loops.foreach_set("vertex_index", faces.ravel().astype(np.int32))
+    mesh.polygons.add(len(faces))
+    mesh.polygons.foreach_set("loop_start", np.arange(0, faces.size, 3, dtype=np.int32))
+    mesh.update(calc_edges=True)
+    material_indices = np.random.default_rng(0).integers(0, MATERIAL_COUNT, len(faces), dtype=np.int32)
+    mesh.polygons.foreach_set("material_index", material_indices)
+    return mesh
+
+
+def old_face_array(tri_mesh_data: bpy.types.Mesh) -> np.ndarray:
+    """Original builder from `BlenderFLVER.to_soulstruct_obj()`."""
+    faces = np.empty((len(tri_mesh_data.polygons), 4), dtype=np.int32)
+    for i, face in enumerate(tri_mesh_data.polygons):
+        faces[i] = [*face.loop_indices, face.material_index]
+    return faces
+
+
+def main():
+    p = time.perf_counter()
+    mesh = make_triangle_mesh(TRIANGLE_COUNT)
+    print(f"Created mesh with {len(mesh.polygons)} triangles in {time.perf_counter() - p:.3f} s.")
+
+    p = time.perf_counter()
+    old_faces = old_face_array(mesh)
+    old_time = time.perf_counter() - p
+
+    p = time.perf_counter()
+    new_faces = BlenderFLVER.get_triangle_face_array(mesh)
+    new_time = time.perf_counter() - p
+
+    np.testing.assert_array_equal(old_faces, new_faces)
+    print(f"Old row-by-row builder: {old_time:.3f} s")
+    print(f"New gather builder:     {new_time:.3f} s ({old_time / new_time:.1f}x faster)")
+
+    bpy.data.meshes.remove(mesh)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark of loading converted TGA texture data into Blender Images for a map area's worth of synthetic textures.
+
+Compares the file round-trip path (`DDSTexture.new_from_image_data()` with no image cache directory, which writes a
+temporary TGA, loads it, packs it, and deletes it) with the in-memory pixel path used by `load_texture_images()`
+(`BlenderFLVER._try_tga_to_pixels()` in a thread pool, then `DDSTexture.new_from_image_pixels()`), and checks that both
+give the same pixels.
+
+Uses 500 textures, as imported for a typical map area, with a mix of sizes like those of map piece textures. All
+decoded pixels are held at once, as in `load_texture_images()`, so this needs several GB of memory.
+
+Must be run inside Blender:
+
+    blender --background --factory-startup --python tests/_benchmark_tga_pixels.py
+"""
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import bpy
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from io_soulstruct.flver.image.types import DDSTexture
+from io_soulstruct.flver.models.types import BlenderFLVER
+from io_soulstruct.general.enums import BlenderImageFormat
+
+
+TEXTURE_COUNT = 500
+TEXTURE_SIZES = (256, 512, 512, 1024)  # cycled over textures
+
+
+class _PrintOperator:
+    """Stands in for the `LoggingOperator` that `new_from_image_data()` logs to."""
+
+    @staticmethod
+    def info(msg: str):
+        print(msg)
+
+    @staticmethod
+    def warning(msg: str):
+        print(f"WARNING: {msg}")
+
+
+def make_tga_data(size: int, seed: int) -> bytes:
+    """Random uncompressed 32-bit TGA with top-left origin, as written by `texconv`."""
+    header = bytearray(18)
+    header[2] = 2  # uncompressed true-color
+    header[12:14] = size.to_bytes(2, "little")
+    header[14:16] = size.to_bytes(2, "little")
+    header[16] = 32
+    header[17] = 0x28  # top-left origin, 8 alpha bits
+    bgra = np.random.default_rng(seed).integers(0, 256, size * size * 4, dtype=np.uint8)
+    return bytes(header) + bgra.tobytes()
+
+
+def get_pixels(image: bpy.types.Image) -> np.ndarray:
+    pixels = np.empty(len(image.pixels), dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    return pixels
+
+
+def main():
+    all_tga_data = [make_tga_data(TEXTURE_SIZES[seed % len(TEXTURE_SIZES)], seed) for seed in range(TEXTURE_COUNT)]
+    print(f"Benchmarking {TEXTURE_COUNT} TGA textures with sizes {sorted(set(TEXTURE_SIZES))}.")
+
+    p = time.perf_counter()
+    file_textures = [
+        DDSTexture.new_from_image_data(
+            _PrintOperator(), f"file_{i}", BlenderImageFormat.TARGA, tga_data, pack_image_data=True
+        )
+        for i, tga_data in enumerate(all_tga_data)
+    ]
+    file_time = time.perf_counter() - p
+
+    p = time.perf_counter()
+    with ThreadPoolExecutor() as executor:
+        decoded = list(executor.map(BlenderFLVER._try_tga_to_pixels, all_tga_data))
+    pixel_textures = [
+        DDSTexture.new_from_image_pixels(f"pixels_{i}", BlenderImageFormat.TARGA, width, height, pixels)
+        for i, (width, height, pixels) in enumerate(decoded)
+    ]
+    pixel_time = time.perf_counter() - p
+
+    for file_texture, pixel_texture in zip(file_textures, pixel_textures):
+        np.testing.assert_allclose(get_pixels(file_texture.image), get_pixels(pixel_texture.image), atol=1e-6)
+
+    print(f"File round-trip path: {file_time:.3f} s")
+    print(f"In-memory pixel path: {pixel_time:.3f} s ({file_time / pixel_time:.1f}x faster)")
+
+    for texture in file_textures + pixel_textures:
+        bpy.data.images.remove(texture.image)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""Helper for tests of add-on modules that do not need `bpy`.
+
+Importing any `io_soulstruct` submodule normally runs the package `__init__`, which requires Blender. Modules that only
+need NumPy and/or Soulstruct at runtime can instead be loaded directly from their files with `load_addon_module()`.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+ADDON_ROOT = Path(__file__).parent.parent / "io_soulstruct"
+
+
+def load_addon_module(relative_path: str):
+    """Load add-on module at `relative_path` (e.g. 'utilities/maths.py') without importing the `io_soulstruct` package.
+
+    The module must not import `bpy` or other add-on modules at runtime (`TYPE_CHECKING` imports are fine).
+    """
+    module_name = "_io_soulstruct_" + relative_path.removesuffix(".py").replace("/", "_")
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, ADDON_ROOT / relative_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module  # needed by `dataclasses` etc. during execution
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,145 @@
+"""Tests for `io_soulstruct.utilities.maths` (including NumPy animation transform helpers), which only needs NumPy."""
+import numpy as np
+
+from addon_modules import load_addon_module
+
+maths = load_addon_module("utilities/maths.py")
+
+
+def _old_non_degenerate_face_mask(faces: np.ndarray) -> np.ndarray:
+    """Original row-by-row implementation."""
+    return np.apply_along_axis(lambda row: len(np.unique(row)) == 3, 1, faces)
+
+
+def test_non_degenerate_face_mask_matches_old_semantics():
+    rng = np.random.default_rng(0)
+    # Small index range so that plenty of random rows repeat an index.
+    faces = rng.integers(0, 6, size=(5000, 3), dtype=np.int32)
+    # Guarantee every case in every column arrangement: all equal, each pair equal, and all distinct.
+    faces[:4] = [[2, 2, 2], [1, 1, 3], [1, 3, 1], [3, 1, 1]]
+    faces[4:8] = [[0, 1, 2], [5, 4, 3], [9, 0, 5], [7, 7, 7]]
+
+    mask = maths.get_non_degenerate_face_mask(faces)
+
+    assert mask.dtype == bool
+    np.testing.assert_array_equal(mask, _old_non_degenerate_face_mask(faces))
+    assert mask.any() and not mask.all()
+    np.testing.assert_array_equal(mask[:8], [False, False, False, False, True, True, True, False])
+
+
+def test_non_degenerate_face_mask_empty():
+    faces = np.empty((0, 3), dtype=np.int32)
+    assert maths.get_non_degenerate_face_mask(faces).shape == (0,)
+
+
+def _random_unit_quaternions(rng: np.random.Generator, count: int) -> np.ndarray:
+    quats = rng.normal(size=(count, 4))
+    return quats / np.linalg.norm(quats, axis=-1, keepdims=True)
+
+
+def _axis_matrix(axis: str, angle: float) -> np.ndarray:
+    """Reference right-handed rotation matrix around a single axis."""
+    c, s = np.cos(angle), np.sin(angle)
+    if axis == "X":
+        return np.array([[1, 0, 0], [0, c, -s], [0, s, c]])
+    if axis == "Y":
+        return np.array([[c, 0, s], [0, 1, 0], [-s, 0, c]])
+    return np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]])
+
+
+def test_quaternion_to_matrix_arrays():
+    half = np.sqrt(0.5)
+    quats = np.array([[1.0, 0.0, 0.0, 0.0], [half, 0.0, 0.0, half]])  # identity, 90 degrees around Z
+    matrices = maths.quaternion_to_matrix_arrays(quats)
+    np.testing.assert_allclose(matrices[0], np.eye(3), atol=1e-12)
+    np.testing.assert_allclose(matrices[1], [[0, -1, 0], [1, 0, 0], [0, 0, 1]], atol=1e-12)
+
+    # Batch dimensions are preserved and all results are proper rotations.
+    quats = _random_unit_quaternions(np.random.default_rng(1), 24).reshape(4, 6, 4)
+    matrices = maths.quaternion_to_matrix_arrays(quats)
+    assert matrices.shape == (4, 6, 3, 3)
+    identities = np.broadcast_to(np.eye(3), (4, 6, 3, 3))
+    np.testing.assert_allclose(matrices @ np.swapaxes(matrices, -1, -2), identities, atol=1e-12)
+    np.testing.assert_allclose(np.linalg.det(matrices), 1.0)
+
+
+def test_euler_to_matrix_arrays_orders():
+    eulers = np.array([[0.3, -1.1, 2.0], [1.5, 0.2, -0.7]])
+    for order in ("XYZ", "XZY", "YXZ", "YZX", "ZXY", "ZYX"):
+        matrices = maths.euler_to_matrix_arrays(eulers, order)
+        for euler, matrix in zip(eulers, matrices):
+            # First axis in `order` is applied first, i.e. rightmost.
+            expected = np.eye(3)
+            for axis in order:
+                expected = _axis_matrix(axis, euler["XYZ".index(axis)]) @ expected
+            np.testing.assert_allclose(matrix, expected, atol=1e-12)
+
+    # Single-axis rotations match the equivalent quaternions.
+    angle = 0.8
+    for axis_index, axis in enumerate("XYZ"):
+        euler = np.zeros(3)
+        euler[axis_index] = angle
+        quat = np.zeros(4)
+        quat[0] = np.cos(angle / 2)
+        quat[axis_index + 1] = np.sin(angle / 2)
+        np.testing.assert_allclose(
+            maths.euler_to_matrix_arrays(euler, "XYZ"), maths.quaternion_to_matrix_arrays(quat), atol=1e-12
+        )
+
+
+def test_compose_matrix_arrays():
+    half = np.sqrt(0.5)
+    rotation = maths.quaternion_to_matrix_arrays(np.array([half, 0.0, 0.0, half]))
+    matrix = maths.compose_matrix_arrays(np.array([1.0, 2.0, 3.0]), rotation, np.array([2.0, 3.0, 4.0]))
+    np.testing.assert_allclose(matrix, [[0, -3, 0, 1], [2, 0, 0, 2], [0, 0, 4, 3], [0, 0, 0, 1]], atol=1e-12)
+
+
+def test_compose_decompose_round_trip():
+    rng = np.random.default_rng(2)
+    count = 200
+    locations = rng.uniform(-10.0, 10.0, size=(count, 3))
+    quats = _random_unit_quaternions(rng, count)
+    quats[quats[:, 0] < 0.0] *= -1.0  # decomposed quaternions have non-negative W
+    scales = rng.uniform(0.1, 3.0, size=(count, 3))
+    matrices = maths.compose_matrix_arrays(locations, maths.quaternion_to_matrix_arrays(quats), scales)
+
+    decomposed_locations, decomposed_quats, decomposed_scales = maths.decompose_matrix_arrays(matrices)
+    np.testing.assert_allclose(decomposed_locations, locations, atol=1e-9)
+    np.testing.assert_allclose(decomposed_quats, quats, atol=1e-9)
+    np.testing.assert_allclose(decomposed_scales, scales, atol=1e-9)
+
+
+def test_decompose_negative_determinant():
+    quats = _random_unit_quaternions(np.random.default_rng(3), 10)
+    scales = np.tile([-1.0, 2.0, 3.0], (10, 1))  # mirrored on X
+    matrices = maths.compose_matrix_arrays(np.zeros((10, 3)), maths.quaternion_to_matrix_arrays(quats), scales)
+
+    locations, decomposed_quats, decomposed_scales = maths.decompose_matrix_arrays(matrices)
+    # As in `Matrix.decompose()`, all scale components are negated and the rotation stays proper.
+    np.testing.assert_allclose(decomposed_scales, np.tile([-1.0, -2.0, -3.0], (10, 1)), atol=1e-9)
+    assert np.all(decomposed_quats[:, 0] >= 0.0)
+    recomposed = maths.compose_matrix_arrays(
+        locations, maths.quaternion_to_matrix_arrays(decomposed_quats), decomposed_scales
+    )
+    np.testing.assert_allclose(recomposed, matrices, atol=1e-9)
+
+
+def test_make_quaternions_continuous():
+    rng = np.random.default_rng(4)
+    # Two bones over frames that slowly rotate, with arbitrary sign flips (same rotations).
+    base = _random_unit_quaternions(rng, 2)
+    frames = np.stack([base + 0.01 * f for f in range(12)])
+    frames /= np.linalg.norm(frames, axis=-1, keepdims=True)
+    flips = rng.choice([-1.0, 1.0], size=(12, 2))
+    flips[0] = 1.0
+    quats = frames * flips[..., np.newaxis]
+
+    maths.make_quaternions_continuous(quats)  # in place
+    np.testing.assert_allclose(quats, frames, atol=1e-12)
+    assert np.all(np.einsum("fbi,fbi->fb", quats[:-1], quats[1:]) > 0.0)
+
+
+def test_make_quaternions_continuous_single_frame():
+    quats = np.array([[-1.0, 0.0, 0.0, 0.0]])
+    maths.make_quaternions_continuous(quats)
+    np.testing.assert_array_equal(quats, [[-1.0, 0.0, 0.0, 0.0]])
@@ -0,0 +1,102 @@
+"""Tests for `io_soulstruct.flver.image.texture_cache`, which only needs Soulstruct's JSON helpers at runtime."""
+import itertools
+from types import SimpleNamespace
+
+import pytest
+
+from addon_modules import load_addon_module
+
+texture_cache = load_addon_module("flver/image/texture_cache.py")
+enums = load_addon_module("general/enums.py")
+
+TextureContentCache = texture_cache.TextureContentCache
+BlenderImageFormat = enums.BlenderImageFormat
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Strictly increasing `time.time()` so that access order is unambiguous."""
+    ticks = itertools.count(1000)
+    monkeypatch.setattr(texture_cache.time, "time", lambda: float(next(ticks)))
+
+
+def _cache(tmp_path, max_size=1 << 20, image_format=BlenderImageFormat.PNG, platform=None) -> TextureContentCache:
+    return TextureContentCache(tmp_path / TextureContentCache.DIRECTORY_NAME, image_format, platform, max_size)
+
+
+def _texture(data: bytes, texture_format=1):
+    """Stands in for a `TPFTexture`, of which only `format` and `data` are hashed."""
+    return SimpleNamespace(format=texture_format, data=data)
+
+
+def test_key_depends_on_content_only(tmp_path):
+    cache = _cache(tmp_path)
+    key = cache.get_key(_texture(b"DDS a"))
+    assert key == cache.get_key(_texture(b"DDS a"))
+    assert key == _cache(tmp_path / "other").get_key(_texture(b"DDS a"))
+    assert key != cache.get_key(_texture(b"DDS b"))
+    assert key != cache.get_key(_texture(b"DDS a", texture_format=5))
+    assert key != _cache(tmp_path, image_format=BlenderImageFormat.TARGA).get_key(_texture(b"DDS a"))
+    assert key != _cache(tmp_path, platform="PS3").get_key(_texture(b"DDS a"))
+
+
+def test_add_and_get(tmp_path, clock):
+    cache = _cache(tmp_path)
+    key = cache.get_key(_texture(b"DDS a"))
+    assert cache.get_cached_image_path(key) is None
+
+    path = cache.add_image_data(key, "m10_wall", b"png bytes")
+    assert path == cache.get_path(key)
+    assert path.name == f"{key}.png"
+    assert cache.get_cached_image_path(key) == path
+    assert path.read_bytes() == b"png bytes"
+    assert cache.total_size == len(b"png bytes")
+
+
+def test_externally_deleted_image_is_forgotten(tmp_path, clock):
+    cache = _cache(tmp_path)
+    path = cache.add_image_data("abc", "m10_wall", b"png bytes")
+    path.unlink()
+    assert cache.get_cached_image_path("abc") is None
+    assert cache.total_size == 0
+
+
+def test_index_persists(tmp_path, clock):
+    cache = _cache(tmp_path)
+    path = cache.add_image_data("abc", "m10_wall", b"png bytes")
+    assert not cache.index_path.exists()
+    cache.save()
+    assert cache.index_path.is_file()
+
+    reloaded = _cache(tmp_path)
+    assert reloaded.get_cached_image_path("abc") == path
+    assert reloaded.total_size == len(b"png bytes")
+
+
+def test_save_evicts_least_recently_used(tmp_path, clock):
+    cache = _cache(tmp_path, max_size=25)
+    paths = {key: cache.add_image_data(key, key, b"x" * 10) for key in ("a", "b", "c")}
+    cache.get_cached_image_path("a")  # now "b" is the least recently used
+    assert cache.total_size == 30
+
+    cache.save()
+    assert cache.total_size == 20
+    assert cache.get_cached_image_path("b") is None
+    assert not paths["b"].exists()
+    assert cache.get_cached_image_path("a") == paths["a"]
+    assert cache.get_cached_image_path("c") == paths["c"]
+
+    # Eviction is persisted.
+    assert _cache(tmp_path, max_size=25).get_cached_image_path("b") is None
+
+
+def test_corrupt_index_starts_fresh(tmp_path, clock):
+    cache = _cache(tmp_path)
+    cache.directory.mkdir(parents=True)
+    cache.index_path.write_text("{not json")
+
+    cache = _cache(tmp_path)
+    assert cache.total_size == 0
+    cache.add_image_data("abc", "m10_wall", b"png bytes")
+    cache.save()
+    assert _cache(tmp_path).get_cached_image_path("abc") is not None